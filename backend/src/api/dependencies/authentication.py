@@ -0,0 +1,62 @@
+import secrets
+
+import fastapi
+import fastapi.security
+
+from src.config.manager import settings
+from src.models.schemas.jwt import JWTAccount
+from src.repository.revocations import token_revocations
+from src.securities.authorizations.jwt import jwt_generator
+from src.securities.authorizations.token_cache import hash_token, verified_token_cache
+from src.utilities.exceptions.http.exc_401 import http_exc_401_access_token_request
+from src.utilities.exceptions.http.exc_403 import http_403_exc_forbidden_request
+
+authorization_header = fastapi.security.APIKeyHeader(name="Authorization", auto_error=False)
+api_token_header = fastapi.security.APIKeyHeader(name="X-API-Token", auto_error=False)
+
+
+async def get_access_token(authorization: str | None = fastapi.Security(authorization_header)) -> str:
+    """
+    Read the token from an `Authorization: <JWT_TOKEN_PREFIX> <token>` header.
+    """
+    prefix, _, token = (authorization or "").partition(" ")
+
+    if prefix.lower() != settings.JWT_TOKEN_PREFIX.lower() or not token:
+        raise await http_exc_401_access_token_request()
+
+    return token
+
+
+async def get_current_account(token: str = fastapi.Depends(get_access_token)) -> JWTAccount:
+    """
+    Authenticate a request by its access token. A token that was verified before is answered from
+    `verified_token_cache`, so only its first request pays for the signature check and the payload validation.
+    """
+    digest = hash_token(token=token)
+    await token_revocations.synchronize()
+
+    if verified_token_cache.is_revoked(digest=digest):
+        raise await http_exc_401_access_token_request()
+
+    jwt_account = verified_token_cache.get(digest=digest)
+
+    if jwt_account is None:
+        try:
+            jwt_account, expires_at = jwt_generator.retrieve_account_from_token(
+                token=token, secret_key=settings.JWT_SECRET_KEY
+            )
+
+        except ValueError:
+            raise await http_exc_401_access_token_request()
+
+        verified_token_cache.set(digest=digest, jwt_account=jwt_account, expires_at=expires_at)
+
+    return jwt_account
+
+
+async def verify_api_token(api_token: str | None = fastapi.Security(api_token_header)) -> None:
+    """
+    Admin routes are reserved to callers holding the `API_TOKEN`.
+    """
+    if not api_token or not secrets.compare_digest(api_token.encode(), settings.API_TOKEN.encode()):
+        raise await http_403_exc_forbidden_request()
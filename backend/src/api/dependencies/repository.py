@@ -6,16 +6,22 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession as SQLAlchemyAsyncSession,
 )
 
-from src.api.dependencies.session import get_async_session
+from src.api.dependencies.session import get_unit_of_work
 from src.repository.crud.base import BaseCRUDRepository
+from src.repository.unit_of_work import UnitOfWork
 
 
 def get_repository(
     repo_type: typing.Type[BaseCRUDRepository],
-) -> typing.Callable[[SQLAlchemyAsyncSession], BaseCRUDRepository]:
+) -> typing.Callable[[UnitOfWork], BaseCRUDRepository]:
+    """
+    Every repository of a request shares its unit of work, which ends before the response is sent, so a client never
+    sees a write that could still fail to commit.
+    """
+
     def _get_repo(
-        async_session: SQLAlchemyAsyncSession = fastapi.Depends(get_async_session),
+        unit_of_work: UnitOfWork = fastapi.Depends(get_unit_of_work, scope="function"),
     ) -> BaseCRUDRepository:
-        return repo_type(async_session=async_session)
+        return repo_type(async_session=unit_of_work.async_session)
 
     return _get_repo
@@ -1,21 +1,30 @@
-import contextlib
 import typing
 
 import fastapi
-from sqlalchemy.ext.asyncio import (
-    async_sessionmaker as sqlalchemy_async_sessionmaker,
-    AsyncSession as SQLAlchemyAsyncSession,
-    AsyncSessionTransaction as SQLAlchemyAsyncSessionTransaction,
-)
 
 from src.repository.database import async_db
+from src.repository.unit_of_work import UnitOfWork
 
+READ_ONLY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_unit_of_work(request: fastapi.Request) -> typing.AsyncGenerator[UnitOfWork, None]:
+    """
+    Commit once after the route has returned, or roll back if it raised. Reads run in a read-only transaction.
+    """
+    is_read_only = request.method in READ_ONLY_METHODS
+    async_session = async_db.async_session_factory(
+        bind=async_db.read_only_async_engine if is_read_only else async_db.async_engine
+    )
+    unit_of_work = UnitOfWork(async_session=async_session, is_read_only=is_read_only)
 
-async def get_async_session() -> typing.AsyncGenerator[SQLAlchemyAsyncSession, None]:
     try:
-        yield async_db.async_session
-    except Exception as e:
-        print(e)
-        await async_db.async_session.rollback()
+        yield unit_of_work
+        await unit_of_work.commit()
+
+    except Exception:
+        await unit_of_work.rollback()
+        raise
+
     finally:
-        await async_db.async_session.close()
+        await async_session.close()
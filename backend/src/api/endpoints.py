@@ -3,11 +3,17 @@ import fastapi
 from src.api.routes.account import router as account_router
 from src.api.routes.authentication import router as auth_router
 from src.api.routes.author import router as author_router
+from src.api.routes.batch import router as batch_router
 from src.api.routes.book import router as book_router
+from src.api.routes.event import router as event_router
+from src.api.routes.job import router as job_router
 
 router = fastapi.APIRouter()
 
 router.include_router(router=account_router)
 router.include_router(router=auth_router)
 router.include_router(router=author_router)
+router.include_router(router=batch_router)
 router.include_router(router=book_router)
+router.include_router(router=event_router)
+router.include_router(router=job_router)
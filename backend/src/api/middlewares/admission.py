@@ -0,0 +1,168 @@
+import time
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.manager import settings
+from src.utilities.exceptions.http.exc_503 import http_503_exc_overloaded_request
+from src.utilities.http.batch import SUB_REQUEST_SCOPE_KEY
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    A gradient concurrency limit in the style of Netflix's `concurrency-limits`. A short-term latency average is
+    compared with a slowly moving long-term one. While they agree the limit grows by `queue_size`. Once the short-term
+    latency climbs above `tolerance` times the long-term one, requests are queueing somewhere (usually for a pooled
+    connection), so the limit shrinks in proportion. A 503/504 response is treated as a hard overload signal and cuts
+    the limit by `backoff_ratio`, like AIMD.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        queue_size: int = 4,
+        long_window: int = 600,
+        backoff_ratio: float = 0.9,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.queue_size = queue_size
+        self.long_window = long_window
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self.short_latency: float | None = None
+        self.long_latency: float | None = None
+
+    def try_acquire(self, share: float = 1.0) -> bool:
+        """
+        Admit a request while fewer than `share` of the limit are in flight. Lower priority classes get a smaller
+        share, so they are shed first.
+        """
+        if self.in_flight >= max(1, int(self.limit * share)):
+            return False
+
+        self.in_flight += 1
+        return True
+
+    def release(self, latency: float, is_overloaded: bool = False) -> None:
+        self.in_flight -= 1
+
+        if is_overloaded:
+            self._set_limit(self.limit * self.backoff_ratio)
+            return
+
+        if self.short_latency is None or self.long_latency is None:
+            self.short_latency = self.long_latency = latency
+            return
+
+        self.short_latency += (latency - self.short_latency) * self.smoothing
+        self.long_latency += (self.short_latency - self.long_latency) / self.long_window
+
+        # Let the baseline follow a lasting drop in latency (e.g. a warmed-up cache) instead of waiting a whole window.
+        if self.long_latency > 2 * self.short_latency:
+            self.long_latency *= 0.95
+
+        # A limit that is not even half used tells nothing about the capacity, so it must not keep growing.
+        if self.in_flight < self.limit / 2:
+            return
+
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_latency / self.short_latency))
+        self._set_limit(self.limit * (1 - self.smoothing) + (self.limit * gradient + self.queue_size) * self.smoothing)
+
+    def _set_limit(self, limit: float) -> None:
+        self.limit = max(float(self.min_limit), min(float(self.max_limit), limit))
+
+
+class AdmissionControlMiddleware:
+    """
+    Shed requests with a `503 Retry-After` before they touch the database or the CPU once `limit` is reached, instead
+    of letting them queue inside the event loop. Routes listed in `route_priorities` (e.g. the password hashing under
+    `/auth/signin`) get their own priority class, other requests count as `read` or `write` by method. Long-lived
+    streams under `exempt_routes` and the sub-requests of a batch, which run in the batch's slot, are never counted.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limit: AdaptiveConcurrencyLimit,
+        priority_shares: dict[str, float],
+        route_priorities: dict[str, str],
+        exempt_routes: list[str],
+        retry_after: int,
+    ):
+        self.app = app
+        self.limit = limit
+        self.priority_shares = priority_shares
+        self.route_priorities = route_priorities
+        self.exempt_routes = exempt_routes
+        self.retry_after = retry_after
+        self.shed_counts: dict[str, int] = {priority: 0 for priority in priority_shares}
+
+    def get_priority(self, method: str, path: str) -> str:
+        matched_prefixes = [
+            route_prefix
+            for route_prefix in self.route_priorities
+            if path == route_prefix or path.startswith(f"{route_prefix}/")
+        ]
+
+        if matched_prefixes:
+            return self.route_priorities[max(matched_prefixes, key=len)]
+        return "read" if method in ("GET", "HEAD") else "write"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope.get(SUB_REQUEST_SCOPE_KEY)
+            or any(scope["path"] == route or scope["path"].startswith(f"{route}/") for route in self.exempt_routes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        priority = self.get_priority(method=scope["method"], path=scope["path"])
+
+        if not self.limit.try_acquire(share=self.priority_shares.get(priority, 1.0)):
+            self.shed_counts[priority] = self.shed_counts.get(priority, 0) + 1
+            overloaded_exception = await http_503_exc_overloaded_request(retry_after=self.retry_after)
+            response = JSONResponse(
+                content={"detail": overloaded_exception.detail},  # type: ignore
+                status_code=overloaded_exception.status_code,  # type: ignore
+                headers=overloaded_exception.headers,  # type: ignore
+            )
+            await response(scope, receive, send)
+            return
+
+        response_status = 500
+
+        async def send_tracked(message: Message) -> None:
+            nonlocal response_status
+
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+
+            await send(message)
+
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_tracked)
+
+        finally:
+            self.limit.release(latency=time.perf_counter() - started, is_overloaded=response_status in (503, 504))
+
+
+def get_adaptive_concurrency_limit() -> AdaptiveConcurrencyLimit:
+    return AdaptiveConcurrencyLimit(
+        initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+        min_limit=settings.ADMISSION_MIN_LIMIT,
+        max_limit=settings.ADMISSION_MAX_LIMIT,
+    )
+
+
+adaptive_concurrency_limit: AdaptiveConcurrencyLimit = get_adaptive_concurrency_limit()
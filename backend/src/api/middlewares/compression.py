@@ -0,0 +1,224 @@
+import importlib
+import types
+import typing
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.manager import settings
+
+
+def import_optional_module(name: str) -> types.ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover
+        return None
+
+
+brotli: types.ModuleType | None = import_optional_module("brotli")
+zstandard: types.ModuleType | None = import_optional_module("zstandard")
+
+
+class ContentEncoder:
+    """
+    An incremental encoder for one response. Every non-final chunk is flushed, so a streamed body (e.g. Server-Sent
+    Events) reaches the client chunk by chunk instead of waiting in the compressor's window.
+    """
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        self._compressor: typing.Any
+        # The flush modes of a non-final and of the final chunk, for the zlib-like compressors.
+        self._flush_modes: tuple[int, int] = (zlib.Z_SYNC_FLUSH, zlib.Z_FINISH)
+
+        if encoding == "zstd" and zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self._flush_modes = (zstandard.COMPRESSOBJ_FLUSH_BLOCK, zstandard.COMPRESSOBJ_FLUSH_FINISH)
+        elif encoding == "br" and brotli is not None:
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def encode(self, chunk: bytes, is_final: bool) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + (
+                self._compressor.finish() if is_final else self._compressor.flush()
+            )
+
+        return self._compressor.compress(chunk) + self._compressor.flush(self._flush_modes[1 if is_final else 0])
+
+
+def vary_on_accept_encoding(response_start: Message) -> None:
+    """
+    Every final response of a route varies on `Accept-Encoding`, including the ones sent uncompressed, so a shared
+    cache never hands an uncompressed copy to a client that negotiated an encoding, or the other way round.
+    """
+    if response_start["status"] < 200:
+        return
+
+    response_headers = MutableHeaders(scope=response_start)
+    vary = {value.strip().lower() for value in response_headers.get("vary", "").split(",")}
+
+    if "accept-encoding" not in vary and "*" not in vary:
+        response_headers.add_vary_header("Accept-Encoding")
+
+
+def get_available_content_encodings() -> list[str]:
+    """
+    The supported encodings in server preference order, skipping the ones whose optional package is not installed.
+    """
+    return [
+        encoding
+        for encoding, is_available in (("zstd", zstandard is not None), ("br", brotli is not None), ("gzip", True))
+        if is_available
+    ]
+
+
+def negotiate_content_encoding(accept_encoding: str, available_encodings: list[str]) -> str | None:
+    qualities: dict[str, float] = dict()
+
+    for accepted in accept_encoding.split(","):
+        coding, _, parameters = accepted.partition(";")
+        quality = 1.0
+
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.strip().partition("=")
+
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        if coding.strip():
+            qualities[coding.strip().lower()] = quality
+
+    wildcard_quality = qualities.get("*", 0.0)
+    ranked_encodings = sorted(
+        available_encodings,
+        key=lambda encoding: (qualities.get(encoding, wildcard_quality), -available_encodings.index(encoding)),
+        reverse=True,
+    )
+
+    if ranked_encodings and qualities.get(ranked_encodings[0], wildcard_quality) > 0:
+        return ranked_encodings[0]
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts. Responses below `minimum_size` are sent as they
+    are, unless they are streamed, and responses that already carry a `Content-Encoding` are never touched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        levels: dict[str, int],
+        route_levels: dict[str, dict[str, int]],
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = levels
+        self.route_levels = route_levels
+        self.available_encodings = get_available_content_encodings()
+
+    def get_level(self, path: str, encoding: str) -> int:
+        matched_prefixes = [
+            route_prefix
+            for route_prefix in self.route_levels
+            if (path == route_prefix or path.startswith(f"{route_prefix}/"))
+            and encoding in self.route_levels[route_prefix]
+        ]
+
+        if matched_prefixes:
+            return self.route_levels[max(matched_prefixes, key=len)][encoding]
+        return self.levels[encoding]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_content_encoding(
+            accept_encoding=Headers(scope=scope).get("accept-encoding", ""),
+            available_encodings=self.available_encodings,
+        )
+
+        if encoding is None:
+
+            async def send_uncompressed(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    vary_on_accept_encoding(response_start=message)
+
+                await send(message)
+
+            await self.app(scope, receive, send_uncompressed)
+            return
+
+        level = self.get_level(path=scope["path"], encoding=encoding)
+        response_start: Message = dict()
+        content_encoder: ContentEncoder | None = None
+        is_passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal content_encoder, is_passthrough
+
+            if message["type"] == "http.response.start":
+                vary_on_accept_encoding(response_start=message)
+                response_start.update(message)
+                response_headers = Headers(raw=message.get("headers", []))
+                # Event streams send tiny chunks that must reach the client right away.
+                is_passthrough = (
+                    message["status"] < 200
+                    or message["status"] in (204, 304)
+                    or "content-encoding" in response_headers
+                    or response_headers.get("content-type", "").startswith("text/event-stream")
+                )
+
+                if is_passthrough:
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body" or is_passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if content_encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    is_passthrough = True
+                    await send(response_start)
+                    await send(message)
+                    return
+
+                content_encoder = ContentEncoder(encoding=encoding, level=level)
+                encoded_body = content_encoder.encode(chunk=body, is_final=not more_body)
+                response_headers = MutableHeaders(raw=response_start["headers"])
+                response_headers["Content-Encoding"] = encoding
+
+                if "etag" in response_headers and not response_headers["etag"].startswith("W/"):
+                    response_headers["ETag"] = f"W/{response_headers['etag']}"
+
+                if more_body:
+                    del response_headers["Content-Length"]
+                else:
+                    response_headers["Content-Length"] = str(len(encoded_body))
+
+                await send(response_start)
+                await send({"type": "http.response.body", "body": encoded_body, "more_body": more_body})
+                return
+
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": content_encoder.encode(chunk=body, is_final=not more_body),
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import loguru
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utilities.exceptions.http.exc_504 import http_504_exc_deadline_exceeded_request
+from src.utilities.http.deadline import request_deadline
+
+
+class DeadlineMiddleware:
+    """
+    Give every request `timeout` seconds. The deadline is published through `request_deadline`, so the repository layer
+    can shorten `statement_timeout` as it approaches. A request that runs out of time is cancelled and answered with a
+    504, which releases its connection instead of letting it pile up behind a slow query. Long-lived streams under
+    `exempt_routes` are never cut off.
+    """
+
+    def __init__(self, app: ASGIApp, timeout: float, exempt_routes: list[str]):
+        self.app = app
+        self.timeout = timeout
+        self.exempt_routes = exempt_routes
+
+    def is_exempt(self, path: str) -> bool:
+        return any(path == route or path.startswith(f"{route}/") for route in self.exempt_routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.timeout <= 0 or self.is_exempt(path=scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        is_response_started = False
+
+        async def send_tracked(message: Message) -> None:
+            nonlocal is_response_started
+
+            if message["type"] == "http.response.start":
+                is_response_started = True
+
+            await send(message)
+
+        deadline_token = request_deadline.set(time.monotonic() + self.timeout)
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                await self.app(scope, receive, send_tracked)
+
+        except TimeoutError:
+            loguru.logger.warning(f"Request Deadline --- {scope['method']} {scope['path']} exceeded its deadline")
+
+            # The status line is already out, so all that is left is to abort the response.
+            if is_response_started:
+                raise
+
+            deadline_exception = await http_504_exc_deadline_exceeded_request()
+            response = JSONResponse(
+                content={"detail": deadline_exception.detail},  # type: ignore
+                status_code=deadline_exception.status_code,  # type: ignore
+            )
+            await response(scope, receive, send)
+
+        finally:
+            request_deadline.reset(deadline_token)
@@ -0,0 +1,288 @@
+import collections
+import email.utils
+import gzip
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.manager import settings
+from src.repository.shared_cache import shared_cache, SharedMemoryCache
+from src.utilities.http.conditional import is_etag_matched, is_modified_since
+
+WRITE_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class CachedResponse:
+    def __init__(self, headers: list[tuple[bytes, bytes]], body: bytes, gzip_body: bytes | None, expires_at: float):
+        self.headers = headers
+        self.body = body
+        self.gzip_body = gzip_body
+        self.expires_at = expires_at
+        self.etag: str | None = Headers(raw=headers).get("etag")
+        self.last_modified: str | None = Headers(raw=headers).get("last-modified")
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzip_body or b"") + sum(len(key) + len(value) for key, value in self.headers)
+
+
+# The tag, the generation of the tag the response was rendered at, and the response.
+CacheEntry = tuple[str, int, CachedResponse]
+
+
+class ResponseCache:
+    """
+    A byte-bounded LRU of fully serialized responses. Every entry belongs to a resource tag, and every tag has a
+    generation counter, so a response rendered before a write can never be stored after that write invalidated the tag.
+
+    The entries belong to one worker process. With `shared_generations`, the tag generations live in the header of the
+    cross-process `SharedMemoryCache` instead, and an entry is only served while its tag is still at the generation it
+    was stored with, so a write in any worker invalidates the responses of all of them.
+    """
+
+    def __init__(self, max_bytes: int, shared_generations: SharedMemoryCache | None = None):
+        self.max_bytes = max_bytes
+        self.shared_generations = shared_generations
+        self.size = 0
+        self._entries: collections.OrderedDict[tuple[str, ...], CacheEntry] = collections.OrderedDict()
+        self._tag_keys: collections.defaultdict[str, set[tuple[str, ...]]] = collections.defaultdict(set)
+        self._tag_generations: collections.Counter[str] = collections.Counter()
+
+    def get(self, key: tuple[str, ...]) -> CachedResponse | None:
+        item = self._entries.get(key)
+
+        if not item:
+            return None
+
+        if item[2].expires_at <= time.monotonic() or item[1] != self.generation(tag=item[0]):
+            self._remove(key=key)
+            return None
+
+        self._entries.move_to_end(key)
+        return item[2]
+
+    def set(self, key: tuple[str, ...], tag: str, generation: int, cached_response: CachedResponse) -> bool:
+        if generation != self.generation(tag=tag) or cached_response.size > self.max_bytes:
+            return False
+
+        self._remove(key=key)
+        self._entries[key] = (tag, generation, cached_response)
+        self._tag_keys[tag].add(key)
+        self.size += cached_response.size
+
+        while self.size > self.max_bytes:
+            self._remove(key=next(iter(self._entries)))
+
+        return True
+
+    def generation(self, tag: str) -> int:
+        if self.shared_generations is not None:
+            return self.shared_generations.generation(tag=f"responses:{tag}")
+        return self._tag_generations[tag]
+
+    def invalidate(self, tag: str) -> None:
+        if self.shared_generations is not None:
+            self.shared_generations.invalidate(tag=f"responses:{tag}")
+        else:
+            self._tag_generations[tag] += 1
+
+        for key in self._tag_keys.pop(tag, set()):
+            self._remove(key=key)
+
+    def clear(self) -> None:
+        for tag in list(self._tag_keys):
+            self.invalidate(tag=tag)
+
+    def _remove(self, key: tuple[str, ...]) -> None:
+        item = self._entries.pop(key, None)
+
+        if item:
+            self._tag_keys[item[0]].discard(key)
+            self.size -= item[2].size
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve repeated `GET`s of tagged routes from `ResponseCache` and drop a tag's entries around every write to it.
+
+    Only plain `200` responses of anonymous requests are stored. Requests with an `Authorization` header or a
+    `Cache-Control: no-cache` header always go through to the route, and so do the `excluded_routes` under a tag (the
+    cursor-driven delta feeds).
+    """
+
+    def __init__(self, app: ASGIApp, route_tags: dict[str, str], cache: ResponseCache, excluded_routes: list[str]):
+        self.app = app
+        self.route_tags = route_tags
+        self.cache = cache
+        self.excluded_routes = excluded_routes
+
+    def match_tag(self, path: str) -> str | None:
+        if any(path == route or path.startswith(f"{route}/") for route in self.excluded_routes):
+            return None
+
+        for route_prefix, tag in self.route_tags.items():
+            if path == route_prefix or path.startswith(f"{route_prefix}/"):
+                return tag
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        tag = self.match_tag(path=scope["path"]) if scope["type"] == "http" else None
+
+        if tag is None:
+            await self.app(scope, receive, send)
+
+        elif scope["method"] in WRITE_METHODS:
+            self.cache.invalidate(tag=tag)
+            await self.app(scope, receive, send)
+            self.cache.invalidate(tag=tag)
+
+        elif scope["method"] == "GET":
+            await self.serve_cacheable(scope=scope, receive=receive, send=send, tag=tag)
+
+        else:
+            await self.app(scope, receive, send)
+
+    async def serve_cacheable(self, scope: Scope, receive: Receive, send: Send, tag: str) -> None:
+        request_headers = Headers(scope=scope)
+
+        if "authorization" in request_headers or "no-cache" in request_headers.get("cache-control", ""):
+            await self.app(scope, receive, send)
+            return
+
+        # The `Link` pagination headers hold absolute URLs, so entries are not shared between hosts or schemes.
+        key = (
+            scope.get("scheme", "http"),
+            request_headers.get("host", ""),
+            scope["path"],
+            "&".join(sorted(scope["query_string"].decode("latin-1").split("&"))),
+            request_headers.get("accept", "*/*"),
+        )
+        cached_response = self.cache.get(key=key)
+
+        if cached_response:
+            await self.send_cached_response(
+                cached_response=cached_response, request_headers=request_headers, send=send
+            )
+            return
+
+        generation = self.cache.generation(tag=tag)
+        response_start: Message = dict()
+        body_chunks: list[bytes] = list()
+
+        async def send_and_capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers["Cache-Control"] = cache_control_header()
+                response_headers["X-Response-Cache"] = "miss"
+                response_headers.add_vary_header("Accept")
+                # Copied after the headers were set, so hits carry the same `Cache-Control` and `Vary`.
+                response_start.update(message)
+
+            elif message["type"] == "http.response.body":
+                body_chunks.append(message.get("body", b""))
+
+                if not message.get("more_body", False) and is_storable(response_start=response_start):
+                    body = b"".join(body_chunks)
+                    self.cache.set(
+                        key=key,
+                        tag=tag,
+                        generation=generation,
+                        cached_response=CachedResponse(
+                            headers=list(response_start["headers"]),
+                            body=body,
+                            gzip_body=precompress(body=body),
+                            expires_at=time.monotonic() + settings.RESPONSE_CACHE_TTL,
+                        ),
+                    )
+
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
+
+    async def send_cached_response(
+        self, cached_response: CachedResponse, request_headers: Headers, send: Send
+    ) -> None:
+        if is_cached_response_not_modified(cached_response=cached_response, request_headers=request_headers):
+            not_modified_headers = MutableHeaders()
+            for validator_name, validator in (
+                ("ETag", cached_response.etag),
+                ("Last-Modified", cached_response.last_modified),
+            ):
+                if validator:
+                    not_modified_headers[validator_name] = validator
+
+            not_modified_headers["Cache-Control"] = cache_control_header()
+            not_modified_headers["X-Response-Cache"] = "hit"
+            await send({"type": "http.response.start", "status": 304, "headers": not_modified_headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        response_headers = MutableHeaders(raw=list(cached_response.headers))
+        response_headers["X-Response-Cache"] = "hit"
+        body = cached_response.body
+
+        if cached_response.gzip_body is not None:
+            response_headers.add_vary_header("Accept-Encoding")
+
+            if "gzip" in request_headers.get("accept-encoding", ""):
+                body = cached_response.gzip_body
+                response_headers["Content-Encoding"] = "gzip"
+                response_headers["Content-Length"] = str(len(body))
+
+        await send({"type": "http.response.start", "status": 200, "headers": response_headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+
+def is_cached_response_not_modified(cached_response: CachedResponse, request_headers: Headers) -> bool:
+    """
+    The same precedence as `is_request_not_modified`, evaluated against the validators stored with the entry.
+    """
+    if_none_match = request_headers.get("if-none-match")
+
+    if if_none_match is not None:
+        return bool(cached_response.etag) and is_etag_matched(if_none_match=if_none_match, etag=cached_response.etag)  # type: ignore
+
+    if_modified_since = request_headers.get("if-modified-since")
+
+    if if_modified_since is not None and cached_response.last_modified:
+        return not is_modified_since(
+            if_modified_since=if_modified_since,
+            last_modified=email.utils.parsedate_to_datetime(cached_response.last_modified),
+        )
+
+    return False
+
+
+def cache_control_header() -> str:
+    """
+    With `RESPONSE_CACHE_MAX_AGE=0` clients must revalidate every time, which the `ETag` makes cheap.
+    """
+    if settings.RESPONSE_CACHE_MAX_AGE > 0:
+        return f"public, max-age={settings.RESPONSE_CACHE_MAX_AGE}"
+    return "public, no-cache"
+
+
+def is_storable(response_start: Message) -> bool:
+    response_headers = Headers(raw=response_start.get("headers", []))
+    return (
+        response_start.get("status") == 200
+        and "set-cookie" not in response_headers
+        and "content-encoding" not in response_headers
+    )
+
+
+def precompress(body: bytes) -> bytes | None:
+    if not settings.IS_RESPONSE_CACHE_PRECOMPRESSED or len(body) < settings.RESPONSE_CACHE_PRECOMPRESS_MIN_SIZE:
+        return None
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def get_response_cache() -> ResponseCache:
+    return ResponseCache(
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+        shared_generations=shared_cache if settings.IS_SHARED_CACHE_ENABLED else None,
+    )
+
+
+response_cache: ResponseCache = get_response_cache()
@@ -1,16 +1,32 @@
 import fastapi
 import pydantic
 
+from src.api.dependencies.authentication import verify_api_token
 from src.api.dependencies.repository import get_repository
-from src.models.schemas.account import AccountInResponse, AccountInUpdate, AccountWithToken
+from src.config.manager import settings
+from src.models.schemas.account import (
+    AccountChangesInResponse,
+    AccountInResponse,
+    AccountInUpdate,
+    AccountsInBulkCreate,
+    AccountsInBulkResponse,
+    AccountWithToken,
+)
+from src.repository.changes import decode_watermark, encode_watermark
+from src.repository.count import CountMethod
 from src.repository.crud.account import AccountCRUDRepository
-from src.securities.authorizations.jwt import jwt_generator
-from src.utilities.exceptions.database import EntityDoesNotExist
+from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist, InvalidQueryExpression
+from src.utilities.exceptions.http.exc_400 import (
+    http_400_exc_bad_query_request,
+    http_exc_400_credentials_bad_update_request,
+)
 from src.utilities.exceptions.http.exc_404 import (
     http_404_exc_email_not_found_request,
     http_404_exc_id_not_found_request,
     http_404_exc_username_not_found_request,
 )
+from src.utilities.http.conditional import evaluate_conditional_request
+from src.utilities.http.pagination import set_pagination_headers, split_page
 
 router = fastapi.APIRouter(prefix="/accounts", tags=["accounts"])
 
@@ -22,17 +38,48 @@ router = fastapi.APIRouter(prefix="/accounts", tags=["accounts"])
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def get_accounts(
+    request: fastapi.Request,
+    response: fastapi.Response,
+    filters: list[str] = fastapi.Query(default=[], alias="filter"),
+    sort: str | None = None,
+    limit: int | None = fastapi.Query(default=None, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    offset: int = fastapi.Query(default=0, ge=0),
+    count: CountMethod = "none",
     account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
-) -> list[AccountInResponse]:
-    db_accounts = await account_repo.read_accounts()
+) -> list[AccountInResponse] | fastapi.Response:
+    accounts_version = await account_repo.read_accounts_version()
+    not_modified_response = evaluate_conditional_request(
+        request=request, response=response, resource_version=accounts_version
+    )
+
+    if not_modified_response:
+        return not_modified_response
+
+    try:
+        db_accounts = await account_repo.read_accounts(
+            filters=filters, sort=sort, limit=limit + 1 if limit else None, offset=offset
+        )
+        total_count = await account_repo.count_accounts(filters=filters, method=count)
+
+    except InvalidQueryExpression as query_error:
+        raise await http_400_exc_bad_query_request(reason=str(query_error))
+
+    db_accounts, has_next_page = split_page(rows=db_accounts, limit=limit)
+    set_pagination_headers(
+        request=request,
+        response=response,
+        offset=offset,
+        limit=limit,
+        has_next_page=has_next_page,
+        total_count=total_count,
+        count_method=count,
+    )
     db_account_list: list = list()
 
     for db_account in db_accounts:
-        access_token = jwt_generator.generate_access_token(account=db_account)
         account = AccountInResponse(
             id=db_account.id,
             authorized_account=AccountWithToken(
-                token=access_token,
                 username=db_account.username,
                 email=db_account.email,  # type: ignore
                 is_verified=db_account.is_verified,
@@ -47,6 +94,70 @@ async def get_accounts(
     return db_account_list
 
 
+@router.get(
+    path="/changes",
+    name="accountss:read-account-changes",
+    response_model=AccountChangesInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_account_changes(
+    since: str | None = None,
+    limit: int = fastapi.Query(default=500, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
+) -> AccountChangesInResponse:
+    try:
+        account_changes = await account_repo.read_accounts_changes(
+            watermark=decode_watermark(token=since), limit=limit
+        )
+
+    except InvalidQueryExpression as query_error:
+        raise await http_400_exc_bad_query_request(reason=str(query_error))
+
+    return AccountChangesInResponse(
+        upserted=[
+            AccountInResponse(
+                id=db_account.id,
+                authorized_account=AccountWithToken(
+                    username=db_account.username,
+                    email=db_account.email,  # type: ignore
+                    is_verified=db_account.is_verified,
+                    is_active=db_account.is_active,
+                    is_logged_in=db_account.is_logged_in,
+                    created_at=db_account.created_at,
+                    updated_at=db_account.updated_at,
+                ),
+            )
+            for db_account in account_changes.upserted
+        ],
+        deleted=account_changes.deleted,
+        watermark=encode_watermark(watermark=account_changes.watermark),
+        has_more=account_changes.has_more,
+    )
+
+
+@router.post(
+    path="/bulk",
+    name="accountss:create-accounts-in-bulk",
+    response_model=AccountsInBulkResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+    dependencies=[fastapi.Depends(verify_api_token)],
+)
+async def create_accounts_in_bulk(
+    accounts_create: AccountsInBulkCreate,
+    account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
+) -> AccountsInBulkResponse:
+    """
+    Provision a whole customer at once. The passwords are hashed in parallel, and an account that cannot be created
+    does not fail the others.
+    """
+    results = await account_repo.create_accounts_in_bulk(accounts_create=accounts_create.accounts)
+    failed_count = sum(result.error is not None for result in results)
+
+    return AccountsInBulkResponse(
+        created_count=len(results) - failed_count, failed_count=failed_count, results=results
+    )
+
+
 @router.get(
     path="/{id}",
     name="accountss:read-account-by-id",
@@ -55,11 +166,20 @@ async def get_accounts(
 )
 async def get_account(
     id: int,
+    request: fastapi.Request,
+    response: fastapi.Response,
     account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
-) -> AccountInResponse:
+) -> AccountInResponse | fastapi.Response:
     try:
+        account_version = await account_repo.read_account_version_by_id(id=id)
+        not_modified_response = evaluate_conditional_request(
+            request=request, response=response, resource_version=account_version
+        )
+
+        if not_modified_response:
+            return not_modified_response
+
         db_account = await account_repo.read_account_by_id(id=id)
-        access_token = jwt_generator.generate_access_token(account=db_account)
 
     except EntityDoesNotExist:
         raise await http_404_exc_id_not_found_request(id=id)
@@ -67,7 +187,6 @@ async def get_account(
     return AccountInResponse(
         id=db_account.id,
         authorized_account=AccountWithToken(
-            token=access_token,
             username=db_account.username,
             email=db_account.email,  # type: ignore
             is_verified=db_account.is_verified,
@@ -99,12 +218,12 @@ async def update_account(
     except EntityDoesNotExist:
         raise await http_404_exc_id_not_found_request(id=query_id)
 
-    access_token = jwt_generator.generate_access_token(account=updated_db_account)
+    except EntityAlreadyExists:
+        raise await http_exc_400_credentials_bad_update_request()
 
     return AccountInResponse(
         id=updated_db_account.id,
         authorized_account=AccountWithToken(
-            token=access_token,
             username=updated_db_account.username,
             email=updated_db_account.email,  # type: ignore
             is_verified=updated_db_account.is_verified,
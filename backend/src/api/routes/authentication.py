@@ -1,14 +1,32 @@
 import fastapi
 
+from src.api.dependencies.authentication import get_access_token, get_current_account
 from src.api.dependencies.repository import get_repository
-from src.models.schemas.account import AccountInCreate, AccountInLogin, AccountInResponse, AccountWithToken
+from src.config.manager import settings
+from src.models.schemas.account import (
+    AccountAvailabilityInResponse,
+    AccountInCreate,
+    AccountInLogin,
+    AccountInRefresh,
+    AccountInResponse,
+    AccountTokensInResponse,
+    AccountWithToken,
+)
+from src.models.schemas.jwt import JWTAccount
 from src.repository.crud.account import AccountCRUDRepository
+from src.repository.crud.refresh_token import RefreshTokenCRUDRepository
+from src.repository.revocations import token_revocations
+from src.repository.write_behind import login_state_queue
 from src.securities.authorizations.jwt import jwt_generator
-from src.utilities.exceptions.database import EntityAlreadyExists
+from src.securities.authorizations.token_cache import hash_token
+from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 from src.utilities.exceptions.http.exc_400 import (
+    http_400_exc_bad_availability_request,
     http_exc_400_credentials_bad_signin_request,
     http_exc_400_credentials_bad_signup_request,
 )
+from src.utilities.exceptions.http.exc_401 import http_exc_401_access_token_request, http_exc_401_refresh_token_request
+from src.utilities.exceptions.token import RefreshTokenReused
 
 router = fastapi.APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -22,21 +40,26 @@ router = fastapi.APIRouter(prefix="/auth", tags=["authentication"])
 async def signup(
     account_create: AccountInCreate,
     account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
+    refresh_token_repo: RefreshTokenCRUDRepository = fastapi.Depends(
+        get_repository(repo_type=RefreshTokenCRUDRepository)
+    ),
 ) -> AccountInResponse:
     try:
         await account_repo.is_username_taken(username=account_create.username)
         await account_repo.is_email_taken(email=account_create.email)
+        new_account = await account_repo.create_account(account_create=account_create)
 
     except EntityAlreadyExists:
         raise await http_exc_400_credentials_bad_signup_request()
 
-    new_account = await account_repo.create_account(account_create=account_create)
-    access_token = jwt_generator.generate_access_token(account=new_account)
+    new_refresh_token = await refresh_token_repo.create_refresh_token(account_id=new_account.id)
+    access_token = jwt_generator.generate_access_token(account=new_account, session_id=new_refresh_token.family)
 
     return AccountInResponse(
         id=new_account.id,
         authorized_account=AccountWithToken(
             token=access_token,
+            refresh_token=jwt_generator.generate_refresh_token(refresh_token=new_refresh_token),
             username=new_account.username,
             email=new_account.email,  # type: ignore
             is_verified=new_account.is_verified,
@@ -57,6 +80,9 @@ async def signup(
 async def signin(
     account_login: AccountInLogin,
     account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
+    refresh_token_repo: RefreshTokenCRUDRepository = fastapi.Depends(
+        get_repository(repo_type=RefreshTokenCRUDRepository)
+    ),
 ) -> AccountInResponse:
     try:
         db_account = await account_repo.read_user_by_password_authentication(account_login=account_login)
@@ -64,18 +90,125 @@ async def signin(
     except Exception:
         raise await http_exc_400_credentials_bad_signin_request()
 
-    access_token = jwt_generator.generate_access_token(account=db_account)
+    new_refresh_token = await refresh_token_repo.create_refresh_token(account_id=db_account.id)
+    access_token = jwt_generator.generate_access_token(account=db_account, session_id=new_refresh_token.family)
+    # Written behind the response, so the signin does not wait for an `UPDATE` of its own.
+    login_state_queue.record_signin(account_id=db_account.id)
 
     return AccountInResponse(
         id=db_account.id,
         authorized_account=AccountWithToken(
             token=access_token,
+            refresh_token=jwt_generator.generate_refresh_token(refresh_token=new_refresh_token),
             username=db_account.username,
             email=db_account.email,  # type: ignore
             is_verified=db_account.is_verified,
             is_active=db_account.is_active,
-            is_logged_in=db_account.is_logged_in,
+            is_logged_in=True,
             created_at=db_account.created_at,
             updated_at=db_account.updated_at,
         ),
     )
+
+
+@router.post(
+    path="/signout",
+    name="auth:signout",
+    status_code=fastapi.status.HTTP_204_NO_CONTENT,
+)
+async def signout(
+    access_token: str = fastapi.Depends(get_access_token),
+    jwt_account: JWTAccount = fastapi.Depends(get_current_account),
+    account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
+    refresh_token_repo: RefreshTokenCRUDRepository = fastapi.Depends(
+        get_repository(repo_type=RefreshTokenCRUDRepository)
+    ),
+) -> fastapi.Response:
+    """
+    Revoke the access token in every worker and the refresh tokens of its signin, and mark the account as logged out.
+    """
+    session_id, expires_at = jwt_generator.retrieve_session_from_token(
+        token=access_token, secret_key=settings.JWT_SECRET_KEY
+    )
+    await token_revocations.revoke(digest=hash_token(token=access_token), expires_at=expires_at)
+    account_id = await refresh_token_repo.revoke_refresh_token_session(family=session_id) if session_id else None
+
+    # Access tokens issued before they carried a session id only name their account.
+    if account_id is None:
+        try:
+            account_id = (await account_repo.read_account_by_username(username=jwt_account.username)).id
+
+        except EntityDoesNotExist:
+            raise await http_exc_401_access_token_request()
+
+    login_state_queue.record_signout(account_id=account_id)
+
+    return fastapi.Response(status_code=fastapi.status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    path="/refresh",
+    name="auth:refresh",
+    response_model=AccountTokensInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def refresh(
+    account_refresh: AccountInRefresh,
+    refresh_token_repo: RefreshTokenCRUDRepository = fastapi.Depends(
+        get_repository(repo_type=RefreshTokenCRUDRepository)
+    ),
+) -> AccountTokensInResponse:
+    """
+    Exchange a refresh token for a new access token and its successor refresh token, without the password hashing
+    of `POST /auth/signin`.
+    """
+    try:
+        refresh_token_id = jwt_generator.retrieve_refresh_token_id(
+            token=account_refresh.refresh_token, secret_key=settings.JWT_SECRET_KEY
+        )
+        db_account, new_refresh_token = await refresh_token_repo.rotate_refresh_token(id=refresh_token_id)
+
+    except (ValueError, EntityDoesNotExist, RefreshTokenReused):
+        raise await http_exc_401_refresh_token_request()
+
+    return AccountTokensInResponse(
+        token=jwt_generator.generate_access_token(account=db_account, session_id=new_refresh_token.family),
+        refresh_token=jwt_generator.generate_refresh_token(refresh_token=new_refresh_token),
+    )
+
+
+@router.get(
+    path="/availability",
+    name="auth:availability",
+    response_model=AccountAvailabilityInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_availability(
+    username: str | None = None,
+    email: str | None = None,
+    account_repo: AccountCRUDRepository = fastapi.Depends(get_repository(repo_type=AccountCRUDRepository)),
+) -> AccountAvailabilityInResponse:
+    """
+    Whether a username and/or an email can still be signed up with. Definitely available values are answered from
+    the in-memory account filter, only possibly taken ones are looked up.
+    """
+    if username is None and email is None:
+        raise await http_400_exc_bad_availability_request()
+
+    availability = AccountAvailabilityInResponse()
+
+    if username is not None:
+        try:
+            availability.username = await account_repo.is_username_taken(username=username)
+
+        except EntityAlreadyExists:
+            availability.username = False
+
+    if email is not None:
+        try:
+            availability.email = await account_repo.is_email_taken(email=email)
+
+        except EntityAlreadyExists:
+            availability.email = False
+
+    return availability
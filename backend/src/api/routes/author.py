@@ -2,16 +2,16 @@ import fastapi
 import pydantic
 
 from src.api.dependencies.repository import get_repository
-from src.models.schemas.author import (
-    AuthorInCreate,
-    AuthorInResponse,
-    AuthorInUpdate,
-)
+from src.config.manager import settings
+from src.models.schemas.author import AuthorChangesInResponse, AuthorInCreate, AuthorInResponse, AuthorInUpdate
+from src.repository.changes import decode_watermark, encode_watermark
+from src.repository.count import CountMethod
 from src.repository.crud.author import AuthorCRUDRepository
-from src.utilities.exceptions.database import EntityDoesNotExist
-from src.utilities.exceptions.http.exc_404 import (
-    http_404_exc_id_not_found_request,
-)
+from src.utilities.exceptions.database import EntityDoesNotExist, InvalidQueryExpression
+from src.utilities.exceptions.http.exc_400 import http_400_exc_bad_query_request
+from src.utilities.exceptions.http.exc_404 import http_404_exc_id_not_found_request
+from src.utilities.http.conditional import evaluate_conditional_request
+from src.utilities.http.pagination import set_pagination_headers, split_page
 
 router = fastapi.APIRouter(prefix="/authors", tags=["authors"])
 
@@ -24,9 +24,7 @@ router = fastapi.APIRouter(prefix="/authors", tags=["authors"])
 )
 async def create_author(
     author_create: AuthorInCreate,
-    author_repo: AuthorCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=AuthorCRUDRepository)
-    ),
+    author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
 ) -> AuthorInResponse:
     db_author = await author_repo.create_author(author_create)
 
@@ -40,17 +38,71 @@ async def create_author(
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def get_authors(
-    author_repo: AuthorCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=AuthorCRUDRepository)
-    ),
-) -> list[AuthorInResponse]:
-    db_authors = await author_repo.read_authors()
-    db_author_responses = [
-        AuthorInResponse(id=author.id, name=author.name) for author in db_authors
-    ]
+    request: fastapi.Request,
+    response: fastapi.Response,
+    filters: list[str] = fastapi.Query(default=[], alias="filter"),
+    sort: str | None = None,
+    limit: int | None = fastapi.Query(default=None, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    offset: int = fastapi.Query(default=0, ge=0),
+    count: CountMethod = "none",
+    author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
+) -> list[AuthorInResponse] | fastapi.Response:
+    authors_version = await author_repo.read_authors_version()
+    not_modified_response = evaluate_conditional_request(
+        request=request, response=response, resource_version=authors_version
+    )
+
+    if not_modified_response:
+        return not_modified_response
+
+    try:
+        db_authors = await author_repo.read_authors(
+            filters=filters, sort=sort, limit=limit + 1 if limit else None, offset=offset
+        )
+        total_count = await author_repo.count_authors(filters=filters, method=count)
+
+    except InvalidQueryExpression as query_error:
+        raise await http_400_exc_bad_query_request(reason=str(query_error))
+
+    db_authors, has_next_page = split_page(rows=db_authors, limit=limit)
+    set_pagination_headers(
+        request=request,
+        response=response,
+        offset=offset,
+        limit=limit,
+        has_next_page=has_next_page,
+        total_count=total_count,
+        count_method=count,
+    )
+    db_author_responses = [AuthorInResponse(id=author.id, name=author.name) for author in db_authors]
     return db_author_responses
 
 
+@router.get(
+    path="/changes",
+    name="authorss:read-author-changes",
+    response_model=AuthorChangesInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_author_changes(
+    since: str | None = None,
+    limit: int = fastapi.Query(default=500, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
+) -> AuthorChangesInResponse:
+    try:
+        author_changes = await author_repo.read_authors_changes(watermark=decode_watermark(token=since), limit=limit)
+
+    except InvalidQueryExpression as query_error:
+        raise await http_400_exc_bad_query_request(reason=str(query_error))
+
+    return AuthorChangesInResponse(
+        upserted=[AuthorInResponse(id=author.id, name=author.name) for author in author_changes.upserted],
+        deleted=author_changes.deleted,
+        watermark=encode_watermark(watermark=author_changes.watermark),
+        has_more=author_changes.has_more,
+    )
+
+
 @router.get(
     path="/{id}",
     name="authorss:read-author-by-id",
@@ -59,11 +111,19 @@ async def get_authors(
 )
 async def get_author(
     id: int,
-    author_repo: AuthorCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=AuthorCRUDRepository)
-    ),
-) -> AuthorInResponse:
+    request: fastapi.Request,
+    response: fastapi.Response,
+    author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
+) -> AuthorInResponse | fastapi.Response:
     try:
+        author_version = await author_repo.read_author_version_by_id(id=id)
+        not_modified_response = evaluate_conditional_request(
+            request=request, response=response, resource_version=author_version
+        )
+
+        if not_modified_response:
+            return not_modified_response
+
         db_author = await author_repo.read_author_by_id(id=id)
 
     except EntityDoesNotExist:
@@ -81,17 +141,13 @@ async def get_author(
 async def update_author(
     id: int,
     author_update: AuthorInUpdate,
-    author_repo: AuthorCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=AuthorCRUDRepository)
-    ),
+    author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
 ) -> AuthorInResponse:
     author_update = AuthorInUpdate(
         name=author_update.name,
     )
     try:
-        updated_db_author = await author_repo.update_author_by_id(
-            id=id, author_update=author_update
-        )
+        updated_db_author = await author_repo.update_author_by_id(id=id, author_update=author_update)
 
     except EntityDoesNotExist:
         raise await http_404_exc_id_not_found_request(id=id)
@@ -106,9 +162,7 @@ async def update_author(
 )
 async def delete_author(
     id: int,
-    author_repo: AuthorCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=AuthorCRUDRepository)
-    ),
+    author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
 ) -> dict[str, str]:
     try:
         deletion_result = await author_repo.delete_author_by_id(id=id)
@@ -0,0 +1,34 @@
+import fastapi
+
+from src.config.manager import settings
+from src.models.schemas.batch import BatchInRequest, BatchInResponse
+from src.utilities.exceptions.http.exc_400 import http_400_exc_bad_batch_request
+from src.utilities.http.batch import run_sub_requests
+
+router = fastapi.APIRouter(prefix="/batch", tags=["batch"])
+
+
+@router.post(
+    path="",
+    name="batch:run-sub-requests",
+    response_model=BatchInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def run_batch(request: fastapi.Request, batch: BatchInRequest) -> BatchInResponse:
+    for sub_request in batch.requests:
+        path = sub_request.path.partition("?")[0].rstrip("/")
+
+        if not path.startswith("/") or any(
+            path == route or path.startswith(f"{route}/") for route in settings.BATCH_EXCLUDED_ROUTES
+        ):
+            raise await http_400_exc_bad_batch_request(reason=f"`{sub_request.path}` cannot be part of a batch.")
+
+    sub_responses = await run_sub_requests(
+        app=request.app,
+        parent_scope=request.scope,
+        api_prefix=settings.API_PREFIX,
+        sub_requests=batch.requests,
+        max_concurrency=settings.BATCH_MAX_CONCURRENCY,
+    )
+
+    return BatchInResponse(responses=sub_responses)
@@ -2,16 +2,16 @@ import fastapi
 import pydantic
 
 from src.api.dependencies.repository import get_repository
-from src.models.schemas.book import (
-    BookInCreate,
-    BookInResponse,
-    BookInUpdate,
-)
+from src.config.manager import settings
+from src.models.schemas.book import BookChangesInResponse, BookInCreate, BookInResponse, BookInUpdate
+from src.repository.changes import decode_watermark, encode_watermark
+from src.repository.count import CountMethod
 from src.repository.crud.book import BookCRUDRepository
-from src.utilities.exceptions.database import EntityDoesNotExist
-from src.utilities.exceptions.http.exc_404 import (
-    http_404_exc_id_not_found_request,
-)
+from src.utilities.exceptions.database import EntityDoesNotExist, InvalidQueryExpression
+from src.utilities.exceptions.http.exc_400 import http_400_exc_bad_query_request
+from src.utilities.exceptions.http.exc_404 import http_404_exc_id_not_found_request
+from src.utilities.http.conditional import evaluate_conditional_request
+from src.utilities.http.pagination import set_pagination_headers, split_page
 
 router = fastapi.APIRouter(prefix="/books", tags=["books"])
 
@@ -24,9 +24,7 @@ router = fastapi.APIRouter(prefix="/books", tags=["books"])
 )
 async def create_book(
     book_create: BookInCreate,
-    book_repo: BookCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=BookCRUDRepository)
-    ),
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
 ) -> BookInResponse:
     db_book = await book_repo.create_book(book_create)
 
@@ -40,18 +38,73 @@ async def create_book(
     status_code=fastapi.status.HTTP_200_OK,
 )
 async def get_books(
-    book_repo: BookCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=BookCRUDRepository)
-    ),
-) -> list[BookInResponse]:
-    db_books = await book_repo.read_books()
-    db_book_responses = [
-        BookInResponse(id=book.id, name=book.name, author_id=book.author_id)
-        for book in db_books
-    ]
+    request: fastapi.Request,
+    response: fastapi.Response,
+    filters: list[str] = fastapi.Query(default=[], alias="filter"),
+    sort: str | None = None,
+    limit: int | None = fastapi.Query(default=None, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    offset: int = fastapi.Query(default=0, ge=0),
+    count: CountMethod = "none",
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
+) -> list[BookInResponse] | fastapi.Response:
+    books_version = await book_repo.read_books_version()
+    not_modified_response = evaluate_conditional_request(
+        request=request, response=response, resource_version=books_version
+    )
+
+    if not_modified_response:
+        return not_modified_response
+
+    try:
+        db_books = await book_repo.read_books(
+            filters=filters, sort=sort, limit=limit + 1 if limit else None, offset=offset
+        )
+        total_count = await book_repo.count_books(filters=filters, method=count)
+
+    except InvalidQueryExpression as query_error:
+        raise await http_400_exc_bad_query_request(reason=str(query_error))
+
+    db_books, has_next_page = split_page(rows=db_books, limit=limit)
+    set_pagination_headers(
+        request=request,
+        response=response,
+        offset=offset,
+        limit=limit,
+        has_next_page=has_next_page,
+        total_count=total_count,
+        count_method=count,
+    )
+    db_book_responses = [BookInResponse(id=book.id, name=book.name, author_id=book.author_id) for book in db_books]
     return db_book_responses
 
 
+@router.get(
+    path="/changes",
+    name="bookss:read-book-changes",
+    response_model=BookChangesInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def get_book_changes(
+    since: str | None = None,
+    limit: int = fastapi.Query(default=500, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
+) -> BookChangesInResponse:
+    try:
+        book_changes = await book_repo.read_books_changes(watermark=decode_watermark(token=since), limit=limit)
+
+    except InvalidQueryExpression as query_error:
+        raise await http_400_exc_bad_query_request(reason=str(query_error))
+
+    return BookChangesInResponse(
+        upserted=[
+            BookInResponse(id=book.id, name=book.name, author_id=book.author_id) for book in book_changes.upserted
+        ],
+        deleted=book_changes.deleted,
+        watermark=encode_watermark(watermark=book_changes.watermark),
+        has_more=book_changes.has_more,
+    )
+
+
 @router.get(
     path="/{id}",
     name="bookss:read-book-by-id",
@@ -60,11 +113,19 @@ async def get_books(
 )
 async def get_book(
     id: int,
-    book_repo: BookCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=BookCRUDRepository)
-    ),
-) -> BookInResponse:
+    request: fastapi.Request,
+    response: fastapi.Response,
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
+) -> BookInResponse | fastapi.Response:
     try:
+        book_version = await book_repo.read_book_version_by_id(id=id)
+        not_modified_response = evaluate_conditional_request(
+            request=request, response=response, resource_version=book_version
+        )
+
+        if not_modified_response:
+            return not_modified_response
+
         db_book = await book_repo.read_book_by_id(id=id)
 
     except EntityDoesNotExist:
@@ -81,9 +142,7 @@ async def get_book(
 )
 async def get_book(
     author_id: int,
-    book_repo: BookCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=BookCRUDRepository)
-    ),
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
 ) -> BookInResponse:
     try:
         db_book = await book_repo.read_book_by_author_id(author_id=author_id)
@@ -103,9 +162,7 @@ async def get_book(
 async def update_book(
     id: int,
     book_update: BookInUpdate,
-    book_repo: BookCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=BookCRUDRepository)
-    ),
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
 ) -> BookInResponse:
     book_update = BookInUpdate(name=book_update.name, author_id=book_update.author_id)
     try:
@@ -131,9 +188,7 @@ async def update_book(
 )
 async def delete_book(
     id: int,
-    book_repo: BookCRUDRepository = fastapi.Depends(
-        get_repository(repo_type=BookCRUDRepository)
-    ),
+    book_repo: BookCRUDRepository = fastapi.Depends(get_repository(repo_type=BookCRUDRepository)),
 ) -> dict[str, str]:
     try:
         deletion_result = await book_repo.delete_book_by_id(id=id)
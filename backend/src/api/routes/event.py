@@ -0,0 +1,51 @@
+import asyncio
+import typing
+
+import asyncpg
+import fastapi
+import loguru
+from fastapi.responses import StreamingResponse
+
+from src.config.manager import settings
+from src.repository.notifications import change_event_broker
+from src.utilities.exceptions.http.exc_503 import http_503_exc_event_stream_unavailable_request
+from src.utilities.http.sse import generate_change_events
+
+router = fastapi.APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get(
+    path="",
+    name="events:stream-change-events",
+    response_class=StreamingResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+)
+async def stream_change_events(
+    request: fastapi.Request,
+    resource: list[typing.Literal["authors", "books"]] = fastapi.Query(default=[]),
+) -> StreamingResponse:
+    retry_after = max(1, settings.EVENT_STREAM_RETRY_MS // 1000)
+
+    if not settings.IS_EVENT_STREAM_ENABLED:
+        raise await http_503_exc_event_stream_unavailable_request(retry_after=retry_after)
+
+    try:
+        await change_event_broker.ensure_listening()
+
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError) as listen_error:
+        loguru.logger.error(f"Change Events --- Cannot LISTEN: {listen_error!r}")
+        raise await http_503_exc_event_stream_unavailable_request(retry_after=retry_after)
+
+    subscription = change_event_broker.subscribe(resources=set(resource))
+
+    return StreamingResponse(
+        content=generate_change_events(
+            request=request,
+            subscription=subscription,
+            unsubscribe=change_event_broker.unsubscribe,
+            heartbeat=settings.EVENT_STREAM_HEARTBEAT,
+            retry=settings.EVENT_STREAM_RETRY_MS,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,18 @@
+import fastapi
+
+from src.api.dependencies.authentication import verify_api_token
+from src.models.schemas.job import JobMetricsInResponse
+from src.utilities.jobs import job_runner
+
+router = fastapi.APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+    path="/metrics",
+    name="jobs:read-job-metrics",
+    response_model=JobMetricsInResponse,
+    status_code=fastapi.status.HTTP_200_OK,
+    dependencies=[fastapi.Depends(verify_api_token)],
+)
+async def get_job_metrics() -> JobMetricsInResponse:
+    return JobMetricsInResponse(**job_runner.metrics)
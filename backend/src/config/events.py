@@ -3,19 +3,41 @@ import typing
 import fastapi
 import loguru
 
+from src.config.manager import settings
+from src.repository.batching import drain_insert_batchers
+from src.repository.bloom import account_filter
 from src.repository.events import dispose_db_connection, initialize_db_connection
+from src.repository.notifications import change_event_broker
+from src.repository.shared_cache import shared_cache
+from src.repository.write_behind import login_state_queue
+from src.utilities.jobs import job_runner
 
 
 def execute_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     async def launch_backend_server_events() -> None:
         await initialize_db_connection(backend_app=backend_app)
 
+        # The tables have just been recreated, so the ids of cached rows may already belong to new rows.
+        if settings.IS_SHARED_CACHE_ENABLED:
+            shared_cache.clear()
+
+        if settings.IS_ACCOUNT_FILTER_ENABLED:
+            async with backend_app.state.db.async_engine.connect() as connection:
+                await account_filter.load(connection=connection)
+
+        job_runner.start()
+
     return launch_backend_server_events
 
 
 def terminate_backend_server_event_handler(backend_app: fastapi.FastAPI) -> typing.Any:
     @loguru.logger.catch
     async def stop_backend_server_events() -> None:
+        # Jobs may still write through the batchers and the database, so they are drained first.
+        await job_runner.drain(timeout=settings.JOB_DRAIN_TIMEOUT)
+        await drain_insert_batchers()
+        await login_state_queue.drain()
+        await change_event_broker.stop()
         await dispose_db_connection(backend_app=backend_app)
 
     return stop_backend_server_events
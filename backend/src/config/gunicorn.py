@@ -0,0 +1,32 @@
+"""
+Production server profile: `gunicorn --config python:src.config.gunicorn src.main:backend_app`.
+
+The application is imported once in the master process (`preload_app`) and then forked, so the workers share the
+imported code pages. The engine and the hashing contexts are created lazily inside each worker, which keeps
+connections and sockets from leaking across the fork.
+"""
+
+import logging
+
+from uvicorn_worker import UvicornWorker
+
+from src.config.manager import settings
+
+
+class BackendUvicornWorker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+bind: list[str] = (
+    [f"unix:{settings.SERVER_UNIX_SOCKET}"]
+    if settings.SERVER_UNIX_SOCKET
+    else [f"{settings.SERVER_HOST}:{settings.SERVER_PORT}"]
+)
+workers: int = settings.SERVER_WORKERS
+worker_class: str = "src.config.gunicorn.BackendUvicornWorker"
+preload_app: bool = True
+max_requests: int = settings.SERVER_MAX_REQUESTS
+max_requests_jitter: int = settings.SERVER_MAX_REQUESTS_JITTER
+graceful_timeout: int = settings.SERVER_GRACEFUL_TIMEOUT
+keepalive: int = settings.SERVER_KEEPALIVE
+loglevel: str = logging.getLevelName(settings.LOGGING_LEVEL).lower()
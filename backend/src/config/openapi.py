@@ -0,0 +1,117 @@
+import hashlib
+import json
+import pathlib
+import typing
+
+import fastapi
+import loguru
+import pydantic
+import pydantic.fields
+import starlette.routing
+from fastapi.dependencies.utils import get_flat_dependant
+from pydantic.schema import field_schema
+
+from src.config.manager import settings
+
+
+def compute_openapi_route_signature(route: starlette.routing.BaseRoute) -> str:
+    """
+    Besides the path, methods and name, an API route's signature holds the JSON schema of its parameters and of its
+    request and response models, so editing a model or a constraint read from the settings changes it too.
+    """
+    signature = [
+        getattr(route, "path", ""),
+        ",".join(sorted(getattr(route, "methods", None) or [])),
+        getattr(route, "name", ""),
+    ]
+
+    if isinstance(route, fastapi.routing.APIRoute):
+        flat_dependant = get_flat_dependant(route.dependant)
+        # On pydantic v1, FastAPI's fields are pydantic's own `ModelField`s.
+        params = typing.cast(
+            list[pydantic.fields.ModelField],
+            [
+                *flat_dependant.path_params,
+                *flat_dependant.query_params,
+                *flat_dependant.header_params,
+                *flat_dependant.cookie_params,
+            ],
+        )
+        model_fields = typing.cast(list[pydantic.fields.ModelField | None], [route.body_field, route.response_field])
+
+        for param in params:
+            signature.append(json.dumps(field_schema(param, model_name_map={})[0], sort_keys=True, default=str))
+
+        for model_field in model_fields:
+            if model_field is None:
+                continue
+
+            signature.append(str(model_field.outer_type_))
+
+            if isinstance(model_field.type_, type) and issubclass(model_field.type_, pydantic.BaseModel):
+                signature.append(model_field.type_.schema_json(sort_keys=True))
+
+    return ":".join(signature)
+
+
+def compute_openapi_route_fingerprint(backend_app: fastapi.FastAPI) -> str:
+    """
+    Hash the application's version, title and description and the signatures of the registered routes, so a schema
+    cached by another build is never served.
+    """
+    route_signatures = sorted(compute_openapi_route_signature(route=route) for route in backend_app.routes)
+    app_signature = [settings.VERSION, settings.TITLE, settings.DESCRIPTION or ""]
+    return hashlib.sha256("|".join([*app_signature, *route_signatures]).encode()).hexdigest()
+
+
+def read_openapi_schema_cache(backend_app: fastapi.FastAPI) -> dict[str, typing.Any] | None:
+    try:
+        cached_schema = json.loads(pathlib.Path(settings.OPENAPI_SCHEMA_CACHE_PATH).read_text())
+
+    except (OSError, ValueError):
+        return None
+
+    if cached_schema.get("fingerprint") != compute_openapi_route_fingerprint(backend_app=backend_app):
+        return None
+
+    return cached_schema.get("schema")
+
+
+def write_openapi_schema_cache(backend_app: fastapi.FastAPI) -> pathlib.Path:
+    """
+    Generate the OpenAPI schema once and store it next to its route fingerprint. The file is written to a temporary
+    path first and then renamed, so workers starting concurrently never read a half-written schema.
+    """
+    cache_path = pathlib.Path(settings.OPENAPI_SCHEMA_CACHE_PATH)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temporary_path = cache_path.with_suffix(f"{cache_path.suffix}.tmp")
+    temporary_path.write_text(
+        json.dumps(
+            {
+                "fingerprint": compute_openapi_route_fingerprint(backend_app=backend_app),
+                "schema": fastapi.FastAPI.openapi(backend_app),
+            }
+        )
+    )
+    temporary_path.replace(cache_path)
+
+    return cache_path
+
+
+def set_cached_openapi_schema(backend_app: fastapi.FastAPI) -> typing.Callable[[], dict[str, typing.Any]]:
+    def load_cached_openapi_schema() -> dict[str, typing.Any]:
+        if not backend_app.openapi_schema:
+            backend_app.openapi_schema = read_openapi_schema_cache(backend_app=backend_app) or fastapi.FastAPI.openapi(
+                backend_app
+            )
+
+        return backend_app.openapi_schema
+
+    return load_cached_openapi_schema
+
+
+if __name__ == "__main__":
+    from src.main import backend_app
+
+    loguru.logger.info(f"OpenAPI Schema Cache --- Written to {write_openapi_schema_cache(backend_app=backend_app)}")
@@ -1,12 +1,13 @@
 import logging
+import os
 import pathlib
+import tempfile
+import typing
 
 import decouple
 import pydantic
 
-ROOT_DIR: pathlib.Path = pathlib.Path(
-    __file__
-).parent.parent.parent.parent.parent.resolve()
+ROOT_DIR: pathlib.Path = pathlib.Path(__file__).parent.parent.parent.parent.parent.resolve()
 
 
 class BackendBaseSettings(pydantic.BaseSettings):
@@ -19,11 +20,18 @@ class BackendBaseSettings(pydantic.BaseSettings):
     SERVER_HOST: str = decouple.config("BACKEND_SERVER_HOST", cast=str)  # type: ignore
     SERVER_PORT: int = decouple.config("BACKEND_SERVER_PORT", cast=int)  # type: ignore
     SERVER_WORKERS: int = decouple.config("BACKEND_SERVER_WORKERS", cast=int)  # type: ignore
+    SERVER_UNIX_SOCKET: str = decouple.config("BACKEND_SERVER_UNIX_SOCKET", default="", cast=str)  # type: ignore
+    SERVER_MAX_REQUESTS: int = decouple.config("BACKEND_SERVER_MAX_REQUESTS", default=10000, cast=int)  # type: ignore
+    SERVER_MAX_REQUESTS_JITTER: int = decouple.config("BACKEND_SERVER_MAX_REQUESTS_JITTER", default=1000, cast=int)  # type: ignore
+    SERVER_GRACEFUL_TIMEOUT: int = decouple.config("BACKEND_SERVER_GRACEFUL_TIMEOUT", default=30, cast=int)  # type: ignore
+    SERVER_KEEPALIVE: int = decouple.config("BACKEND_SERVER_KEEPALIVE", default=5, cast=int)  # type: ignore
     API_PREFIX: str = "/api"
     DOCS_URL: str = "/docs"
     OPENAPI_URL: str = "/openapi.json"
     REDOC_URL: str = "/redoc"
     OPENAPI_PREFIX: str = ""
+    IS_OPENAPI_SCHEMA_CACHED: bool = decouple.config("IS_OPENAPI_SCHEMA_CACHED", default=True, cast=bool)  # type: ignore
+    OPENAPI_SCHEMA_CACHE_PATH: str = decouple.config("OPENAPI_SCHEMA_CACHE_PATH", default=f"{str(ROOT_DIR)}/backend/openapi.json", cast=str)  # type: ignore
 
     DB_POSTGRES_HOST: str = decouple.config("POSTGRES_HOST", cast=str)  # type: ignore
     DB_MAX_POOL_CON: int = decouple.config("DB_MAX_POOL_CON", cast=int)  # type: ignore
@@ -35,6 +43,46 @@ class BackendBaseSettings(pydantic.BaseSettings):
     DB_POSTGRES_SCHEMA: str = decouple.config("POSTGRES_SCHEMA", cast=str)  # type: ignore
     DB_TIMEOUT: int = decouple.config("DB_TIMEOUT", cast=int)  # type: ignore
     DB_POSTGRES_USENRAME: str = decouple.config("POSTGRES_USERNAME", cast=str)  # type: ignore
+    DB_CONNECTION_BUDGET: int = decouple.config("DB_CONNECTION_BUDGET", default=0, cast=int)  # type: ignore
+    DB_QUERY_CACHE_SIZE: int = decouple.config("DB_QUERY_CACHE_SIZE", default=500, cast=int)  # type: ignore
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = decouple.config("DB_PREPARED_STATEMENT_CACHE_SIZE", default=100, cast=int)  # type: ignore
+    IS_DB_PGBOUNCER_COMPATIBLE: bool = decouple.config("IS_DB_PGBOUNCER_COMPATIBLE", default=False, cast=bool)  # type: ignore
+    DB_STATEMENT_TIMEOUT: int = decouple.config("DB_STATEMENT_TIMEOUT", default=10000, cast=int)  # type: ignore
+    DB_COMMAND_TIMEOUT: float = decouple.config("DB_COMMAND_TIMEOUT", default=12, cast=float)  # type: ignore
+    DB_APPLICATION_NAME: str = decouple.config("DB_APPLICATION_NAME", default="backend", cast=str)  # type: ignore
+    REQUEST_TIMEOUT: float = decouple.config("REQUEST_TIMEOUT", default=15, cast=float)  # type: ignore
+    REQUEST_TIMEOUT_EXEMPT_ROUTES: list[str] = ["/accounts/bulk", "/events"]
+    DB_POOL_TIMEOUT_RETRY_AFTER: int = 1
+
+    IS_ADMISSION_CONTROL_ENABLED: bool = decouple.config("IS_ADMISSION_CONTROL_ENABLED", default=True, cast=bool)  # type: ignore
+    ADMISSION_INITIAL_LIMIT: int = decouple.config("ADMISSION_INITIAL_LIMIT", default=50, cast=int)  # type: ignore
+    ADMISSION_MIN_LIMIT: int = decouple.config("ADMISSION_MIN_LIMIT", default=20, cast=int)  # type: ignore
+    ADMISSION_MAX_LIMIT: int = decouple.config("ADMISSION_MAX_LIMIT", default=500, cast=int)  # type: ignore
+    ADMISSION_RETRY_AFTER: int = 1
+    ADMISSION_PRIORITY_SHARES: dict[str, float] = {"read": 1.0, "write": 0.8, "expensive": 0.5}
+    ADMISSION_ROUTE_PRIORITIES: dict[str, str] = {
+        "/accounts/bulk": "expensive",
+        "/auth/signin": "expensive",
+        "/auth/signup": "expensive",
+    }
+    ADMISSION_EXEMPT_ROUTES: list[str] = ["/events"]
+
+    # Batched creates commit on their own and skip the request's unit of work, see `src/repository/batching.py`.
+    IS_WRITE_BATCHING_ENABLED: bool = decouple.config("IS_WRITE_BATCHING_ENABLED", default=False, cast=bool)  # type: ignore
+    WRITE_BATCH_MAX_SIZE: int = decouple.config("WRITE_BATCH_MAX_SIZE", default=100, cast=int)  # type: ignore
+    WRITE_BATCH_MAX_DELAY_MS: float = decouple.config("WRITE_BATCH_MAX_DELAY_MS", default=2, cast=float)  # type: ignore
+    LOGIN_STATE_FLUSH_INTERVAL_MS: float = decouple.config("LOGIN_STATE_FLUSH_INTERVAL_MS", default=1000, cast=float)  # type: ignore
+    LOGIN_STATE_MAX_PENDING: int = decouple.config("LOGIN_STATE_MAX_PENDING", default=1000, cast=int)  # type: ignore
+
+    JOB_WORKERS: int = decouple.config("JOB_WORKERS", default=4, cast=int)  # type: ignore
+    JOB_QUEUE_SIZE: int = decouple.config("JOB_QUEUE_SIZE", default=1000, cast=int)  # type: ignore
+    JOB_MAX_RETRIES: int = decouple.config("JOB_MAX_RETRIES", default=3, cast=int)  # type: ignore
+    JOB_RETRY_BACKOFF_MS: float = decouple.config("JOB_RETRY_BACKOFF_MS", default=100, cast=float)  # type: ignore
+    JOB_DRAIN_TIMEOUT: float = decouple.config("JOB_DRAIN_TIMEOUT", default=10, cast=float)  # type: ignore
+
+    BATCH_MAX_REQUESTS: int = decouple.config("BATCH_MAX_REQUESTS", default=50, cast=int)  # type: ignore
+    BATCH_MAX_CONCURRENCY: int = decouple.config("BATCH_MAX_CONCURRENCY", default=4, cast=int)  # type: ignore
+    BATCH_EXCLUDED_ROUTES: list[str] = ["/accounts/bulk", "/batch", "/events"]
 
     IS_DB_ECHO_LOG: bool = decouple.config("IS_DB_ECHO_LOG", cast=bool)  # type: ignore
     IS_DB_FORCE_ROLLBACK: bool = decouple.config("IS_DB_FORCE_ROLLBACK", cast=bool)  # type: ignore
@@ -48,7 +96,16 @@ class BackendBaseSettings(pydantic.BaseSettings):
     JWT_MIN: int = decouple.config("JWT_MIN", cast=int)  # type: ignore
     JWT_HOUR: int = decouple.config("JWT_HOUR", cast=int)  # type: ignore
     JWT_DAY: int = decouple.config("JWT_DAY", cast=int)  # type: ignore
-    JWT_ACCESS_TOKEN_EXPIRATION_TIME: int = JWT_MIN * JWT_HOUR * JWT_DAY
+    JWT_ACCESS_TOKEN_EXPIRATION_TIME: int = decouple.config("JWT_ACCESS_TOKEN_EXPIRATION_TIME", default=15, cast=int)  # type: ignore
+    JWT_REFRESH_TOKEN_EXPIRATION_TIME: int = JWT_MIN * JWT_HOUR * JWT_DAY
+    VERIFIED_TOKEN_CACHE_MAX_ENTRIES: int = decouple.config("VERIFIED_TOKEN_CACHE_MAX_ENTRIES", default=10000, cast=int)  # type: ignore
+    TOKEN_REVOCATION_SYNC_INTERVAL_MS: float = decouple.config("TOKEN_REVOCATION_SYNC_INTERVAL_MS", default=1000, cast=float)  # type: ignore
+    IS_ACCOUNT_FILTER_ENABLED: bool = decouple.config("IS_ACCOUNT_FILTER_ENABLED", default=True, cast=bool)  # type: ignore
+    ACCOUNT_FILTER_CAPACITY: int = decouple.config("ACCOUNT_FILTER_CAPACITY", default=1000000, cast=int)  # type: ignore
+    ACCOUNT_FILTER_ERROR_RATE: float = 0.01
+    ACCOUNT_FILTER_SYNC_INTERVAL_MS: float = decouple.config("ACCOUNT_FILTER_SYNC_INTERVAL_MS", default=1000, cast=float)  # type: ignore
+    BULK_PROVISIONING_MAX_ACCOUNTS: int = decouple.config("BULK_PROVISIONING_MAX_ACCOUNTS", default=50000, cast=int)  # type: ignore
+    BULK_PROVISIONING_BATCH_SIZE: int = decouple.config("BULK_PROVISIONING_BATCH_SIZE", default=1000, cast=int)  # type: ignore
 
     IS_ALLOWED_CREDENTIALS: bool = decouple.config("IS_ALLOWED_CREDENTIALS", cast=bool)  # type: ignore
     ALLOWED_ORIGINS: list[str] = [
@@ -63,13 +120,55 @@ class BackendBaseSettings(pydantic.BaseSettings):
     ]
     ALLOWED_METHODS: list[str] = ["*"]
     ALLOWED_HEADERS: list[str] = ["*"]
+    EXPOSED_HEADERS: list[str] = ["ETag", "Link", "X-Total-Count", "X-Total-Count-Method"]
+
+    PAGINATION_MAX_LIMIT: int = decouple.config("PAGINATION_MAX_LIMIT", default=1000, cast=int)  # type: ignore
+    COUNT_CACHE_TTL: int = decouple.config("COUNT_CACHE_TTL", default=5, cast=int)  # type: ignore
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+    IS_EVENT_STREAM_ENABLED: bool = decouple.config("IS_EVENT_STREAM_ENABLED", default=True, cast=bool)  # type: ignore
+    EVENT_STREAM_CHANNEL: str = decouple.config("EVENT_STREAM_CHANNEL", default="backend_changes", cast=str)  # type: ignore
+    EVENT_STREAM_QUEUE_SIZE: int = decouple.config("EVENT_STREAM_QUEUE_SIZE", default=100, cast=int)  # type: ignore
+    EVENT_STREAM_HEARTBEAT: int = decouple.config("EVENT_STREAM_HEARTBEAT", default=15, cast=int)  # type: ignore
+    EVENT_STREAM_RETRY_MS: int = 3000
+
+    # Must cover the longest transaction, see `validate_sync_watermark_lag`.
+    SYNC_WATERMARK_LAG: int = decouple.config("SYNC_WATERMARK_LAG", default=20, cast=int)  # type: ignore
+
+    IS_RESPONSE_CACHE_ENABLED: bool = decouple.config("IS_RESPONSE_CACHE_ENABLED", default=True, cast=bool)  # type: ignore
+    IS_RESPONSE_CACHE_PRECOMPRESSED: bool = decouple.config("IS_RESPONSE_CACHE_PRECOMPRESSED", default=True, cast=bool)  # type: ignore
+    RESPONSE_CACHE_MAX_BYTES: int = decouple.config("RESPONSE_CACHE_MAX_BYTES", default=32 * 1024 * 1024, cast=int)  # type: ignore
+    RESPONSE_CACHE_TTL: int = decouple.config("RESPONSE_CACHE_TTL", default=10, cast=int)  # type: ignore
+    RESPONSE_CACHE_MAX_AGE: int = decouple.config("RESPONSE_CACHE_MAX_AGE", default=0, cast=int)  # type: ignore
+    RESPONSE_CACHE_PRECOMPRESS_MIN_SIZE: int = 500
+    RESPONSE_CACHE_ROUTE_TAGS: dict[str, str] = {"/authors": "authors", "/books": "books"}
+    RESPONSE_CACHE_EXCLUDED_ROUTES: list[str] = ["/authors/changes", "/books/changes"]
+
+    IS_SHARED_CACHE_ENABLED: bool = decouple.config("IS_SHARED_CACHE_ENABLED", default=False, cast=bool)  # type: ignore
+    SHARED_CACHE_PATH: str = decouple.config(  # type: ignore
+        "SHARED_CACHE_PATH",
+        default=str(
+            pathlib.Path("/dev/shm" if pathlib.Path("/dev/shm").is_dir() else tempfile.gettempdir())
+            / "backend-shared-cache"
+        ),
+        cast=str,
+    )
+    SHARED_CACHE_SLOTS: int = decouple.config("SHARED_CACHE_SLOTS", default=8192, cast=int)  # type: ignore
+    SHARED_CACHE_SLOT_SIZE: int = decouple.config("SHARED_CACHE_SLOT_SIZE", default=512, cast=int)  # type: ignore
+    SHARED_CACHE_WAYS: int = 4
+
+    IS_COMPRESSION_ENABLED: bool = decouple.config("IS_COMPRESSION_ENABLED", default=True, cast=bool)  # type: ignore
+    COMPRESSION_MINIMUM_SIZE: int = decouple.config("COMPRESSION_MINIMUM_SIZE", default=1024, cast=int)  # type: ignore
+    COMPRESSION_LEVELS: dict[str, int] = {"zstd": 3, "br": 4, "gzip": 6}
+    COMPRESSION_ROUTE_LEVELS: dict[str, dict[str, int]] = {}
 
     LOGGING_LEVEL: int = logging.INFO
     LOGGERS: tuple[str, str] = ("uvicorn.asgi", "uvicorn.access")
 
-    HASHING_ALGORITHM_LAYER_1: str = decouple.config("HASHING_ALGORITHM_LAYER_1", cast=str)  # type: ignore
-    HASHING_ALGORITHM_LAYER_2: str = decouple.config("HASHING_ALGORITHM_LAYER_2", cast=str)  # type: ignore
-    HASHING_SALT: str = decouple.config("HASHING_SALT", cast=str)  # type: ignore
+    HASHING_ALGORITHM_LAYER_2: str = decouple.config("HASHING_ALGORITHM_LAYER_2", default="argon2", cast=str)  # type: ignore
+    HASHING_ARGON2_TIME_COST: int = decouple.config("HASHING_ARGON2_TIME_COST", default=3, cast=int)  # type: ignore
+    HASHING_ARGON2_MEMORY_COST: int = decouple.config("HASHING_ARGON2_MEMORY_COST", default=65536, cast=int)  # type: ignore
+    HASHING_ARGON2_PARALLELISM: int = decouple.config("HASHING_ARGON2_PARALLELISM", default=4, cast=int)  # type: ignore
+    HASHING_WORKERS: int = decouple.config("HASHING_WORKERS", default=os.cpu_count() or 1, cast=int)  # type: ignore
     JWT_ALGORITHM: str = decouple.config("JWT_ALGORITHM", cast=str)  # type: ignore
 
     class Config(pydantic.BaseConfig):
@@ -77,6 +176,37 @@ class BackendBaseSettings(pydantic.BaseSettings):
         env_file: str = f"{str(ROOT_DIR)}/.env"
         validate_assignment: bool = True
 
+    @pydantic.root_validator(skip_on_failure=True)
+    def validate_sync_watermark_lag(cls, values: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        """
+        A transaction stamps its rows with the `now()` of its start but only commits up to `REQUEST_TIMEOUT` seconds
+        later, or one `DB_STATEMENT_TIMEOUT` later for the single-statement writes outside of a request. A shorter lag
+        would let a delta sync client move past those rows before they are visible and miss them for good.
+        """
+        longest_transaction = max(values["REQUEST_TIMEOUT"], values["DB_STATEMENT_TIMEOUT"] / 1000)
+
+        if values["SYNC_WATERMARK_LAG"] < longest_transaction:
+            raise ValueError(
+                f"SYNC_WATERMARK_LAG ({values['SYNC_WATERMARK_LAG']}s) must be at least the longest transaction"
+                f" ({longest_transaction}s, from REQUEST_TIMEOUT and DB_STATEMENT_TIMEOUT)!"
+            )
+
+        return values
+
+    @pydantic.root_validator(skip_on_failure=True)
+    def validate_db_connection_budget(cls, values: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        """
+        Every worker needs at least one connection, so a budget below `SERVER_WORKERS` could only be kept by workers
+        that cannot reach the database.
+        """
+        if 0 < values["DB_CONNECTION_BUDGET"] < values["SERVER_WORKERS"]:
+            raise ValueError(
+                f"DB_CONNECTION_BUDGET ({values['DB_CONNECTION_BUDGET']}) must be at least one connection per worker"
+                f" ({values['SERVER_WORKERS']} SERVER_WORKERS)!"
+            )
+
+        return values
+
     @property
     def set_backend_app_attributes(self) -> dict[str, str | bool | None]:
         """
@@ -93,3 +223,44 @@ class BackendBaseSettings(pydantic.BaseSettings):
             "openapi_prefix": self.OPENAPI_PREFIX,
             "api_prefix": self.API_PREFIX,
         }
+
+    @property
+    def set_db_pool_attributes(self) -> dict[str, int]:
+        """
+        Size the connection pool of a single worker process. When `DB_CONNECTION_BUDGET` is set, the budget is shared
+        by all `SERVER_WORKERS` in the same ratio as `DB_POOL_SIZE` to `DB_POOL_OVERFLOW`, so adding workers never adds
+        connections on the Postgres side.
+        """
+        if self.DB_CONNECTION_BUDGET <= 0:
+            return {"pool_size": self.DB_POOL_SIZE, "max_overflow": self.DB_POOL_OVERFLOW}
+
+        worker_budget = self.DB_CONNECTION_BUDGET // max(1, self.SERVER_WORKERS)
+        pool_size = max(1, worker_budget * self.DB_POOL_SIZE // max(1, self.DB_POOL_SIZE + self.DB_POOL_OVERFLOW))
+
+        return {"pool_size": pool_size, "max_overflow": max(0, worker_budget - pool_size)}
+
+    @property
+    def set_db_connect_args(self) -> dict[str, typing.Any]:
+        """
+        The asyncpg `connect()` arguments. `DB_PREPARED_STATEMENT_CACHE_SIZE` bounds the prepared statements asyncpg
+        keeps per connection, `DB_COMMAND_TIMEOUT` is the client-side timeout of every query, and the server settings
+        (`statement_timeout` in milliseconds, `jit` and `application_name`) apply to the whole session.
+
+        Behind a transaction-pooling proxy like PgBouncer, consecutive transactions can land on different server
+        connections, so both prepared statement caches are switched off. Such proxies also reject most startup
+        parameters, which leaves `application_name` as the only server setting.
+        """
+        connect_args: dict[str, typing.Any] = {"timeout": self.DB_TIMEOUT, "command_timeout": self.DB_COMMAND_TIMEOUT}
+
+        if self.IS_DB_PGBOUNCER_COMPATIBLE:
+            connect_args |= {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+            connect_args["server_settings"] = {"application_name": self.DB_APPLICATION_NAME}
+        else:
+            connect_args["prepared_statement_cache_size"] = self.DB_PREPARED_STATEMENT_CACHE_SIZE
+            connect_args["server_settings"] = {
+                "application_name": self.DB_APPLICATION_NAME,
+                "jit": "off",
+                "statement_timeout": str(self.DB_STATEMENT_TIMEOUT),
+            }
+
+        return connect_args
@@ -1,23 +1,72 @@
 import fastapi
-import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.endpoints import router as api_endpoint_router
+from src.api.middlewares.admission import adaptive_concurrency_limit, AdmissionControlMiddleware
+from src.api.middlewares.compression import CompressionMiddleware
+from src.api.middlewares.deadline import DeadlineMiddleware
+from src.api.middlewares.response_cache import response_cache, ResponseCacheMiddleware
 from src.config.events import execute_backend_server_event_handler, terminate_backend_server_event_handler
 from src.config.manager import settings
+from src.config.openapi import set_cached_openapi_schema
+from src.utilities.exceptions.http.handlers import register_database_timeout_handlers
 
 
 def initialize_backend_application() -> fastapi.FastAPI:
     app = fastapi.FastAPI(**settings.set_backend_app_attributes)  # type: ignore
 
+    app.add_middleware(
+        DeadlineMiddleware,
+        timeout=settings.REQUEST_TIMEOUT,
+        exempt_routes=[f"{settings.API_PREFIX}{route}" for route in settings.REQUEST_TIMEOUT_EXEMPT_ROUTES],
+    )
+
+    # Inside the response cache, so that only requests which actually reach the routes are limited and measured.
+    if settings.IS_ADMISSION_CONTROL_ENABLED:
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            limit=adaptive_concurrency_limit,
+            priority_shares=settings.ADMISSION_PRIORITY_SHARES,
+            route_priorities={
+                f"{settings.API_PREFIX}{route_prefix}": priority
+                for route_prefix, priority in settings.ADMISSION_ROUTE_PRIORITIES.items()
+            },
+            exempt_routes=[f"{settings.API_PREFIX}{route}" for route in settings.ADMISSION_EXEMPT_ROUTES],
+            retry_after=settings.ADMISSION_RETRY_AFTER,
+        )
+
+    # Registered before CORS so that CORS stays the outer layer and cached entries never carry origin-specific headers.
+    if settings.IS_RESPONSE_CACHE_ENABLED:
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            route_tags={
+                f"{settings.API_PREFIX}{route_prefix}": tag
+                for route_prefix, tag in settings.RESPONSE_CACHE_ROUTE_TAGS.items()
+            },
+            cache=response_cache,
+            excluded_routes=[f"{settings.API_PREFIX}{route}" for route in settings.RESPONSE_CACHE_EXCLUDED_ROUTES],
+        )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.ALLOWED_ORIGINS,
         allow_credentials=settings.IS_ALLOWED_CREDENTIALS,
         allow_methods=settings.ALLOWED_METHODS,
         allow_headers=settings.ALLOWED_HEADERS,
+        expose_headers=settings.EXPOSED_HEADERS,
     )
 
+    if settings.IS_COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            levels=settings.COMPRESSION_LEVELS,
+            route_levels={
+                f"{settings.API_PREFIX}{route_prefix}": levels
+                for route_prefix, levels in settings.COMPRESSION_ROUTE_LEVELS.items()
+            },
+        )
+
     app.add_event_handler(
         "startup",
         execute_backend_server_event_handler(backend_app=app),
@@ -27,19 +76,25 @@ def initialize_backend_application() -> fastapi.FastAPI:
         terminate_backend_server_event_handler(backend_app=app),
     )
 
+    register_database_timeout_handlers(backend_app=app)
     app.include_router(router=api_endpoint_router, prefix=settings.API_PREFIX)
 
+    if settings.IS_OPENAPI_SCHEMA_CACHED:
+        app.openapi = set_cached_openapi_schema(backend_app=app)  # type: ignore
+
     return app
 
 
 backend_app: fastapi.FastAPI = initialize_backend_application()
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         app="main:backend_app",
         host=settings.SERVER_HOST,
         port=settings.SERVER_PORT,
         reload=settings.DEBUG,
-        workers=settings.SERVER_WORKERS,
+        workers=None if settings.DEBUG else settings.SERVER_WORKERS,
         log_level=settings.LOGGING_LEVEL,
     )
@@ -1,10 +1,7 @@
 import datetime
 
 import sqlalchemy
-from sqlalchemy.orm import (
-    Mapped as SQLAlchemyMapped,
-    mapped_column as sqlalchemy_mapped_column,
-)
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.repository.table import Base
@@ -13,29 +10,23 @@ from src.repository.table import Base
 class Account(Base):  # type: ignore
     __tablename__ = "account"
 
-    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
-        primary_key=True, autoincrement="auto"
-    )
+    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
     username: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
         sqlalchemy.String(length=64), nullable=False, unique=True
     )
-    email: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
-        sqlalchemy.String(length=64), nullable=False, unique=True
-    )
-    _hashed_password: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
-        sqlalchemy.String(length=1024), nullable=True
-    )
-    _hash_salt: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
-        sqlalchemy.String(length=1024), nullable=True
-    )
-    is_verified: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(
-        sqlalchemy.Boolean, nullable=False, default=False
+    email: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False, unique=True)
+    _hashed_password: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=1024), nullable=True)
+    # Only set on legacy accounts, whose password was hashed together with a Bcrypt salt.
+    _hash_salt: SQLAlchemyMapped[str | None] = sqlalchemy_mapped_column(sqlalchemy.String(length=1024), nullable=True)
+    is_verified: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
+    is_active: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
+    is_logged_in: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(sqlalchemy.Boolean, nullable=False, default=False)
+    last_login_at: SQLAlchemyMapped[datetime.datetime | None] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
     )
-    is_active: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(
-        sqlalchemy.Boolean, nullable=False, default=False
-    )
-    is_logged_in: SQLAlchemyMapped[bool] = sqlalchemy_mapped_column(
-        sqlalchemy.Boolean, nullable=False, default=False
+    # When the written login state was recorded, so a flush never overwrites a newer state with an older one.
+    login_state_at: SQLAlchemyMapped[datetime.datetime | None] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
     )
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
@@ -48,6 +39,20 @@ class Account(Base):  # type: ignore
         server_onupdate=sqlalchemy.schema.FetchedValue(for_update=True),
     )
 
+    __table_args__ = (
+        sqlalchemy.Index(
+            "ix_account_created_at_active",
+            "created_at",
+            postgresql_where=sqlalchemy.text("is_active"),
+            info={"predicate": {"is_active": True}},
+        ),
+        sqlalchemy.Index(
+            "ix_account_created_at_verified",
+            "created_at",
+            postgresql_where=sqlalchemy.text("is_verified"),
+            info={"predicate": {"is_verified": True}},
+        ),
+    )
     __mapper_args__ = {"eager_defaults": True}
 
     @property
@@ -58,8 +63,16 @@ class Account(Base):  # type: ignore
         self._hashed_password = hashed_password
 
     @property
-    def hash_salt(self) -> str:
+    def hash_salt(self) -> str | None:
         return self._hash_salt
 
-    def set_hash_salt(self, hash_salt: str) -> None:
+    def set_hash_salt(self, hash_salt: str | None) -> None:
         self._hash_salt = hash_salt
+
+
+# Delta sync walks rows in `(last modified, id)` order, where the last modification falls back to the creation time.
+sqlalchemy.Index(
+    "ix_account_last_modified_id",
+    sqlalchemy.func.coalesce(Account.updated_at, Account.created_at),
+    Account.id,
+)
@@ -1,10 +1,7 @@
 import datetime
 
 import sqlalchemy
-from sqlalchemy.orm import (
-    Mapped as SQLAlchemyMapped,
-    mapped_column as sqlalchemy_mapped_column,
-)
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.repository.table import Base
@@ -13,12 +10,8 @@ from src.repository.table import Base
 class Author(Base):  # type: ignore
     __tablename__ = "author"
 
-    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
-        primary_key=True, autoincrement="auto"
-    )
-    name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
-        sqlalchemy.String(length=64), nullable=False, unique=True
-    )
+    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
+    name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False, unique=True)
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
         nullable=False,
@@ -31,3 +24,11 @@ class Author(Base):  # type: ignore
     )
 
     __mapper_args__ = {"eager_defaults": True}
+
+
+# Delta sync walks rows in `(last modified, id)` order, where the last modification falls back to the creation time.
+sqlalchemy.Index(
+    "ix_author_last_modified_id",
+    sqlalchemy.func.coalesce(Author.updated_at, Author.created_at),
+    Author.id,
+)
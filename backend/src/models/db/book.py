@@ -1,11 +1,8 @@
 import datetime
 
 import sqlalchemy
-from sqlalchemy.orm import (
-    Mapped as SQLAlchemyMapped,
-    mapped_column as sqlalchemy_mapped_column,
-)
 from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
 from src.repository.table import Base
@@ -14,13 +11,9 @@ from src.repository.table import Base
 class Book(Base):  # type: ignore
     __tablename__ = "book"
 
-    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
-        primary_key=True, autoincrement="auto"
-    )
-    name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(
-        sqlalchemy.String(length=64), nullable=False, unique=True
-    )
-    author_id = sqlalchemy_mapped_column(ForeignKey("author.id"))
+    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(primary_key=True, autoincrement="auto")
+    name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False, unique=True)
+    author_id = sqlalchemy_mapped_column(ForeignKey("author.id"), index=True)
     created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
         sqlalchemy.DateTime(timezone=True),
         nullable=False,
@@ -33,3 +26,11 @@ class Book(Base):  # type: ignore
     )
 
     __mapper_args__ = {"eager_defaults": True}
+
+
+# Delta sync walks rows in `(last modified, id)` order, where the last modification falls back to the creation time.
+sqlalchemy.Index(
+    "ix_book_last_modified_id",
+    sqlalchemy.func.coalesce(Book.updated_at, Book.created_at),
+    Book.id,
+)
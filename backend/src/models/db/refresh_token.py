@@ -0,0 +1,29 @@
+import datetime
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.repository.table import Base
+
+
+class RefreshToken(Base):  # type: ignore
+    __tablename__ = "refresh_token"
+
+    id: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=32), primary_key=True)
+    # Every token that was rotated out of the same signin shares its family, so a replayed token revokes them all.
+    family: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=32), nullable=False, index=True)
+    account_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(
+        sqlalchemy.ForeignKey("account.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    expires_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False
+    )
+    revoked_at: SQLAlchemyMapped[datetime.datetime | None] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=True
+    )
+    created_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy_functions.now(),
+    )
@@ -0,0 +1,23 @@
+import datetime
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.repository.table import Base
+
+
+class RevokedToken(Base):  # type: ignore
+    __tablename__ = "revoked_token"
+
+    # The SHA-256 digest of the access token, the token itself is never stored.
+    digest: SQLAlchemyMapped[bytes] = sqlalchemy_mapped_column(sqlalchemy.LargeBinary(length=32), primary_key=True)
+    expires_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True), nullable=False, index=True
+    )
+    revoked_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        server_default=sqlalchemy_functions.now(),
+    )
@@ -0,0 +1,22 @@
+import datetime
+
+import sqlalchemy
+from sqlalchemy.orm import Mapped as SQLAlchemyMapped, mapped_column as sqlalchemy_mapped_column
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.repository.table import Base
+
+
+class Tombstone(Base):  # type: ignore
+    __tablename__ = "tombstone"
+
+    id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.BigInteger, primary_key=True, autoincrement="auto")
+    table_name: SQLAlchemyMapped[str] = sqlalchemy_mapped_column(sqlalchemy.String(length=64), nullable=False)
+    entity_id: SQLAlchemyMapped[int] = sqlalchemy_mapped_column(sqlalchemy.Integer, nullable=False)
+    deleted_at: SQLAlchemyMapped[datetime.datetime] = sqlalchemy_mapped_column(
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy_functions.now(),
+    )
+
+    __table_args__ = (sqlalchemy.Index("ix_tombstone_table_name_deleted_at_id", "table_name", "deleted_at", "id"),)
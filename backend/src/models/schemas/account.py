@@ -2,6 +2,7 @@ import datetime
 
 import pydantic
 
+from src.config.manager import settings
 from src.models.schemas.base import BaseSchemaModel
 
 
@@ -23,8 +24,18 @@ class AccountInLogin(BaseSchemaModel):
     password: str
 
 
+class AccountsInBulkCreate(BaseSchemaModel):
+    accounts: pydantic.conlist(AccountInCreate, min_items=1, max_items=settings.BULK_PROVISIONING_MAX_ACCOUNTS)  # type: ignore
+
+
+class AccountInRefresh(BaseSchemaModel):
+    refresh_token: str
+
+
 class AccountWithToken(BaseSchemaModel):
-    token: str
+    # Only signup and signin hand out tokens, the account routes never do.
+    token: str | None = None
+    refresh_token: str | None = None
     username: str
     email: pydantic.EmailStr
     is_verified: bool
@@ -37,3 +48,33 @@ class AccountWithToken(BaseSchemaModel):
 class AccountInResponse(BaseSchemaModel):
     id: int
     authorized_account: AccountWithToken
+
+
+class AccountTokensInResponse(BaseSchemaModel):
+    token: str
+    refresh_token: str
+
+
+class AccountAvailabilityInResponse(BaseSchemaModel):
+    username: bool | None = None
+    email: bool | None = None
+
+
+class AccountInBulkResult(BaseSchemaModel):
+    index: int
+    username: str
+    id: int | None = None
+    error: str | None = None
+
+
+class AccountsInBulkResponse(BaseSchemaModel):
+    created_count: int
+    failed_count: int
+    results: list[AccountInBulkResult]
+
+
+class AccountChangesInResponse(BaseSchemaModel):
+    upserted: list[AccountInResponse]
+    deleted: list[int]
+    watermark: str
+    has_more: bool
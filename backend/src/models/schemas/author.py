@@ -16,3 +16,10 @@ class AuthorInUpdate(BaseSchemaModel):
 class AuthorInResponse(BaseSchemaModel):
     id: int
     name: str
+
+
+class AuthorChangesInResponse(BaseSchemaModel):
+    upserted: list[AuthorInResponse]
+    deleted: list[int]
+    watermark: str
+    has_more: bool
@@ -0,0 +1,29 @@
+import typing
+
+import pydantic
+
+from src.config.manager import settings
+from src.models.schemas.base import BaseSchemaModel
+
+
+class SubRequestInBatch(BaseSchemaModel):
+    id: str | None = None
+    method: typing.Literal["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str
+    headers: dict[str, str] = dict()
+    body: typing.Any = None
+
+
+class BatchInRequest(BaseSchemaModel):
+    requests: pydantic.conlist(SubRequestInBatch, min_items=1, max_items=settings.BATCH_MAX_REQUESTS)  # type: ignore
+
+
+class SubResponseInBatch(BaseSchemaModel):
+    id: str | None
+    status: int
+    headers: dict[str, str]
+    body: typing.Any
+
+
+class BatchInResponse(BaseSchemaModel):
+    responses: list[SubResponseInBatch]
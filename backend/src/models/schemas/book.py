@@ -19,3 +19,10 @@ class BookInResponse(BaseSchemaModel):
     id: int
     name: str
     author_id: int
+
+
+class BookChangesInResponse(BaseSchemaModel):
+    upserted: list[BookInResponse]
+    deleted: list[int]
+    watermark: str
+    has_more: bool
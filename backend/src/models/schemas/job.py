@@ -0,0 +1,13 @@
+from src.models.schemas.base import BaseSchemaModel
+
+
+class JobMetricsInResponse(BaseSchemaModel):
+    queue_depth: int
+    max_queue_size: int
+    in_flight: int
+    worker_count: int
+    submitted: int
+    completed: int
+    retried: int
+    failed: int
+    rejected: int
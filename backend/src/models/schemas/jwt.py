@@ -1,4 +1,5 @@
 import datetime
+import typing
 
 import pydantic
 
@@ -11,3 +12,8 @@ class JWToken(pydantic.BaseModel):
 class JWTAccount(pydantic.BaseModel):
     username: str
     email: pydantic.EmailStr
+
+
+class JWTRefreshToken(pydantic.BaseModel):
+    jti: str
+    token_type: typing.Literal["refresh"] = "refresh"
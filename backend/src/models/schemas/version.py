@@ -0,0 +1,9 @@
+import datetime
+
+import pydantic
+
+
+class ResourceVersion(pydantic.BaseModel):
+    identity: str
+    last_modified: datetime.datetime | None
+    is_settled: bool = True
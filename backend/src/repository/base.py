@@ -1,2 +1,5 @@
 from src.models.db.account import Account
+from src.models.db.refresh_token import RefreshToken
+from src.models.db.revoked_token import RevokedToken
+from src.models.db.tombstone import Tombstone
 from src.repository.table import Base
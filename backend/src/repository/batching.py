@@ -0,0 +1,159 @@
+"""
+Group commit for single-row inserts. Concurrent `create_*` calls are collected for at most `max_delay` seconds or
+`max_batch_size` rows, written with one multi-row `INSERT ... RETURNING` and committed together, so hundreds of
+requests share one transaction (and one WAL flush) instead of paying for their own.
+"""
+
+import asyncio
+import json
+import typing
+
+import loguru
+import sqlalchemy
+import sqlalchemy.exc
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.config.manager import settings
+from src.repository.database import async_db
+
+PendingInsert = tuple[dict[str, typing.Any], asyncio.Future]
+
+
+class InsertBatcher:
+    def __init__(self, table: typing.Any, max_batch_size: int, max_delay: float):
+        self.table = table
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: list[PendingInsert] = list()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def insert(self, values: dict[str, typing.Any]) -> typing.Any:
+        """
+        Queue one row and wait for its batch. Resolves with a detached instance of `table`, or raises the error of
+        this very row.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((values, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._start_flush)
+
+        return await future
+
+    async def drain(self) -> None:
+        self._start_flush()
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, list()
+
+        if batch:
+            flush = asyncio.create_task(self._flush(batch=batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[PendingInsert]) -> None:
+        try:
+            try:
+                async with async_db.async_engine.begin() as connection:
+                    results: list[typing.Any] = await self._insert_rows(connection=connection, batch=batch)
+
+            except sqlalchemy.exc.DBAPIError:
+                if len(batch) == 1:
+                    raise
+
+                # One bad row aborts the whole statement, so retry row by row and give every caller its own outcome.
+                async with async_db.async_engine.begin() as connection:
+                    results = await self._insert_rows_one_by_one(connection=connection, batch=batch)
+
+        except Exception as flush_error:
+            loguru.logger.warning(
+                f"Insert Batching --- A batch of {len(batch)} {self.table.__tablename__} rows failed"
+            )
+            results = [flush_error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(self.table(**result._mapping))
+
+    async def _insert_rows(self, connection: AsyncConnection, batch: list[PendingInsert]) -> list[typing.Any]:
+        """
+        Postgres assigns the serial ids in `VALUES` order, but does not promise to return the rows in that order, so
+        they are matched to their callers by sorting on the id.
+        """
+        stmt = (
+            sqlalchemy.insert(self.table.__table__)
+            .values([values for values, _ in batch])
+            .returning(*self.table.__table__.columns)
+        )
+        query = await connection.execute(stmt)
+        rows = sorted(query.all(), key=lambda row: row.id)
+        await self._notify_creates(connection=connection, ids=[row.id for row in rows])
+
+        return rows
+
+    async def _insert_rows_one_by_one(
+        self, connection: AsyncConnection, batch: list[PendingInsert]
+    ) -> list[typing.Any]:
+        results: list[typing.Any] = list()
+
+        for values, _ in batch:
+            try:
+                async with connection.begin_nested():
+                    stmt = sqlalchemy.insert(self.table.__table__).values(**values)
+                    query = await connection.execute(stmt.returning(*self.table.__table__.columns))
+                    results.append(query.one())
+
+            except sqlalchemy.exc.DBAPIError as insert_error:
+                results.append(insert_error)
+
+        inserted_ids = [result.id for result in results if not isinstance(result, Exception)]
+        await self._notify_creates(connection=connection, ids=inserted_ids)
+
+        return results
+
+    async def _notify_creates(self, connection: AsyncConnection, ids: list[int]) -> None:
+        """
+        The same `pg_notify` per row as `BaseCRUDRepository._notify_change`, in a single statement.
+        """
+        if not settings.IS_EVENT_STREAM_ENABLED or not ids:
+            return
+
+        resource = f"{self.table.__tablename__}s"
+        payloads = [json.dumps({"resource": resource, "action": "create", "id": id}) for id in ids]
+        stmt = sqlalchemy.text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload")
+        await connection.execute(stmt, {"channel": settings.EVENT_STREAM_CHANNEL, "payloads": payloads})
+
+
+insert_batchers: dict[str, InsertBatcher] = dict()
+
+
+def get_insert_batcher(table: typing.Any) -> InsertBatcher:
+    if table.__tablename__ not in insert_batchers:
+        insert_batchers[table.__tablename__] = InsertBatcher(
+            table=table,
+            max_batch_size=settings.WRITE_BATCH_MAX_SIZE,
+            max_delay=settings.WRITE_BATCH_MAX_DELAY_MS / 1000,
+        )
+
+    return insert_batchers[table.__tablename__]
+
+
+async def drain_insert_batchers() -> None:
+    for insert_batcher in insert_batchers.values():
+        await insert_batcher.drain()
@@ -0,0 +1,137 @@
+"""
+In-memory Bloom filters of the usernames and emails in the `account` table. A filter never forgets a value it was
+given, so a miss means the value is definitely not taken and the unique index does not have to be asked. A hit may be
+a false positive (about `error_rate` of them, or a renamed or deleted account), which the database settles.
+
+Every worker streams the table once at startup and adds the accounts it creates or updates itself. The accounts that
+other workers created or updated are read before a lookup, at most once per `sync_interval` seconds, so a miss can be
+up to `sync_interval` seconds stale. The unique index stays the final word on `INSERT`.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import math
+import time
+
+import loguru
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.repository.database import async_db
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / max(1, capacity) * math.log(2)))
+        self._bits = bytearray(math.ceil(self.bit_count / 8))
+
+    def _positions(self, value: str) -> list[int]:
+        """
+        Derive all `hash_count` positions from the two halves of one digest (Kirsch-Mitzenmacher double hashing).
+        """
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first_hash, second_hash = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first_hash + index * second_hash) % self.bit_count for index in range(self.hash_count)]
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+
+
+class AccountFilter:
+    def __init__(self, capacity: int, error_rate: float, sync_interval: float, sync_lag: float):
+        self.usernames = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self.emails = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self.sync_interval = sync_interval
+        self.sync_lag = sync_lag
+        self.is_loaded = False
+        self._synced_at: float | None = None
+        self._watermark: datetime.datetime | None = None
+        self._sync_lock: asyncio.Lock | None = None
+
+    async def load(self, connection: AsyncConnection) -> None:
+        self.usernames.clear()
+        self.emails.clear()
+        account_count = 0
+
+        started_at = time.monotonic()
+        loaded_until = (await connection.execute(sqlalchemy.select(sqlalchemy.func.now()))).scalar_one()
+        stmt = sqlalchemy.select(Account.username, Account.email).execution_options(yield_per=10000)
+        result = await connection.stream(statement=stmt)
+
+        async for username, email in result:
+            self.add(username=username, email=email)
+            account_count += 1
+
+        self._watermark = loaded_until - datetime.timedelta(seconds=self.sync_lag)
+        self._synced_at = started_at
+        self.is_loaded = True
+        loguru.logger.info(f"Account Filter --- Loaded {account_count} accounts")
+
+    def _is_synced(self) -> bool:
+        return self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval
+
+    async def synchronize(self) -> None:
+        """
+        Add the accounts created or updated since the last look, by any worker. Like the delta sync, the look starts
+        `sync_lag` seconds early, so a transaction that commits after a later one started is not missed.
+        """
+        if not self.is_loaded or self._is_synced():
+            return
+
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+
+        async with self._sync_lock:
+            if self._is_synced():
+                return
+
+            started_at = time.monotonic()
+            stmt = sqlalchemy.select(Account.username, Account.email).where(
+                sqlalchemy.func.coalesce(Account.updated_at, Account.created_at) >= self._watermark
+            )
+
+            async with async_db.async_engine.connect() as connection:
+                synced_until = (await connection.execute(sqlalchemy.select(sqlalchemy.func.now()))).scalar_one()
+                query = await connection.execute(statement=stmt)
+
+                for username, email in query:
+                    self.add(username=username, email=email)
+
+            self._watermark = synced_until - datetime.timedelta(seconds=self.sync_lag)
+            self._synced_at = started_at
+
+    def add(self, username: str | None = None, email: str | None = None) -> None:
+        if username:
+            self.usernames.add(username)
+
+        if email:
+            self.emails.add(email)
+
+    def is_username_possibly_taken(self, username: str) -> bool:
+        return not self.is_loaded or username in self.usernames
+
+    def is_email_possibly_taken(self, email: str) -> bool:
+        return not self.is_loaded or email in self.emails
+
+
+def get_account_filter() -> AccountFilter:
+    return AccountFilter(
+        capacity=settings.ACCOUNT_FILTER_CAPACITY,
+        error_rate=settings.ACCOUNT_FILTER_ERROR_RATE,
+        sync_interval=settings.ACCOUNT_FILTER_SYNC_INTERVAL_MS / 1000,
+        sync_lag=settings.SYNC_WATERMARK_LAG,
+    )
+
+
+account_filter: AccountFilter = get_account_filter()
@@ -0,0 +1,63 @@
+"""
+Watermarks for the delta sync endpoints (`GET /<resource>/changes?since=<watermark>`).
+
+A watermark remembers the `(last modified, id)` position of the last upserted row and the `(deleted at, id)` position
+of the last tombstone that were handed out. It is encoded as URL-safe base64 so clients treat it as an opaque token.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+import typing
+
+import pydantic
+
+from src.utilities.exceptions.database import InvalidQueryExpression
+
+WATERMARK_VERSION = 1
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class ChangeWatermark(pydantic.BaseModel):
+    modified_at: datetime.datetime = EPOCH
+    modified_id: int = 0
+    deleted_at: datetime.datetime = EPOCH
+    deleted_id: int = 0
+
+
+class ChangeSet(typing.NamedTuple):
+    upserted: typing.Sequence[typing.Any]
+    deleted: list[int]
+    watermark: ChangeWatermark
+    has_more: bool
+
+
+def encode_watermark(watermark: ChangeWatermark) -> str:
+    payload = [
+        WATERMARK_VERSION,
+        watermark.modified_at.isoformat(),
+        watermark.modified_id,
+        watermark.deleted_at.isoformat(),
+        watermark.deleted_id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_watermark(token: str | None) -> ChangeWatermark:
+    if not token:
+        return ChangeWatermark()
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        version, modified_at, modified_id, deleted_at, deleted_id = payload
+
+        if version != WATERMARK_VERSION:
+            raise ValueError(version)
+
+        return ChangeWatermark(
+            modified_at=modified_at, modified_id=modified_id, deleted_at=deleted_at, deleted_id=deleted_id
+        )
+
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidQueryExpression(f"Watermark `{token}` is not valid, start over without `since`!")
@@ -0,0 +1,51 @@
+import collections
+import time
+import typing
+
+from src.config.manager import settings
+
+CountMethod = typing.Literal["exact", "estimated", "none"]
+
+
+class CountCache:
+    """
+    Exact totals are a full scan of the matching rows, so each one is reused for `ttl` seconds per table and filter
+    set.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[tuple[str, ...], tuple[float, int]] = collections.OrderedDict()
+
+    def get(self, key: tuple[str, ...]) -> int | None:
+        item = self._entries.get(key)
+
+        if not item:
+            return None
+
+        if item[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        return item[1]
+
+    def set(self, key: tuple[str, ...], count: int) -> None:
+        if self.ttl <= 0:
+            return
+
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, count)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def get_count_cache() -> CountCache:
+    return CountCache(ttl=settings.COUNT_CACHE_TTL, max_entries=settings.COUNT_CACHE_MAX_ENTRIES)
+
+
+count_cache: CountCache = get_count_cache()
@@ -1,69 +1,217 @@
 import typing
 
 import sqlalchemy
+import sqlalchemy.exc
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
+from src.config.manager import settings
 from src.models.db.account import Account
-from src.models.schemas.account import AccountInCreate, AccountInLogin, AccountInUpdate
-from src.repository.crud.base import BaseCRUDRepository
+from src.models.db.refresh_token import RefreshToken
+from src.models.schemas.account import AccountInBulkResult, AccountInCreate, AccountInLogin, AccountInUpdate
+from src.models.schemas.version import ResourceVersion
+from src.repository.bloom import account_filter
+from src.repository.changes import ChangeSet, ChangeWatermark
+from src.repository.count import CountMethod
+from src.repository.crud.base import BaseCRUDRepository, lambda_stmt
+from src.repository.database import async_db
+from src.repository.query import apply_list_query, EQUALITY_OPERATORS, RANGE_OPERATORS
 from src.securities.hashing.password import pwd_generator
 from src.securities.verifications.credentials import credential_verifier
 from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 from src.utilities.exceptions.password import PasswordDoesNotMatch
+from src.utilities.jobs import job_runner
 
 
 class AccountCRUDRepository(BaseCRUDRepository):
+    filterable_fields = {
+        "id": RANGE_OPERATORS,
+        "username": EQUALITY_OPERATORS,
+        "email": EQUALITY_OPERATORS,
+        "is_verified": ("eq",),
+        "is_active": ("eq",),
+        "is_logged_in": ("eq",),
+        "created_at": RANGE_OPERATORS,
+    }
+
     async def create_account(self, account_create: AccountInCreate) -> Account:
-        new_account = Account(username=account_create.username, email=account_create.email, is_logged_in=True)
+        new_account = Account(
+            username=account_create.username,
+            email=account_create.email,
+            is_logged_in=True,
+            last_login_at=sqlalchemy_functions.now(),
+            login_state_at=sqlalchemy_functions.now(),
+        )
 
-        new_account.set_hash_salt(hash_salt=pwd_generator.generate_salt)
         new_account.set_hashed_password(
-            hashed_password=pwd_generator.generate_hashed_password(
-                hash_salt=new_account.hash_salt, new_password=account_create.password
-            )
+            hashed_password=pwd_generator.generate_hashed_password(new_password=account_create.password)
         )
 
         self.async_session.add(instance=new_account)
-        await self.async_session.commit()
+
+        # The availability checks may have passed on another worker's stale filter, or raced with another signup.
+        try:
+            await self._commit()
+
+        except sqlalchemy.exc.IntegrityError as integrity_error:
+            raise EntityAlreadyExists("The username or email is already taken!") from integrity_error
+
+        account_filter.add(username=new_account.username, email=new_account.email)
         await self.async_session.refresh(instance=new_account)
 
         return new_account
 
-    async def read_accounts(self) -> typing.Sequence[Account]:
-        stmt = sqlalchemy.select(Account)
+    async def create_accounts_in_bulk(
+        self, accounts_create: typing.Sequence[AccountInCreate]
+    ) -> list[AccountInBulkResult]:
+        """
+        Provision many accounts in batches of `BULK_PROVISIONING_BATCH_SIZE`, each committed on its own so a long run
+        never holds one huge transaction. Every account gets its own result: its new id, or why it was skipped.
+        """
+        results = [
+            AccountInBulkResult(index=index, username=account_create.username)
+            for index, account_create in enumerate(accounts_create)
+        ]
+        pending: list[tuple[AccountInBulkResult, AccountInCreate]] = list()
+        usernames, emails = set(), set()
+
+        for result, account_create in zip(results, accounts_create):
+            if account_create.username in usernames or account_create.email in emails:
+                result.error = "The username or email appears more than once in the request!"
+                continue
+
+            usernames.add(account_create.username)
+            emails.add(account_create.email)
+            pending.append((result, account_create))
+
+        for start in range(0, len(pending), settings.BULK_PROVISIONING_BATCH_SIZE):
+            await self._create_accounts_batch(batch=pending[start : start + settings.BULK_PROVISIONING_BATCH_SIZE])
+
+        return results
+
+    async def _create_accounts_batch(self, batch: list[tuple[AccountInBulkResult, AccountInCreate]]) -> None:
+        """
+        Taken usernames and emails are looked up first, so no password is hashed for an account that cannot be
+        inserted. `ON CONFLICT DO NOTHING` then covers the accounts that were signed up in the meantime.
+        """
+        usernames = [account_create.username for _, account_create in batch]
+        emails = [account_create.email for _, account_create in batch]
+        taken_stmt = sqlalchemy.select(Account.username, Account.email).where(
+            sqlalchemy.or_(Account.username.in_(usernames), Account.email.in_(emails))
+        )
+
+        async with async_db.async_engine.connect() as connection:
+            taken_rows = (await connection.execute(statement=taken_stmt)).all()
+
+        taken_usernames, taken_emails = {row.username for row in taken_rows}, {row.email for row in taken_rows}
+        fresh_batch: list[tuple[AccountInBulkResult, AccountInCreate]] = list()
+
+        for result, account_create in batch:
+            if account_create.username in taken_usernames or account_create.email in taken_emails:
+                result.error = "The username or email is already taken!"
+            else:
+                fresh_batch.append((result, account_create))
+
+        if not fresh_batch:
+            return
+
+        hashed_passwords = await pwd_generator.generate_hashed_passwords(
+            new_passwords=[account_create.password for _, account_create in fresh_batch]
+        )
+        insert_stmt = (
+            postgresql.insert(Account)
+            .values(
+                [
+                    {
+                        "username": account_create.username,
+                        "email": account_create.email,
+                        "_hashed_password": hashed_password,
+                    }
+                    for (_, account_create), hashed_password in zip(fresh_batch, hashed_passwords)
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(Account.id, Account.username)
+        )
+
+        async with async_db.async_engine.begin() as connection:
+            ids_by_username = {row.username: row.id for row in (await connection.execute(statement=insert_stmt)).all()}
+
+        for result, account_create in fresh_batch:
+            result.id = ids_by_username.get(account_create.username)
+
+            if result.id is None:
+                result.error = "The username or email is already taken!"
+            else:
+                account_filter.add(username=account_create.username, email=account_create.email)
+
+    async def read_accounts(
+        self,
+        filters: typing.Iterable[str] | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> typing.Sequence[Account]:
+        stmt = apply_list_query(
+            stmt=sqlalchemy.select(Account),
+            table=Account,
+            filterable_fields=self.filterable_fields,
+            raw_filters=filters,
+            raw_sort=sort,
+            limit=limit,
+            offset=offset,
+        )
         query = await self.async_session.execute(statement=stmt)
         return query.scalars().all()
 
+    async def count_accounts(
+        self, filters: typing.Iterable[str] | None = None, method: CountMethod = "exact"
+    ) -> int | None:
+        return await self._count_rows(table=Account, raw_filters=filters, method=method)
+
+    async def read_accounts_changes(self, watermark: ChangeWatermark, limit: int) -> ChangeSet:
+        return await self._read_changes(table=Account, watermark=watermark, limit=limit)
+
+    async def read_accounts_version(self) -> ResourceVersion:
+        return await self._read_collection_version(table=Account)
+
+    async def read_account_version_by_id(self, id: int) -> ResourceVersion:
+        return await self._read_version_by_id(table=Account, id=id)
+
     async def read_account_by_id(self, id: int) -> Account:
-        stmt = sqlalchemy.select(Account).where(Account.id == id)
+        stmt = lambda_stmt(lambda: sqlalchemy.select(Account).where(Account.id == id))
         query = await self.async_session.execute(statement=stmt)
+        db_account = query.scalar()
 
-        if not query:
-            raise EntityDoesNotExist("Account with id `{id}` does not exist!")
+        if not db_account:
+            raise EntityDoesNotExist(f"Account with id `{id}` does not exist!")
 
-        return query.scalar()  # type: ignore
+        return db_account  # type: ignore
 
     async def read_account_by_username(self, username: str) -> Account:
-        stmt = sqlalchemy.select(Account).where(Account.username == username)
+        stmt = lambda_stmt(lambda: sqlalchemy.select(Account).where(Account.username == username))
         query = await self.async_session.execute(statement=stmt)
+        db_account = query.scalar()
 
-        if not query:
-            raise EntityDoesNotExist("Account with username `{username}` does not exist!")
+        if not db_account:
+            raise EntityDoesNotExist(f"Account with username `{username}` does not exist!")
 
-        return query.scalar()  # type: ignore
+        return db_account  # type: ignore
 
     async def read_account_by_email(self, email: str) -> Account:
-        stmt = sqlalchemy.select(Account).where(Account.email == email)
+        stmt = lambda_stmt(lambda: sqlalchemy.select(Account).where(Account.email == email))
         query = await self.async_session.execute(statement=stmt)
+        db_account = query.scalar()
 
-        if not query:
-            raise EntityDoesNotExist("Account with email `{email}` does not exist!")
+        if not db_account:
+            raise EntityDoesNotExist(f"Account with email `{email}` does not exist!")
 
-        return query.scalar()  # type: ignore
+        return db_account  # type: ignore
 
     async def read_user_by_password_authentication(self, account_login: AccountInLogin) -> Account:
-        stmt = sqlalchemy.select(Account).where(
-            Account.username == account_login.username, Account.email == account_login.email
+        username, email = account_login.username, account_login.email
+        stmt = lambda_stmt(
+            lambda: sqlalchemy.select(Account).where(Account.username == username, Account.email == email)
         )
         query = await self.async_session.execute(statement=stmt)
         db_account = query.scalar()
@@ -74,12 +222,39 @@ class AccountCRUDRepository(BaseCRUDRepository):
         if not pwd_generator.is_password_authenticated(hash_salt=db_account.hash_salt, password=account_login.password, hashed_password=db_account.hashed_password):  # type: ignore
             raise PasswordDoesNotMatch("Password does not match!")
 
+        # The plain password is only at hand on a successful login, so legacy two-layer hashes and hashes with
+        # outdated cost parameters are upgraded here. The new hash is computed on the hashing threads, so the plain
+        # password never leaves the request, and only the write is left to a background job.
+        if pwd_generator.is_rehash_needed(hash_salt=db_account.hash_salt, hashed_password=db_account.hashed_password):
+            (hashed_password,) = await pwd_generator.generate_hashed_passwords(new_passwords=[account_login.password])
+            job_runner.submit(
+                self.rehash_account_password,
+                id=db_account.id,
+                outdated_hashed_password=db_account.hashed_password,
+                hashed_password=hashed_password,
+            )
+
         return db_account  # type: ignore
 
+    @staticmethod
+    async def rehash_account_password(id: int, outdated_hashed_password: str, hashed_password: str) -> None:
+        """
+        A background job, so it commits on a connection of its own. The update is skipped if the password changed in
+        the meantime.
+        """
+        stmt = (
+            sqlalchemy.update(table=Account)
+            .where(Account.id == id, Account._hashed_password == outdated_hashed_password)
+            .values({Account._hashed_password: hashed_password, Account._hash_salt: None})
+        )
+
+        async with async_db.async_engine.begin() as connection:
+            await connection.execute(statement=stmt)
+
     async def update_account_by_id(self, id: int, account_update: AccountInUpdate) -> Account:
         new_account_data = account_update.dict()
 
-        select_stmt = sqlalchemy.select(Account).where(Account.id == id)
+        select_stmt = lambda_stmt(lambda: sqlalchemy.select(Account).where(Account.id == id))
         query = await self.async_session.execute(statement=select_stmt)
         update_account = query.scalar()
 
@@ -92,35 +267,56 @@ class AccountCRUDRepository(BaseCRUDRepository):
             update_stmt = update_stmt.values(username=new_account_data["username"])
 
         if new_account_data["email"]:
-            update_stmt = update_stmt.values(username=new_account_data["email"])
+            update_stmt = update_stmt.values(email=new_account_data["email"])
 
         if new_account_data["password"]:
-            update_account.set_hash_salt(hash_salt=pwd_generator.generate_salt)  # type: ignore
-            update_account.set_hashed_password(hashed_password=pwd_generator.generate_hashed_password(hash_salt=update_account.hash_salt, new_password=new_account_data["password"]))  # type: ignore
+            update_account.set_hash_salt(hash_salt=None)  # type: ignore
+            update_account.set_hashed_password(hashed_password=pwd_generator.generate_hashed_password(new_password=new_account_data["password"]))  # type: ignore
+            # A new password signs the account out of every session that could still refresh its access token.
+            await self.async_session.execute(
+                statement=sqlalchemy.update(table=RefreshToken)
+                .where(RefreshToken.account_id == update_account.id, RefreshToken.revoked_at.is_(None))
+                .values(revoked_at=sqlalchemy_functions.now())
+            )
 
-        await self.async_session.execute(statement=update_stmt)
-        await self.async_session.commit()
+        # The new username or email may belong to another account, which only the unique index knows for sure.
+        try:
+            await self.async_session.execute(statement=update_stmt)
+            await self._commit()
+
+        except sqlalchemy.exc.IntegrityError as integrity_error:
+            raise EntityAlreadyExists("The username or email is already taken!") from integrity_error
+
+        account_filter.add(username=new_account_data["username"], email=new_account_data["email"])
         await self.async_session.refresh(instance=update_account)
 
         return update_account  # type: ignore
 
     async def delete_account_by_id(self, id: int) -> str:
-        select_stmt = sqlalchemy.select(Account).where(Account.id == id)
+        select_stmt = lambda_stmt(lambda: sqlalchemy.select(Account).where(Account.id == id))
         query = await self.async_session.execute(statement=select_stmt)
         delete_account = query.scalar()
 
         if not delete_account:
             raise EntityDoesNotExist(f"Account with id `{id}` does not exist!")  # type: ignore
 
-        stmt = sqlalchemy.delete(table=Account).where(Account.id == delete_account.id)
+        stmt = lambda_stmt(lambda: sqlalchemy.delete(table=Account).where(Account.id == id))
 
         await self.async_session.execute(statement=stmt)
-        await self.async_session.commit()
+        self._add_tombstone(table=Account, id=delete_account.id)
+        await self._commit()
 
         return f"Account with id '{id}' is successfully deleted!"
 
     async def is_username_taken(self, username: str) -> bool:
-        username_stmt = sqlalchemy.select(Account.username).select_from(Account).where(Account.username == username)
+        await account_filter.synchronize()
+
+        if not account_filter.is_username_possibly_taken(username=username):
+            return True
+
+        username_stmt = lambda_stmt(
+            lambda: sqlalchemy.select(Account.username).select_from(Account).where(Account.username == username)
+        )
         username_query = await self.async_session.execute(username_stmt)
         db_username = username_query.scalar()
 
@@ -130,7 +326,14 @@ class AccountCRUDRepository(BaseCRUDRepository):
         return True
 
     async def is_email_taken(self, email: str) -> bool:
-        email_stmt = sqlalchemy.select(Account.email).select_from(Account).where(Account.email == email)
+        await account_filter.synchronize()
+
+        if not account_filter.is_email_possibly_taken(email=email):
+            return True
+
+        email_stmt = lambda_stmt(
+            lambda: sqlalchemy.select(Account.email).select_from(Account).where(Account.email == email)
+        )
         email_query = await self.async_session.execute(email_stmt)
         db_email = email_query.scalar()
 
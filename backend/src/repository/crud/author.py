@@ -4,37 +4,77 @@ import sqlalchemy
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
+from src.config.manager import settings
 from src.models.db.author import Author
 from src.models.schemas.author import AuthorInCreate, AuthorInUpdate
-from src.repository.crud.base import BaseCRUDRepository
+from src.models.schemas.version import ResourceVersion
+from src.repository.batching import get_insert_batcher
+from src.repository.changes import ChangeSet, ChangeWatermark
+from src.repository.count import CountMethod
+from src.repository.crud.base import BaseCRUDRepository, lambda_stmt
+from src.repository.query import apply_list_query, EQUALITY_OPERATORS, RANGE_OPERATORS
 from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 
 
 class AuthorCRUDRepository(BaseCRUDRepository):
+    filterable_fields = {
+        "id": RANGE_OPERATORS,
+        "name": EQUALITY_OPERATORS,
+        "created_at": RANGE_OPERATORS,
+    }
+
     async def create_author(self, author_create: AuthorInCreate) -> Author:
+        # A batched insert is committed together with its batch, outside of the request's unit of work.
+        if settings.IS_WRITE_BATCHING_ENABLED:
+            return await get_insert_batcher(table=Author).insert(values={"name": author_create.name})
+
         new_author = Author(
             name=author_create.name,
         )
 
         self.async_session.add(instance=new_author)
-        await self.async_session.commit()
+        await self.async_session.flush()
+        await self._notify_change(table=Author, action="create", id=new_author.id)
+        await self._commit()
         await self.async_session.refresh(instance=new_author)
 
         return new_author
 
-    async def read_authors(self) -> typing.Sequence[Author]:
-        stmt = sqlalchemy.select(Author)
+    async def read_authors(
+        self,
+        filters: typing.Iterable[str] | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> typing.Sequence[Author]:
+        stmt = apply_list_query(
+            stmt=sqlalchemy.select(Author),
+            table=Author,
+            filterable_fields=self.filterable_fields,
+            raw_filters=filters,
+            raw_sort=sort,
+            limit=limit,
+            offset=offset,
+        )
         query = await self.async_session.execute(statement=stmt)
         return query.scalars().all()
 
-    async def read_author_by_id(self, id: int) -> Author:
-        stmt = sqlalchemy.select(Author).where(Author.id == id)
-        query = await self.async_session.execute(statement=stmt)
+    async def count_authors(
+        self, filters: typing.Iterable[str] | None = None, method: CountMethod = "exact"
+    ) -> int | None:
+        return await self._count_rows(table=Author, raw_filters=filters, method=method)
 
-        if not query:
-            raise EntityDoesNotExist("Author with id `{id}` does not exist!")
+    async def read_authors_changes(self, watermark: ChangeWatermark, limit: int) -> ChangeSet:
+        return await self._read_changes(table=Author, watermark=watermark, limit=limit)
 
-        return query.scalar()  # type: ignore
+    async def read_authors_version(self) -> ResourceVersion:
+        return await self._read_collection_version(table=Author)
+
+    async def read_author_version_by_id(self, id: int) -> ResourceVersion:
+        return await self._read_version_by_id(table=Author, id=id)
+
+    async def read_author_by_id(self, id: int) -> Author:
+        return await self._read_by_id(table=Author, id=id)
 
     async def read_author_by_name(self, name: str) -> Author:
         stmt = sqlalchemy.select(Author).where(Author.username == name)
@@ -45,12 +85,10 @@ class AuthorCRUDRepository(BaseCRUDRepository):
 
         return query.scalar()  # type: ignore
 
-    async def update_author_by_id(
-        self, id: int, author_update: AuthorInUpdate
-    ) -> Author:
+    async def update_author_by_id(self, id: int, author_update: AuthorInUpdate) -> Author:
         new_author_data = author_update.dict()
 
-        select_stmt = sqlalchemy.select(Author).where(Author.id == id)
+        select_stmt = lambda_stmt(lambda: sqlalchemy.select(Author).where(Author.id == id))
         query = await self.async_session.execute(statement=select_stmt)
         update_author = query.scalar()
 
@@ -63,22 +101,27 @@ class AuthorCRUDRepository(BaseCRUDRepository):
             update_stmt = update_stmt.values(name=new_author_data["name"])
 
         await self.async_session.execute(statement=update_stmt)
-        await self.async_session.commit()
+        await self._notify_change(table=Author, action="update", id=update_author.id)
+        await self._commit()
+        self._invalidate_shared_cache(table=Author)
         await self.async_session.refresh(instance=update_author)
 
         return update_author  # type: ignore
 
     async def delete_author_by_id(self, id: int) -> str:
-        select_stmt = sqlalchemy.select(Author).where(Author.id == id)
+        select_stmt = lambda_stmt(lambda: sqlalchemy.select(Author).where(Author.id == id))
         query = await self.async_session.execute(statement=select_stmt)
         delete_author = query.scalar()
 
         if not delete_author:
             raise EntityDoesNotExist(f"Author with id `{id}` does not exist!")  # type: ignore
 
-        stmt = sqlalchemy.delete(table=Author).where(Author.id == delete_author.id)
+        stmt = lambda_stmt(lambda: sqlalchemy.delete(table=Author).where(Author.id == id))
 
         await self.async_session.execute(statement=stmt)
-        await self.async_session.commit()
+        self._add_tombstone(table=Author, id=delete_author.id)
+        await self._notify_change(table=Author, action="delete", id=delete_author.id)
+        await self._commit()
+        self._invalidate_shared_cache(table=Author)
 
         return f"Author with id '{id}' is successfully deleted!"
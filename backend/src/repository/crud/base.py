@@ -1,6 +1,265 @@
+import datetime
+import json
+import typing
+
+import sqlalchemy
 from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
 
+from src.config.manager import settings
+from src.models.db.tombstone import Tombstone
+from src.models.schemas.version import ResourceVersion
+from src.repository.changes import ChangeSet, ChangeWatermark
+from src.repository.count import count_cache, CountMethod
+from src.repository.query import compile_filters
+from src.repository.shared_cache import deserialize_row, serialize_row, shared_cache
+from src.repository.unit_of_work import UNIT_OF_WORK_KEY
+from src.utilities.exceptions.database import EntityDoesNotExist
+
+
+def lambda_stmt(build_statement: typing.Callable[[], sqlalchemy.Executable]) -> sqlalchemy.Executable:
+    """
+    `sqlalchemy.lambda_stmt` with the types sessions accept. The SQLAlchemy 2.0 beta types its argument as a protocol
+    that plain lambdas do not satisfy, and the `StatementLambdaElement` it returns as no `Executable`.
+    """
+    return typing.cast(sqlalchemy.Executable, sqlalchemy.lambda_stmt(typing.cast(typing.Any, build_statement)))
+
 
 class BaseCRUDRepository:
+    filterable_fields: dict[str, tuple[str, ...]] = dict()
+
     def __init__(self, async_session: SQLAlchemyAsyncSession):
         self.async_session = async_session
+
+    async def _commit(self) -> None:
+        """
+        Inside a unit of work the writes are only flushed and the unit of work commits once at the end of the request.
+        """
+        if UNIT_OF_WORK_KEY in self.async_session.info:
+            await self.async_session.flush()
+        else:
+            await self.async_session.commit()
+
+    def _after_commit(self, callback: typing.Callable[[], None]) -> None:
+        unit_of_work = self.async_session.info.get(UNIT_OF_WORK_KEY)
+
+        if unit_of_work is None:
+            callback()
+        else:
+            unit_of_work.after_commit(callback)
+
+    async def _read_version_by_id(self, table: typing.Any, id: int) -> ResourceVersion:
+        """
+        Read only the primary key and the timestamps of one row, which is enough to validate a cached response. The
+        version is settled once it is older than `SYNC_WATERMARK_LAG`, see `_build_settled_cutoff`.
+        """
+        cutoff = self._build_settled_cutoff()
+        last_modified = sqlalchemy.func.coalesce(table.updated_at, table.created_at)
+        stmt = lambda_stmt(
+            lambda: sqlalchemy.select(table.id, last_modified, last_modified <= cutoff).where(table.id == id)
+        )
+        query = await self.async_session.execute(statement=stmt)
+        row = query.one_or_none()
+
+        if not row:
+            raise EntityDoesNotExist(f"{table.__name__} with id `{id}` does not exist!")
+
+        return ResourceVersion(
+            identity=f"{table.__tablename__}:{row[0]}:{row[1].isoformat()}", last_modified=row[1], is_settled=row[2]
+        )
+
+    def _build_settled_cutoff(self) -> typing.Any:
+        """
+        `updated_at` is the start of the writing transaction, which may commit after a later one, so a row or
+        collection can still change without its timestamp moving past what a client was handed. Versions are only
+        trusted for validators once they are older than `SYNC_WATERMARK_LAG`, like the watermarks of `_read_changes`.
+        """
+        return sqlalchemy.func.now() - datetime.timedelta(seconds=settings.SYNC_WATERMARK_LAG)
+
+    async def _read_by_id(self, table: typing.Any, id: int) -> typing.Any:
+        """
+        Serve the row from the cross-worker `shared_cache` when it is enabled. The tag generation is read before the
+        query, so a row that a concurrent write has already invalidated is never stored.
+        """
+        stmt = lambda_stmt(lambda: sqlalchemy.select(table).where(table.id == id))
+
+        if not settings.IS_SHARED_CACHE_ENABLED:
+            query = await self.async_session.execute(statement=stmt)
+            row = query.scalar()
+
+            if row is None:
+                raise EntityDoesNotExist(f"{table.__name__} with id `{id}` does not exist!")
+
+            return row
+
+        key, tag = f"{table.__tablename__}:{id}", f"{table.__tablename__}s"
+        payload = shared_cache.get(key=key, tag=tag)
+
+        if payload is not None:
+            return deserialize_row(table=table, payload=payload)
+
+        generation = shared_cache.generation(tag=tag)
+        query = await self.async_session.execute(statement=stmt)
+        row = query.scalar()
+
+        if row is None:
+            raise EntityDoesNotExist(f"{table.__name__} with id `{id}` does not exist!")
+
+        shared_cache.set(key=key, tag=tag, generation=generation, payload=serialize_row(row=row))
+
+        return row
+
+    def _invalidate_shared_cache(self, table: typing.Any) -> None:
+        """
+        Drop the cached rows of `table` in every worker once the write is committed.
+        """
+        if settings.IS_SHARED_CACHE_ENABLED:
+            self._after_commit(lambda: shared_cache.invalidate(tag=f"{table.__tablename__}s"))
+
+    async def _read_collection_version(self, table: typing.Any) -> ResourceVersion:
+        """
+        Aggregate the row count, the highest id and the latest timestamp. Any insert, update, or delete changes at
+        least one of them, once the version is settled (see `_build_settled_cutoff`).
+        """
+        cutoff = self._build_settled_cutoff()
+        max_last_modified = sqlalchemy.func.max(sqlalchemy.func.coalesce(table.updated_at, table.created_at))
+        stmt = lambda_stmt(
+            lambda: sqlalchemy.select(
+                sqlalchemy.func.count(),
+                sqlalchemy.func.max(table.id),
+                max_last_modified,
+                sqlalchemy.func.coalesce(max_last_modified <= cutoff, sqlalchemy.true()),
+            ).select_from(table)
+        )
+        query = await self.async_session.execute(statement=stmt)
+        row_count, max_id, last_modified, is_settled = query.one()
+
+        return ResourceVersion(
+            identity=f"{table.__tablename__}:{row_count}:{max_id}:{last_modified.isoformat() if last_modified else None}",
+            last_modified=last_modified,
+            is_settled=is_settled,
+        )
+
+    async def _count_rows(
+        self, table: typing.Any, raw_filters: typing.Iterable[str] | None, method: CountMethod
+    ) -> int | None:
+        if method == "none":
+            return None
+
+        raw_filters = sorted(raw_filters or [])
+        clauses, _ = compile_filters(table=table, raw_filters=raw_filters, filterable_fields=self.filterable_fields)
+
+        if method == "estimated":
+            return await self._estimate_row_count(table=table, clauses=clauses)
+
+        cache_key = (table.__tablename__, *raw_filters)
+        row_count = count_cache.get(key=cache_key)
+
+        if row_count is None:
+            stmt = sqlalchemy.select(sqlalchemy.func.count()).select_from(table).where(*clauses)
+            query = await self.async_session.execute(statement=stmt)
+            row_count = query.scalar_one()
+            count_cache.set(key=cache_key, count=row_count)
+
+        return row_count
+
+    async def _estimate_row_count(self, table: typing.Any, clauses: list[typing.Any]) -> int:
+        """
+        Read the planner statistics instead of scanning: `pg_class.reltuples` for the whole table, and the row estimate
+        of the query plan when there are filters or the table has never been analyzed.
+        """
+        if not clauses:
+            stmt = sqlalchemy.text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)")
+            query = await self.async_session.execute(statement=stmt, params={"table_name": table.__tablename__})
+            reltuples = query.scalar_one_or_none()
+
+            if reltuples is not None and reltuples >= 0:
+                return reltuples
+
+        # Every filter value has already been cast to its column type, so it is safe to render the values inline.
+        select_stmt = sqlalchemy.select(table.id).where(*clauses)
+        connection = await self.async_session.connection()
+        compiled_stmt = select_stmt.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        query = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled_stmt}")
+        plan = query.scalar_one()
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _add_tombstone(self, table: typing.Any, id: int) -> None:
+        """
+        Record a deletion for the delta sync in the same transaction as the `DELETE` itself.
+        """
+        self.async_session.add(instance=Tombstone(table_name=table.__tablename__, entity_id=id))
+
+    async def _read_changes(self, table: typing.Any, watermark: ChangeWatermark, limit: int) -> ChangeSet:
+        """
+        Walk the `(last modified, id)` index past the watermark, and the tombstones of the table past theirs. Rows
+        younger than `SYNC_WATERMARK_LAG` are held back for the next call, because a transaction that is still running
+        can commit a timestamp older than the rows that are already visible. The settings keep the lag longer than any
+        transaction can run.
+        """
+        cutoff = sqlalchemy.func.now() - datetime.timedelta(seconds=settings.SYNC_WATERMARK_LAG)
+        last_modified = sqlalchemy.func.coalesce(table.updated_at, table.created_at)
+
+        upsert_stmt = (
+            sqlalchemy.select(table, last_modified)
+            .where(
+                sqlalchemy.tuple_(last_modified, table.id)
+                > sqlalchemy.tuple_(
+                    sqlalchemy.literal(watermark.modified_at, sqlalchemy.DateTime(timezone=True)),
+                    sqlalchemy.literal(watermark.modified_id),
+                ),
+                last_modified <= cutoff,
+            )
+            .order_by(last_modified, table.id)
+            .limit(limit + 1)
+        )
+        upsert_query = await self.async_session.execute(statement=upsert_stmt)
+        upsert_rows = upsert_query.all()
+
+        tombstone_stmt = (
+            sqlalchemy.select(Tombstone.entity_id, Tombstone.deleted_at, Tombstone.id)
+            .where(
+                Tombstone.table_name == table.__tablename__,
+                sqlalchemy.tuple_(Tombstone.deleted_at, Tombstone.id)
+                > sqlalchemy.tuple_(
+                    sqlalchemy.literal(watermark.deleted_at, sqlalchemy.DateTime(timezone=True)),
+                    sqlalchemy.literal(watermark.deleted_id),
+                ),
+                Tombstone.deleted_at <= cutoff,
+            )
+            .order_by(Tombstone.deleted_at, Tombstone.id)
+            .limit(limit + 1)
+        )
+        tombstone_query = await self.async_session.execute(statement=tombstone_stmt)
+        tombstone_rows = tombstone_query.all()
+
+        has_more = len(upsert_rows) > limit or len(tombstone_rows) > limit
+        upsert_rows, tombstone_rows = upsert_rows[:limit], tombstone_rows[:limit]
+        next_watermark = watermark.copy()
+
+        if upsert_rows:
+            next_watermark.modified_at, next_watermark.modified_id = upsert_rows[-1][1], upsert_rows[-1][0].id
+
+        if tombstone_rows:
+            next_watermark.deleted_at, next_watermark.deleted_id = tombstone_rows[-1][1], tombstone_rows[-1][2]
+
+        return ChangeSet(
+            upserted=[row[0] for row in upsert_rows],
+            deleted=[row[0] for row in tombstone_rows],
+            watermark=next_watermark,
+            has_more=has_more,
+        )
+
+    async def _notify_change(self, table: typing.Any, action: str, id: int) -> None:
+        """
+        `NOTIFY` is transactional, so `GET /events` subscribers only hear about a change once it is committed.
+        """
+        if not settings.IS_EVENT_STREAM_ENABLED:
+            return
+
+        payload = json.dumps({"resource": f"{table.__tablename__}s", "action": action, "id": id})
+        stmt = sqlalchemy.select(sqlalchemy.func.pg_notify(settings.EVENT_STREAM_CHANNEL, payload))
+        await self.async_session.execute(statement=stmt)
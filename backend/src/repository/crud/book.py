@@ -4,46 +4,88 @@ import sqlalchemy
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import functions as sqlalchemy_functions
 
+from src.config.manager import settings
 from src.models.db.book import Book
 from src.models.schemas.book import BookInCreate, BookInUpdate
-from src.repository.crud.base import BaseCRUDRepository
+from src.models.schemas.version import ResourceVersion
+from src.repository.batching import get_insert_batcher
+from src.repository.changes import ChangeSet, ChangeWatermark
+from src.repository.count import CountMethod
+from src.repository.crud.base import BaseCRUDRepository, lambda_stmt
+from src.repository.query import apply_list_query, EQUALITY_OPERATORS, RANGE_OPERATORS
 from src.utilities.exceptions.database import EntityAlreadyExists, EntityDoesNotExist
 
 
 class BookCRUDRepository(BaseCRUDRepository):
+    filterable_fields = {
+        "id": RANGE_OPERATORS,
+        "name": EQUALITY_OPERATORS,
+        "author_id": EQUALITY_OPERATORS,
+        "created_at": RANGE_OPERATORS,
+    }
+
     async def create_book(self, book_create: BookInCreate) -> Book:
+        # A batched insert is committed together with its batch, outside of the request's unit of work.
+        if settings.IS_WRITE_BATCHING_ENABLED:
+            return await get_insert_batcher(table=Book).insert(
+                values={"name": book_create.name, "author_id": book_create.author_id}
+            )
+
         new_book = Book(name=book_create.name, author_id=book_create.author_id)
 
         self.async_session.add(instance=new_book)
-        await self.async_session.commit()
+        await self.async_session.flush()
+        await self._notify_change(table=Book, action="create", id=new_book.id)
+        await self._commit()
         await self.async_session.refresh(instance=new_book)
 
         return new_book
 
-    async def read_books(self) -> typing.Sequence[Book]:
-        stmt = sqlalchemy.select(Book)
+    async def read_books(
+        self,
+        filters: typing.Iterable[str] | None = None,
+        sort: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> typing.Sequence[Book]:
+        stmt = apply_list_query(
+            stmt=sqlalchemy.select(Book),
+            table=Book,
+            filterable_fields=self.filterable_fields,
+            raw_filters=filters,
+            raw_sort=sort,
+            limit=limit,
+            offset=offset,
+        )
         query = await self.async_session.execute(statement=stmt)
         return query.scalars().all()
 
-    async def read_book_by_id(self, id: int) -> Book:
-        stmt = sqlalchemy.select(Book).where(Book.id == id)
-        query = await self.async_session.execute(statement=stmt)
+    async def count_books(
+        self, filters: typing.Iterable[str] | None = None, method: CountMethod = "exact"
+    ) -> int | None:
+        return await self._count_rows(table=Book, raw_filters=filters, method=method)
 
-        if not query:
-            raise EntityDoesNotExist("Book with id `{id}` does not exist!")
+    async def read_books_changes(self, watermark: ChangeWatermark, limit: int) -> ChangeSet:
+        return await self._read_changes(table=Book, watermark=watermark, limit=limit)
 
-        return query.scalar()  # type: ignore
+    async def read_books_version(self) -> ResourceVersion:
+        return await self._read_collection_version(table=Book)
+
+    async def read_book_version_by_id(self, id: int) -> ResourceVersion:
+        return await self._read_version_by_id(table=Book, id=id)
+
+    async def read_book_by_id(self, id: int) -> Book:
+        return await self._read_by_id(table=Book, id=id)
 
     async def read_book_by_author_id(self, author_id: int) -> Book:
-        stmt = sqlalchemy.select(Book).where(Book.author_id == author_id)
+        stmt = lambda_stmt(lambda: sqlalchemy.select(Book).where(Book.author_id == author_id))
         query = await self.async_session.execute(statement=stmt)
+        db_book = query.scalar()
 
-        if not query:
-            raise EntityDoesNotExist(
-                "Book with author id `{author_id}` does not exist!"
-            )
+        if not db_book:
+            raise EntityDoesNotExist(f"Book with author id `{author_id}` does not exist!")
 
-        return query.scalar()  # type: ignore
+        return db_book  # type: ignore
 
     async def read_book_by_name(self, name: str) -> Book:
         stmt = sqlalchemy.select(Book).where(Book.username == name)
@@ -57,7 +99,7 @@ class BookCRUDRepository(BaseCRUDRepository):
     async def update_book_by_id(self, id: int, book_update: BookInUpdate) -> Book:
         new_book_data = book_update.dict()
 
-        select_stmt = sqlalchemy.select(Book).where(Book.id == id)
+        select_stmt = lambda_stmt(lambda: sqlalchemy.select(Book).where(Book.id == id))
         query = await self.async_session.execute(statement=select_stmt)
         update_book = query.scalar()
 
@@ -70,22 +112,27 @@ class BookCRUDRepository(BaseCRUDRepository):
             update_stmt = update_stmt.values(name=new_book_data["name"])
 
         await self.async_session.execute(statement=update_stmt)
-        await self.async_session.commit()
+        await self._notify_change(table=Book, action="update", id=update_book.id)
+        await self._commit()
+        self._invalidate_shared_cache(table=Book)
         await self.async_session.refresh(instance=update_book)
 
         return update_book  # type: ignore
 
     async def delete_book_by_id(self, id: int) -> str:
-        select_stmt = sqlalchemy.select(Book).where(Book.id == id)
+        select_stmt = lambda_stmt(lambda: sqlalchemy.select(Book).where(Book.id == id))
         query = await self.async_session.execute(statement=select_stmt)
         delete_book = query.scalar()
 
         if not delete_book:
             raise EntityDoesNotExist(f"Book with id `{id}` does not exist!")  # type: ignore
 
-        stmt = sqlalchemy.delete(table=Book).where(Book.id == delete_book.id)
+        stmt = lambda_stmt(lambda: sqlalchemy.delete(table=Book).where(Book.id == id))
 
         await self.async_session.execute(statement=stmt)
-        await self.async_session.commit()
+        self._add_tombstone(table=Book, id=delete_book.id)
+        await self._notify_change(table=Book, action="delete", id=delete_book.id)
+        await self._commit()
+        self._invalidate_shared_cache(table=Book)
 
         return f"Book with id '{id}' is successfully deleted!"
@@ -0,0 +1,92 @@
+import datetime
+import uuid
+
+import sqlalchemy
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.models.db.refresh_token import RefreshToken
+from src.repository.crud.base import BaseCRUDRepository
+from src.repository.database import async_db
+from src.utilities.exceptions.database import EntityDoesNotExist
+from src.utilities.exceptions.token import RefreshTokenReused
+
+
+class RefreshTokenCRUDRepository(BaseCRUDRepository):
+    async def create_refresh_token(self, account_id: int, family: str | None = None) -> RefreshToken:
+        new_refresh_token = RefreshToken(
+            id=uuid.uuid4().hex,
+            family=family or uuid.uuid4().hex,
+            account_id=account_id,
+            expires_at=datetime.datetime.now(datetime.timezone.utc)
+            + datetime.timedelta(minutes=settings.JWT_REFRESH_TOKEN_EXPIRATION_TIME),
+        )
+
+        self.async_session.add(instance=new_refresh_token)
+        await self._commit()
+
+        return new_refresh_token
+
+    async def rotate_refresh_token(self, id: str) -> tuple[Account, RefreshToken]:
+        """
+        Revoke the presented refresh token and issue its successor in the same family. The row lock serializes
+        concurrent refreshes, so a token can only be exchanged once.
+        """
+        stmt = (
+            sqlalchemy.select(RefreshToken, Account)
+            .join(Account, Account.id == RefreshToken.account_id)
+            .where(RefreshToken.id == id)
+            .with_for_update(of=RefreshToken)
+        )
+        query = await self.async_session.execute(statement=stmt)
+        row = query.first()
+
+        if not row:
+            raise EntityDoesNotExist(f"Refresh token `{id}` does not exist!")
+
+        refresh_token, db_account = row
+
+        if refresh_token.revoked_at is not None:
+            await self._revoke_refresh_token_family(family=refresh_token.family)
+            raise RefreshTokenReused(f"Refresh token `{id}` has already been used!")
+
+        if refresh_token.expires_at <= datetime.datetime.now(datetime.timezone.utc):
+            raise EntityDoesNotExist(f"Refresh token `{id}` has expired!")
+
+        refresh_token.revoked_at = sqlalchemy_functions.now()
+        new_refresh_token = await self.create_refresh_token(account_id=db_account.id, family=refresh_token.family)
+
+        return db_account, new_refresh_token
+
+    async def revoke_refresh_token_session(self, family: str) -> int | None:
+        """
+        Signout ends the whole signin, so no token of its family can be refreshed anymore. Returns the id of the
+        family's account, or `None` for an unknown family.
+        """
+        stmt = sqlalchemy.select(RefreshToken.account_id).where(RefreshToken.family == family).limit(1)
+        query = await self.async_session.execute(statement=stmt)
+        account_id = query.scalar()
+
+        if account_id is None:
+            return None
+
+        await self.async_session.execute(statement=self._build_family_revocation(family=family))
+        await self._commit()
+
+        return account_id
+
+    def _build_family_revocation(self, family: str) -> sqlalchemy.Update:
+        return (
+            sqlalchemy.update(table=RefreshToken)
+            .where(RefreshToken.family == family, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=sqlalchemy_functions.now())
+        )
+
+    async def _revoke_refresh_token_family(self, family: str) -> None:
+        """
+        A reused token means it has leaked, so every token of its family is revoked. This commits on a connection of
+        its own, because the request's unit of work rolls back on the error that follows.
+        """
+        async with async_db.async_engine.begin() as connection:
+            await connection.execute(statement=self._build_family_revocation(family=family))
@@ -1,3 +1,5 @@
+import functools
+
 import pydantic
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker as sqlalchemy_async_sessionmaker,
@@ -5,7 +7,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession as SQLAlchemyAsyncSession,
     create_async_engine as create_sqlalchemy_async_engine,
 )
-from sqlalchemy.pool import Pool as SQLAlchemyPool, QueuePool as SQLAlchemyQueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool as SQLAlchemyAsyncAdaptedQueuePool, Pool as SQLAlchemyPool
 
 from src.config.manager import settings
 
@@ -16,15 +18,45 @@ class AsyncDatabase:
             url=f"{settings.DB_POSTGRES_SCHEMA}://{settings.DB_POSTGRES_USENRAME}:{settings.DB_POSTGRES_PASSWORD}@{settings.DB_POSTGRES_HOST}:{settings.DB_POSTGRES_PORT}/{settings.DB_POSTGRES_NAME}",
             scheme=settings.DB_POSTGRES_SCHEMA,
         )
-        self.async_engine: SQLAlchemyAsyncEngine = create_sqlalchemy_async_engine(
+
+    @functools.cached_property
+    def async_engine(self) -> SQLAlchemyAsyncEngine:
+        """
+        Create the engine (and load the AsyncPG dialect) on first access instead of at import time.
+
+        A checkout waits at most `DB_TIMEOUT` seconds for a free connection. The asyncio queue pool keeps that wait off
+        the event loop. With `IS_DB_FORCE_ROLLBACK`, a connection is rolled back whenever it returns to the pool, so a
+        request that was cancelled mid-transaction never hands an open transaction to the next one.
+        """
+        return create_sqlalchemy_async_engine(
             url=self.set_async_db_uri,
             echo=settings.IS_DB_ECHO_LOG,
-            pool_size=settings.DB_POOL_SIZE,
-            max_overflow=settings.DB_POOL_OVERFLOW,
-            poolclass=SQLAlchemyQueuePool,
+            poolclass=SQLAlchemyAsyncAdaptedQueuePool,
+            pool_timeout=settings.DB_TIMEOUT,
+            pool_reset_on_return="rollback" if settings.IS_DB_FORCE_ROLLBACK else None,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+            connect_args=settings.set_db_connect_args,
+            **settings.set_db_pool_attributes,
         )
-        self.async_session: SQLAlchemyAsyncSession = SQLAlchemyAsyncSession(bind=self.async_engine)
-        self.pool: SQLAlchemyPool = self.async_engine.pool
+
+    @functools.cached_property
+    def read_only_async_engine(self) -> SQLAlchemyAsyncEngine:
+        """
+        The same pool, but every transaction starts as `BEGIN READ ONLY`, which needs no extra round trip and lets
+        Postgres skip the bookkeeping of a transaction that may write.
+        """
+        return self.async_engine.execution_options(postgresql_readonly=True)
+
+    @functools.cached_property
+    def async_session_factory(self) -> sqlalchemy_async_sessionmaker[SQLAlchemyAsyncSession]:
+        """
+        Hand out one `AsyncSession` per request, since a single session cannot serve concurrent requests.
+        """
+        return sqlalchemy_async_sessionmaker(bind=self.async_engine, expire_on_commit=settings.IS_DB_EXPIRE_ON_COMMIT)
+
+    @property
+    def pool(self) -> SQLAlchemyPool:
+        return self.async_engine.pool
 
     @property
     def set_async_db_uri(self) -> str | pydantic.PostgresDsn:
@@ -1,15 +1,19 @@
 import fastapi
 import loguru
+import sqlalchemy
 from sqlalchemy import event
 from sqlalchemy.dialects.postgresql.asyncpg import AsyncAdapt_asyncpg_connection
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSessionTransaction
+from sqlalchemy.orm import Session, SessionTransaction
 from sqlalchemy.pool.base import _ConnectionRecord
 
+from src.config.manager import settings
 from src.repository.database import async_db
 from src.repository.table import Base
+from src.utilities.http.deadline import get_remaining_time
 
 
-@event.listens_for(target=async_db.async_engine.sync_engine, identifier="connect")
 def inspect_db_server_on_connection(
     db_api_connection: AsyncAdapt_asyncpg_connection, connection_record: _ConnectionRecord
 ) -> None:
@@ -17,7 +21,6 @@ def inspect_db_server_on_connection(
     loguru.logger.info(f"Connection Record ---\n {connection_record}")
 
 
-@event.listens_for(target=async_db.async_engine.sync_engine, identifier="close")
 def inspect_db_server_on_close(
     db_api_connection: AsyncAdapt_asyncpg_connection, connection_record: _ConnectionRecord
 ) -> None:
@@ -25,6 +28,39 @@ def inspect_db_server_on_close(
     loguru.logger.info(f"Closed Connection Record ---\n {connection_record}")
 
 
+def apply_request_deadline_on_begin(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    """
+    Every connection starts with `statement_timeout = DB_STATEMENT_TIMEOUT`. Once the current request has less time
+    left than that, the transaction gets a `SET LOCAL` of the remaining time, so Postgres cancels the query before the
+    request deadline instead of leaving it running on a connection nobody waits for anymore.
+    """
+    remaining_time = get_remaining_time()
+
+    if remaining_time is None or remaining_time * 1000 >= settings.DB_STATEMENT_TIMEOUT:
+        return
+
+    connection.execute(
+        sqlalchemy.text("SELECT set_config('statement_timeout', :statement_timeout, true)"),
+        {"statement_timeout": str(max(1, int(remaining_time * 1000)))},
+    )
+
+
+def register_db_connection_events() -> None:
+    """
+    Attach the connection listeners once the engine is actually needed, so importing this module stays cheap.
+    """
+    sync_engine = async_db.async_engine.sync_engine
+
+    if not event.contains(sync_engine, "connect", inspect_db_server_on_connection):
+        event.listen(sync_engine, "connect", inspect_db_server_on_connection)
+
+    if not event.contains(sync_engine, "close", inspect_db_server_on_close):
+        event.listen(sync_engine, "close", inspect_db_server_on_close)
+
+    if not event.contains(Session, "after_begin", apply_request_deadline_on_begin):
+        event.listen(Session, "after_begin", apply_request_deadline_on_begin)
+
+
 async def initialize_db_tables(connection: AsyncConnection) -> None:
     loguru.logger.info("Database Table Creation --- Initializing . . .")
 
@@ -37,6 +73,7 @@ async def initialize_db_tables(connection: AsyncConnection) -> None:
 async def initialize_db_connection(backend_app: fastapi.FastAPI) -> None:
     loguru.logger.info("Database Connection --- Establishing . . .")
 
+    register_db_connection_events()
     backend_app.state.db = async_db
 
     async with backend_app.state.db.async_engine.begin() as connection:
@@ -0,0 +1,34 @@
+"""add partial indexes for account listing
+
+Revision ID: 0554cbac4a8b
+Revises: 60d1844cb5d3
+Create Date: 2023-06-12 10:40:12.518304
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0554cbac4a8b"
+down_revision = "60d1844cb5d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_account_created_at_active", "account", ["created_at"], unique=False, postgresql_where=sa.text("is_active")
+    )
+    op.create_index(
+        "ix_account_created_at_verified",
+        "account",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_verified"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_account_created_at_verified", table_name="account")
+    op.drop_index("ix_account_created_at_active", table_name="account")
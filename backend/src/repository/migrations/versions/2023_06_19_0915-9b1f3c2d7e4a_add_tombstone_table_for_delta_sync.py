@@ -0,0 +1,42 @@
+"""add tombstone table for delta sync
+
+Revision ID: 9b1f3c2d7e4a
+Revises: 0554cbac4a8b
+Create Date: 2023-06-19 09:15:47.208133
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b1f3c2d7e4a"
+down_revision = "0554cbac4a8b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tombstone",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tombstone_table_name_deleted_at_id", "tombstone", ["table_name", "deleted_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_account_last_modified_id",
+        "account",
+        [sa.text("coalesce(updated_at, created_at)"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_account_last_modified_id", table_name="account")
+    op.drop_index("ix_tombstone_table_name_deleted_at_id", table_name="tombstone")
+    op.drop_table("tombstone")
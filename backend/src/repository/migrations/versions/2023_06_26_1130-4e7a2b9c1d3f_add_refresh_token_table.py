@@ -0,0 +1,38 @@
+"""add refresh token table
+
+Revision ID: 4e7a2b9c1d3f
+Revises: 9b1f3c2d7e4a
+Create Date: 2023-06-26 11:30:12.514208
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4e7a2b9c1d3f"
+down_revision = "9b1f3c2d7e4a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_token",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("family", sa.String(length=32), nullable=False),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["account_id"], ["account.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_refresh_token_account_id"), "refresh_token", ["account_id"], unique=False)
+    op.create_index(op.f("ix_refresh_token_family"), "refresh_token", ["family"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_refresh_token_family"), table_name="refresh_token")
+    op.drop_index(op.f("ix_refresh_token_account_id"), table_name="refresh_token")
+    op.drop_table("refresh_token")
@@ -0,0 +1,24 @@
+"""add last_login_at to account table
+
+Revision ID: 7c5d1e8f2a6b
+Revises: 4e7a2b9c1d3f
+Create Date: 2023-07-03 09:45:31.870412
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c5d1e8f2a6b"
+down_revision = "4e7a2b9c1d3f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("account", sa.Column("last_login_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("account", "last_login_at")
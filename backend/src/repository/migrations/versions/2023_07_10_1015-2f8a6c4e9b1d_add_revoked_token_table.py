@@ -0,0 +1,34 @@
+"""add revoked token table
+
+Revision ID: 2f8a6c4e9b1d
+Revises: 7c5d1e8f2a6b
+Create Date: 2023-07-10 10:15:47.302915
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2f8a6c4e9b1d"
+down_revision = "7c5d1e8f2a6b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_token",
+        sa.Column("digest", sa.LargeBinary(length=32), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("digest"),
+    )
+    op.create_index(op.f("ix_revoked_token_expires_at"), "revoked_token", ["expires_at"], unique=False)
+    op.create_index(op.f("ix_revoked_token_revoked_at"), "revoked_token", ["revoked_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_revoked_token_revoked_at"), table_name="revoked_token")
+    op.drop_index(op.f("ix_revoked_token_expires_at"), table_name="revoked_token")
+    op.drop_table("revoked_token")
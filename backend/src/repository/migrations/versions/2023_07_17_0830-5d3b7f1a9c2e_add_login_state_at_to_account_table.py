@@ -0,0 +1,24 @@
+"""add login_state_at to account table
+
+Revision ID: 5d3b7f1a9c2e
+Revises: 2f8a6c4e9b1d
+Create Date: 2023-07-17 08:30:22.618094
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d3b7f1a9c2e"
+down_revision = "2f8a6c4e9b1d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("account", sa.Column("login_state_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("account", "login_state_at")
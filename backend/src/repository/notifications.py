@@ -0,0 +1,127 @@
+"""
+Change events for `GET /events`. The CRUD repositories `pg_notify` every write inside its transaction, so Postgres only
+delivers it on commit. Each worker keeps one dedicated `LISTEN` connection and fans the events out to its subscribers.
+"""
+
+import asyncio
+import json
+import typing
+
+import asyncpg
+import loguru
+
+from src.config.manager import settings
+from src.repository.database import async_db
+
+
+class ChangeSubscription:
+    """
+    The bounded queue of one client. `None` is queued once the subscription has been closed.
+    """
+
+    def __init__(self, resources: set[str], max_queue_size: int):
+        self.resources = resources
+        self.queue: asyncio.Queue[dict[str, typing.Any] | None] = asyncio.Queue(maxsize=max_queue_size)
+        self.is_dropped = False
+
+    def is_subscribed_to(self, resource: str) -> bool:
+        return not self.resources or resource in self.resources
+
+    def close(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+        self.queue.put_nowait(None)
+
+
+class ChangeEventBroker:
+    def __init__(self, channel: str, max_queue_size: int):
+        self.channel = channel
+        self.max_queue_size = max_queue_size
+        self._subscriptions: set[ChangeSubscription] = set()
+        self._connection: asyncpg.Connection | None = None
+        self._start_lock: asyncio.Lock | None = None
+
+    @property
+    def is_listening(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    async def ensure_listening(self) -> None:
+        """
+        Open the `LISTEN` connection when the first client subscribes, and again after it has been lost.
+        """
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self.is_listening:
+                return
+
+            connection = await asyncpg.connect(dsn=str(async_db.postgres_uri), timeout=settings.DB_TIMEOUT)
+            connection.add_termination_listener(self._on_termination)
+            await connection.add_listener(self.channel, self._on_notification)
+            self._connection = connection
+
+    async def stop(self) -> None:
+        for subscription in list(self._subscriptions):
+            self.unsubscribe(subscription=subscription)
+
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    def subscribe(self, resources: set[str]) -> ChangeSubscription:
+        subscription = ChangeSubscription(resources=resources, max_queue_size=self.max_queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.discard(subscription)
+            subscription.close()
+
+    def publish(self, change_event: dict[str, typing.Any]) -> None:
+        """
+        Never wait for a subscriber: one that has fallen `max_queue_size` events behind is dropped instead of slowing
+        down everyone else, and has to reconnect (and resync) on its own.
+        """
+        for subscription in list(self._subscriptions):
+            if not subscription.is_subscribed_to(resource=change_event["resource"]):
+                continue
+
+            try:
+                subscription.queue.put_nowait(change_event)
+
+            except asyncio.QueueFull:
+                loguru.logger.warning(
+                    f"Change Events --- Dropping a slow subscriber of {subscription.resources or 'all'}"
+                )
+                subscription.is_dropped = True
+                self.unsubscribe(subscription=subscription)
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        """
+        Events sent while the connection was down are lost, so every subscriber is closed to make it reconnect.
+        """
+        loguru.logger.warning("Change Events --- Lost the LISTEN connection, closing all subscribers")
+
+        for subscription in list(self._subscriptions):
+            self.unsubscribe(subscription=subscription)
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.publish(change_event=json.loads(payload))
+
+        except (ValueError, KeyError, TypeError):
+            loguru.logger.warning(f"Change Events --- Ignoring malformed payload {payload!r}")
+
+
+def get_change_event_broker() -> ChangeEventBroker:
+    return ChangeEventBroker(channel=settings.EVENT_STREAM_CHANNEL, max_queue_size=settings.EVENT_STREAM_QUEUE_SIZE)
+
+
+change_event_broker: ChangeEventBroker = get_change_event_broker()
@@ -0,0 +1,171 @@
+"""
+A whitelisted filter and sort syntax for the list endpoints, compiled into SQLAlchemy expressions.
+
+    GET /accounts?filter=is_active:eq:true&filter=created_at:gte:2023-01-01T00:00:00Z&sort=-created_at
+
+Every `filter` is `<field>:<operator>:<value>`, with `|` separating the values of `in`. `sort` is a comma separated
+list of fields, each optionally prefixed with `-` for descending order. Fields are accepted in snake or camel case.
+"""
+
+import datetime
+import typing
+
+import sqlalchemy
+
+from src.utilities.exceptions.database import InvalidQueryExpression
+from src.utilities.formatters.field_formatter import format_dict_key_to_camel_case
+
+FILTER_OPERATORS: dict[str, typing.Callable[[typing.Any, typing.Any], typing.Any]] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "in": lambda column, value: column.in_(value),
+}
+EQUALITY_OPERATORS = ("eq", "ne", "in")
+RANGE_OPERATORS = ("eq", "ne", "in", "lt", "lte", "gt", "gte")
+IN_VALUE_SEPARATOR = "|"
+MAX_IN_VALUES = 100
+
+
+def resolve_field_name(field: str, filterable_fields: dict[str, tuple[str, ...]]) -> str:
+    for field_name in filterable_fields:
+        if field in (field_name, format_dict_key_to_camel_case(field_name)):
+            return field_name
+
+    raise InvalidQueryExpression(f"Field `{field}` is not filterable or sortable!")
+
+
+def cast_filter_value(table: typing.Any, field_name: str, raw_value: str) -> typing.Any:
+    python_type = table.__table__.c[field_name].type.python_type
+
+    try:
+        if python_type is bool:
+            if raw_value.lower() not in ("true", "false"):
+                raise ValueError(raw_value)
+            return raw_value.lower() == "true"
+
+        if python_type is datetime.datetime:
+            return datetime.datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
+
+        return python_type(raw_value)
+
+    except ValueError:
+        raise InvalidQueryExpression(f"Value `{raw_value}` is not valid for field `{field_name}`!")
+
+
+def compile_filters(
+    table: typing.Any, raw_filters: typing.Iterable[str], filterable_fields: dict[str, tuple[str, ...]]
+) -> tuple[list[typing.Any], dict[str, typing.Any]]:
+    """
+    Return the WHERE clauses and the `eq` predicates, the latter being what a partial index can be matched against.
+    """
+    clauses: list[typing.Any] = list()
+    equalities: dict[str, typing.Any] = dict()
+
+    for raw_filter in raw_filters:
+        field, _, remainder = raw_filter.partition(":")
+        operator, separator, raw_value = remainder.partition(":")
+
+        if not separator:
+            raise InvalidQueryExpression(f"Filter `{raw_filter}` must look like `<field>:<operator>:<value>`!")
+
+        field_name = resolve_field_name(field=field, filterable_fields=filterable_fields)
+
+        if operator not in filterable_fields[field_name]:
+            raise InvalidQueryExpression(f"Operator `{operator}` is not allowed on field `{field_name}`!")
+
+        if operator == "in":
+            raw_values = raw_value.split(IN_VALUE_SEPARATOR)
+            if len(raw_values) > MAX_IN_VALUES:
+                raise InvalidQueryExpression(f"Operator `in` accepts at most {MAX_IN_VALUES} values!")
+            value: typing.Any = [
+                cast_filter_value(table=table, field_name=field_name, raw_value=v) for v in raw_values
+            ]
+        else:
+            value = cast_filter_value(table=table, field_name=field_name, raw_value=raw_value)
+
+        if operator == "eq":
+            equalities[field_name] = value
+
+        clauses.append(FILTER_OPERATORS[operator](getattr(table, field_name), value))
+
+    return clauses, equalities
+
+
+def get_index_supported_sort_fields(table: typing.Any, equalities: dict[str, typing.Any]) -> set[str]:
+    """
+    A field can be sorted on when it leads the primary key, a unique constraint, or an index. Partial indexes declare
+    their predicate in `info["predicate"]` and only count when the filters imply it.
+    """
+    sort_fields: set[str] = set()
+
+    for constraint in table.__table__.constraints:
+        if (
+            isinstance(constraint, (sqlalchemy.PrimaryKeyConstraint, sqlalchemy.UniqueConstraint))
+            and constraint.columns
+        ):
+            sort_fields.add(list(constraint.columns)[0].name)
+
+    for index in table.__table__.indexes:
+        predicate = index.info.get("predicate", dict())
+
+        if not index.expressions or not isinstance(index.expressions[0], sqlalchemy.Column):
+            continue
+
+        if all(equalities.get(field) == value for field, value in predicate.items()):
+            sort_fields.add(index.expressions[0].name)
+
+    return sort_fields
+
+
+def compile_sort(
+    table: typing.Any,
+    raw_sort: str | None,
+    filterable_fields: dict[str, tuple[str, ...]],
+    equalities: dict[str, typing.Any],
+) -> list[typing.Any]:
+    """
+    Always end with the primary key so that equal sort keys come back in a stable order.
+    """
+    order_by: list[typing.Any] = list()
+    sorted_fields: set[str] = set()
+    sort_fields = get_index_supported_sort_fields(table=table, equalities=equalities)
+
+    for raw_key in filter(None, (raw_sort or "").split(",")):
+        is_descending = raw_key.startswith("-")
+        field_name = resolve_field_name(field=raw_key.lstrip("+-"), filterable_fields=filterable_fields)
+
+        if field_name not in sort_fields:
+            raise InvalidQueryExpression(f"Sorting on `{field_name}` is not supported by an index!")
+
+        if field_name in sorted_fields:
+            continue
+
+        column = getattr(table, field_name)
+        order_by.append(column.desc() if is_descending else column.asc())
+        sorted_fields.add(field_name)
+
+    if "id" not in sorted_fields:
+        order_by.append(table.id.asc())
+
+    return order_by
+
+
+def apply_list_query(
+    stmt: typing.Any,
+    table: typing.Any,
+    filterable_fields: dict[str, tuple[str, ...]],
+    raw_filters: typing.Iterable[str] | None = None,
+    raw_sort: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> typing.Any:
+    clauses, equalities = compile_filters(
+        table=table, raw_filters=raw_filters or [], filterable_fields=filterable_fields
+    )
+    order_by = compile_sort(table=table, raw_sort=raw_sort, filterable_fields=filterable_fields, equalities=equalities)
+
+    return stmt.where(*clauses).order_by(*order_by).limit(limit).offset(offset or None)
@@ -0,0 +1,95 @@
+"""
+Access token revocations shared by all workers. A revoked token's digest is committed to the `revoked_token` table, and
+every worker copies the rows revoked since its last look into its `verified_token_cache`, at most once per
+`sync_interval` seconds and on the next authenticated request. The worker that revokes a token rejects it right away,
+the others at most `sync_interval` seconds later.
+"""
+
+import asyncio
+import datetime
+import time
+
+import sqlalchemy
+from sqlalchemy.dialects import postgresql
+
+from src.config.manager import settings
+from src.models.db.revoked_token import RevokedToken
+from src.repository.database import async_db
+from src.securities.authorizations.token_cache import verified_token_cache
+
+
+class TokenRevocations:
+    def __init__(self, sync_interval: float, sync_lag: float):
+        self.sync_interval = sync_interval
+        self.sync_lag = sync_lag
+        self._synced_at: float | None = None
+        self._watermark: datetime.datetime | None = None
+        self._sync_lock: asyncio.Lock | None = None
+
+    async def revoke(self, digest: bytes, expires_at: float) -> None:
+        """
+        Commit the revocation on a connection of its own and prune the rows whose tokens have expired anyway.
+        """
+        verified_token_cache.revoke(digest=digest, expires_at=expires_at)
+
+        insert_stmt = (
+            postgresql.insert(RevokedToken)
+            .values(digest=digest, expires_at=datetime.datetime.fromtimestamp(expires_at, tz=datetime.timezone.utc))
+            .on_conflict_do_nothing(index_elements=[RevokedToken.digest])
+        )
+        prune_stmt = sqlalchemy.delete(RevokedToken).where(RevokedToken.expires_at <= sqlalchemy.func.now())
+
+        async with async_db.async_engine.begin() as connection:
+            await connection.execute(statement=insert_stmt)
+            await connection.execute(statement=prune_stmt)
+
+    def _is_synced(self) -> bool:
+        return self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval
+
+    async def synchronize(self) -> None:
+        """
+        `revoked_at` is the start of the revoking transaction, which may commit after a later one started, so the next
+        look starts `sync_lag` seconds before this one (see `validate_sync_watermark_lag`). Digests read twice are
+        simply revoked twice.
+        """
+        if self._is_synced():
+            return
+
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+
+        async with self._sync_lock:
+            if self._is_synced():
+                return
+
+            started_at = time.monotonic()
+            stmt = sqlalchemy.select(RevokedToken.digest, RevokedToken.expires_at).where(
+                RevokedToken.expires_at > sqlalchemy.func.now()
+            )
+
+            if self._watermark is not None:
+                stmt = stmt.where(RevokedToken.revoked_at >= self._watermark)
+
+            async with async_db.async_engine.connect() as connection:
+                synced_until = (await connection.execute(sqlalchemy.select(sqlalchemy.func.now()))).scalar_one()
+                query = await connection.execute(statement=stmt)
+                rows = query.all()
+
+            for digest, expires_at in rows:
+                verified_token_cache.revoke(digest=digest, expires_at=expires_at.timestamp())
+
+            self._watermark = synced_until - datetime.timedelta(seconds=self.sync_lag)
+            self._synced_at = started_at
+
+    def reset(self) -> None:
+        self._synced_at = None
+        self._watermark = None
+
+
+def get_token_revocations() -> TokenRevocations:
+    return TokenRevocations(
+        sync_interval=settings.TOKEN_REVOCATION_SYNC_INTERVAL_MS / 1000, sync_lag=settings.SYNC_WATERMARK_LAG
+    )
+
+
+token_revocations: TokenRevocations = get_token_revocations()
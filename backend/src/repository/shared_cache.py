@@ -0,0 +1,202 @@
+"""
+A fixed-size, mmap-backed cache of serialized rows that every worker process on a host shares.
+
+The file starts with a header (layout, write counter, and one generation counter per tag) followed by `slot_count`
+slots of `slot_size` bytes, grouped into sets of `ways` slots. A key can only live in its own set, and a full set
+evicts its least recently written slot, so the file never grows.
+
+Writers serialize on an `flock` of the file, which the kernel releases when a worker dies. Readers never lock: every
+slot carries a sequence number that is odd while it is being written, and a CRC32 of its payload, so a torn or
+half-written slot (e.g. after a crash) reads as a miss. A file with an unknown layout is rebuilt from scratch.
+"""
+
+import contextlib
+import datetime
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import struct
+import typing
+import zlib
+
+import sqlalchemy
+
+from src.config.manager import settings
+
+MAGIC = b"BKNDSHM1"
+HEADER = struct.Struct("<8sIIIIQ")
+HEADER_SIZE = 128
+TAG_COUNT = 8
+TAG_OFFSET = HEADER.size
+SLOT_HEADER = struct.Struct("<QQQQII")
+SEQUENCE = struct.Struct("<Q")
+
+
+def hash_key(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+
+class SharedMemoryCache:
+    def __init__(self, path: str, slot_count: int, slot_size: int, ways: int):
+        self.path = pathlib.Path(path)
+        self.ways = max(1, ways)
+        self.set_count = max(1, slot_count // self.ways)
+        self.slot_count = self.set_count * self.ways
+        self.slot_size = slot_size
+        self.capacity = slot_size - SLOT_HEADER.size
+        self.size = HEADER_SIZE + self.slot_count * slot_size
+        self._pid: int | None = None
+        self._file: typing.BinaryIO | None = None
+        self._mmap: mmap.mmap | None = None
+
+    @property
+    def buffer(self) -> mmap.mmap:
+        """
+        Map the file once per process. A descriptor inherited through `fork` shares its `flock` with the parent, so
+        every worker opens its own.
+        """
+        if self._mmap is None or self._pid != os.getpid():
+            self._open()
+
+        return self._mmap  # type: ignore
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+b")
+        self._pid = os.getpid()
+
+        with self._locked():
+            if os.fstat(self._file.fileno()).st_size != self.size:
+                self._file.truncate(0)
+                self._file.truncate(self.size)
+
+            self._mmap = mmap.mmap(self._file.fileno(), self.size)
+
+            if self._read_header() != (MAGIC, 1, self.slot_count, self.slot_size, self.ways):
+                self._rebuild()
+
+    def _read_header(self) -> tuple[bytes, int, int, int, int]:
+        magic, layout, slot_count, slot_size, ways, _ = HEADER.unpack_from(self._mmap, 0)  # type: ignore
+        return magic, layout, slot_count, slot_size, ways
+
+    def _rebuild(self) -> None:
+        self._mmap[:] = bytes(self.size)  # type: ignore
+        HEADER.pack_into(self._mmap, 0, MAGIC, 1, self.slot_count, self.slot_size, self.ways, 0)  # type: ignore
+
+    @contextlib.contextmanager
+    def _locked(self) -> typing.Iterator[None]:
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)  # type: ignore
+
+        try:
+            yield
+
+        finally:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)  # type: ignore
+
+    def _tag_offset(self, tag: str) -> int:
+        return TAG_OFFSET + (zlib.crc32(tag.encode()) % TAG_COUNT) * SEQUENCE.size
+
+    def _slot_offsets(self, key_hash: int) -> range:
+        first_slot = (key_hash % self.set_count) * self.ways
+        first_offset = HEADER_SIZE + first_slot * self.slot_size
+        return range(first_offset, first_offset + self.ways * self.slot_size, self.slot_size)
+
+    def generation(self, tag: str) -> int:
+        return SEQUENCE.unpack_from(self.buffer, self._tag_offset(tag))[0]
+
+    def get(self, key: str, tag: str) -> bytes | None:
+        buffer = self.buffer
+        key_hash = hash_key(key)
+
+        for offset in self._slot_offsets(key_hash):
+            sequence, slot_key_hash, generation, _, length, checksum = SLOT_HEADER.unpack_from(buffer, offset)
+
+            if sequence % 2 or slot_key_hash != key_hash or length > self.capacity:
+                continue
+
+            payload_offset = offset + SLOT_HEADER.size
+            payload = bytes(memoryview(buffer)[payload_offset : payload_offset + length])
+
+            if SEQUENCE.unpack_from(buffer, offset)[0] != sequence or zlib.crc32(payload) != checksum:
+                return None
+
+            return payload if generation == self.generation(tag=tag) else None
+
+        return None
+
+    def set(self, key: str, tag: str, generation: int, payload: bytes) -> bool:
+        """
+        Refuse the entry when its tag was invalidated after `generation` was read, i.e. the payload may be stale.
+        """
+        if len(payload) > self.capacity:
+            return False
+
+        buffer = self.buffer
+        key_hash = hash_key(key)
+
+        with self._locked():
+            if generation != self.generation(tag=tag):
+                return False
+
+            slots = [(offset, SLOT_HEADER.unpack_from(buffer, offset)) for offset in self._slot_offsets(key_hash)]
+            offset, (sequence, *_) = next(
+                (slot for slot in slots if slot[1][1] == key_hash), min(slots, key=lambda slot: slot[1][3])
+            )
+            stamp = HEADER.unpack_from(buffer, 0)[-1] + 1
+            writing_sequence = sequence + 1 if sequence % 2 == 0 else sequence + 2
+
+            SEQUENCE.pack_into(buffer, offset, writing_sequence)
+            payload_offset = offset + SLOT_HEADER.size
+            buffer[payload_offset : payload_offset + len(payload)] = payload
+            SLOT_HEADER.pack_into(
+                buffer, offset, writing_sequence, key_hash, generation, stamp, len(payload), zlib.crc32(payload)
+            )
+            SEQUENCE.pack_into(buffer, offset, writing_sequence + 1)
+            struct.pack_into("<Q", buffer, HEADER.size - SEQUENCE.size, stamp)
+
+        return True
+
+    def invalidate(self, tag: str) -> None:
+        buffer = self.buffer
+
+        with self._locked():
+            SEQUENCE.pack_into(buffer, self._tag_offset(tag), self.generation(tag=tag) + 1)
+
+    def clear(self) -> None:
+        buffer = self.buffer
+
+        with self._locked():
+            self._rebuild()
+
+
+def serialize_row(row: typing.Any) -> bytes:
+    values = {column.key: getattr(row, column.key) for column in row.__table__.columns}
+    return json.dumps(values, default=datetime.datetime.isoformat, separators=(",", ":")).encode()
+
+
+def deserialize_row(table: typing.Any, payload: bytes) -> typing.Any:
+    """
+    Build a detached instance of `table`, which is all a route needs to render it.
+    """
+    values = json.loads(payload)
+
+    for column in table.__table__.columns:
+        if isinstance(column.type, sqlalchemy.DateTime) and values[column.key] is not None:
+            values[column.key] = datetime.datetime.fromisoformat(values[column.key])
+
+    return table(**values)
+
+
+def get_shared_cache() -> SharedMemoryCache:
+    return SharedMemoryCache(
+        path=settings.SHARED_CACHE_PATH,
+        slot_count=settings.SHARED_CACHE_SLOTS,
+        slot_size=settings.SHARED_CACHE_SLOT_SIZE,
+        ways=settings.SHARED_CACHE_WAYS,
+    )
+
+
+shared_cache: SharedMemoryCache = get_shared_cache()
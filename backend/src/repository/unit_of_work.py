@@ -0,0 +1,34 @@
+import typing
+
+from sqlalchemy.ext.asyncio import AsyncSession as SQLAlchemyAsyncSession
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """
+    One transaction per request. While a session belongs to a unit of work, the repositories only flush their writes
+    (which still surfaces generated ids and constraint errors right away) and register whatever has to wait for the
+    commit, such as cache invalidation. The unit of work then commits or rolls back exactly once.
+    """
+
+    def __init__(self, async_session: SQLAlchemyAsyncSession, is_read_only: bool = False):
+        self.async_session = async_session
+        self.is_read_only = is_read_only
+        self._after_commit_callbacks: list[typing.Callable[[], None]] = list()
+        async_session.info[UNIT_OF_WORK_KEY] = self
+
+    def after_commit(self, callback: typing.Callable[[], None]) -> None:
+        self._after_commit_callbacks.append(callback)
+
+    async def commit(self) -> None:
+        await self.async_session.commit()
+
+        for callback in self._after_commit_callbacks:
+            callback()
+
+        self._after_commit_callbacks.clear()
+
+    async def rollback(self) -> None:
+        self._after_commit_callbacks.clear()
+        await self.async_session.rollback()
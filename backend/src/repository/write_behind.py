@@ -0,0 +1,153 @@
+"""
+Write-behind for the login state of accounts. `signin` and `signout` only record the change in memory, and the
+changes of all accounts are written together by one `UPDATE ... FROM (VALUES ...)` at most `flush_interval` seconds
+later, off the request path. Changes of the same account are coalesced, so only its latest state is written.
+
+Every change carries the time it was recorded, which is stored in `account.login_state_at`. Another worker may flush
+a newer change of the same account first, so `is_logged_in` is only written over an older state, and `last_login_at`
+only ever moves forward.
+"""
+
+import asyncio
+import datetime
+
+import loguru
+import sqlalchemy
+from sqlalchemy.sql import functions as sqlalchemy_functions
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.repository.database import async_db
+
+# (is_logged_in, last_login_at, recorded_at)
+LoginState = tuple[bool, datetime.datetime | None, datetime.datetime]
+
+
+class LoginStateQueue:
+    def __init__(self, flush_interval: float, max_pending: int, drain_attempts: int = 3):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.drain_attempts = drain_attempts
+        self._pending: dict[int, LoginState] = dict()
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+        self._is_draining = False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def record_signin(self, account_id: int) -> None:
+        recorded_at = datetime.datetime.now(datetime.timezone.utc)
+        self._record(account_id=account_id, login_state=(True, recorded_at, recorded_at))
+
+    def record_signout(self, account_id: int) -> None:
+        _, last_login_at, _ = self._pending.get(account_id, (False, None, None))
+        self._record(
+            account_id=account_id, login_state=(False, last_login_at, datetime.datetime.now(datetime.timezone.utc))
+        )
+
+    def _record(self, account_id: int, login_state: LoginState) -> None:
+        self._pending[account_id] = login_state
+
+        if len(self._pending) >= self.max_pending:
+            self._start_flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._start_flush)
+
+    async def drain(self) -> None:
+        """
+        Flush until nothing is pending. A failed batch is retried right here instead of on a timer that would never
+        fire after shutdown, and given up with an error log after `drain_attempts` attempts.
+        """
+        self._is_draining = True
+
+        try:
+            for _ in range(self.drain_attempts):
+                self._start_flush()
+
+                if self._flushes:
+                    await asyncio.gather(*self._flushes, return_exceptions=True)
+
+                if not self._pending:
+                    return
+
+            loguru.logger.error(
+                f"Login State --- Dropping the login state of {len(self._pending)} accounts: {sorted(self._pending)}"
+            )
+            self._pending.clear()
+
+        finally:
+            self._is_draining = False
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, dict()
+
+        if batch:
+            flush = asyncio.create_task(self._flush(batch=batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: dict[int, LoginState]) -> None:
+        login_states = sqlalchemy.values(
+            sqlalchemy.column("id", sqlalchemy.Integer),
+            sqlalchemy.column("is_logged_in", sqlalchemy.Boolean),
+            sqlalchemy.column("last_login_at", sqlalchemy.DateTime(timezone=True)),
+            sqlalchemy.column("recorded_at", sqlalchemy.DateTime(timezone=True)),
+            name="login_state",
+        ).data(
+            [
+                (account_id, is_logged_in, last_login_at, recorded_at)
+                for account_id, (is_logged_in, last_login_at, recorded_at) in batch.items()
+            ]
+        )
+        is_newer_state = sqlalchemy.or_(
+            Account.login_state_at.is_(None), Account.login_state_at < login_states.c.recorded_at
+        )
+        stmt = (
+            sqlalchemy.update(table=Account)
+            .where(Account.id == login_states.c.id)
+            .values(
+                is_logged_in=sqlalchemy.case(
+                    (is_newer_state, login_states.c.is_logged_in), else_=Account.is_logged_in
+                ),
+                # `greatest` skips `NULL`s. An all-`NULL` `VALUES` column would be typed `text`, so it is cast back.
+                last_login_at=sqlalchemy.func.greatest(
+                    sqlalchemy.cast(login_states.c.last_login_at, sqlalchemy.DateTime(timezone=True)),
+                    Account.last_login_at,
+                ),
+                login_state_at=sqlalchemy.func.greatest(login_states.c.recorded_at, Account.login_state_at),
+                updated_at=sqlalchemy_functions.now(),
+            )
+        )
+
+        try:
+            async with async_db.async_engine.begin() as connection:
+                await connection.execute(statement=stmt)
+
+        except Exception as flush_error:
+            loguru.logger.warning(f"Login State --- Flushing {len(batch)} accounts failed, retrying: {flush_error}")
+
+            # Changes recorded since this batch was taken are newer, so only the others are retried.
+            for account_id, login_state in batch.items():
+                self._pending.setdefault(account_id, login_state)
+
+            if not self._is_draining:
+                self._schedule_flush()
+
+
+def get_login_state_queue() -> LoginStateQueue:
+    return LoginStateQueue(
+        flush_interval=settings.LOGIN_STATE_FLUSH_INTERVAL_MS / 1000, max_pending=settings.LOGIN_STATE_MAX_PENDING
+    )
+
+
+login_state_queue: LoginStateQueue = get_login_state_queue()
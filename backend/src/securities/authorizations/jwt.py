@@ -5,7 +5,8 @@ from jose import jwt as jose_jwt, JWTError as JoseJWTError
 
 from src.config.manager import settings
 from src.models.db.account import Account
-from src.models.schemas.jwt import JWTAccount, JWToken
+from src.models.db.refresh_token import RefreshToken
+from src.models.schemas.jwt import JWTAccount, JWToken, JWTRefreshToken
 from src.utilities.exceptions.database import EntityDoesNotExist
 
 
@@ -31,16 +32,39 @@ class JWTGenerator:
 
         return jose_jwt.encode(to_encode, key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
-    def generate_access_token(self, account: Account) -> str:
+    def generate_access_token(self, account: Account, session_id: str | None = None) -> str:
+        """
+        `session_id` is the family of the refresh token issued with the access token, which signout revokes.
+        """
         if not account:
             raise EntityDoesNotExist(f"Cannot generate JWT token for without Account entity!")
 
+        jwt_data = JWTAccount(username=account.username, email=account.email).dict()  # type: ignore
+
+        if session_id:
+            jwt_data["sid"] = session_id
+
         return self._generate_jwt_token(
-            jwt_data=JWTAccount(username=account.username, email=account.email).dict(),  # type: ignore
+            jwt_data=jwt_data,
             expires_delta=datetime.timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRATION_TIME),
         )
 
-    def retrieve_details_from_token(self, token: str, secret_key: str) -> list[str]:
+    def generate_refresh_token(self, refresh_token: RefreshToken) -> str:
+        """
+        The token only carries the id of its `refresh_token` row, which is checked for revocation on every refresh.
+        """
+        if not refresh_token:
+            raise EntityDoesNotExist(f"Cannot generate JWT refresh token without RefreshToken entity!")
+
+        return self._generate_jwt_token(
+            jwt_data=JWTRefreshToken(jti=refresh_token.id).dict(),
+            expires_delta=datetime.timedelta(minutes=settings.JWT_REFRESH_TOKEN_EXPIRATION_TIME),
+        )
+
+    def retrieve_account_from_token(self, token: str, secret_key: str) -> tuple[JWTAccount, float]:
+        """
+        Also return the token's `exp` as a UNIX timestamp, which bounds how long the account may be cached.
+        """
         try:
             payload = jose_jwt.decode(token=token, key=secret_key, algorithms=[settings.JWT_ALGORITHM])
             jwt_account = JWTAccount(username=payload["username"], email=payload["email"])
@@ -48,11 +72,41 @@ class JWTGenerator:
         except JoseJWTError as token_decode_error:
             raise ValueError("Unable to decode JWT Token") from token_decode_error
 
-        except pydantic.ValidationError as validation_error:
+        except (KeyError, pydantic.ValidationError) as validation_error:
             raise ValueError("Invalid payload in token") from validation_error
 
+        return jwt_account, float(payload["exp"])
+
+    def retrieve_session_from_token(self, token: str, secret_key: str) -> tuple[str | None, float]:
+        """
+        Return the access token's session id, `None` when it was issued without one, and its `exp`.
+        """
+        try:
+            payload = jose_jwt.decode(token=token, key=secret_key, algorithms=[settings.JWT_ALGORITHM])
+
+        except JoseJWTError as token_decode_error:
+            raise ValueError("Unable to decode JWT Token") from token_decode_error
+
+        return payload.get("sid"), float(payload["exp"])
+
+    def retrieve_details_from_token(self, token: str, secret_key: str) -> list[str]:
+        jwt_account, _ = self.retrieve_account_from_token(token=token, secret_key=secret_key)
+
         return [jwt_account.username, jwt_account.email]
 
+    def retrieve_refresh_token_id(self, token: str, secret_key: str) -> str:
+        try:
+            payload = jose_jwt.decode(token=token, key=secret_key, algorithms=[settings.JWT_ALGORITHM])
+            jwt_refresh_token = JWTRefreshToken(jti=payload["jti"], token_type=payload["token_type"])
+
+        except JoseJWTError as token_decode_error:
+            raise ValueError("Unable to decode JWT Token") from token_decode_error
+
+        except (KeyError, pydantic.ValidationError) as validation_error:
+            raise ValueError("Invalid payload in token") from validation_error
+
+        return jwt_refresh_token.jti
+
 
 def get_jwt_generator() -> JWTGenerator:
     return JWTGenerator()
@@ -0,0 +1,85 @@
+import collections
+import hashlib
+import heapq
+import time
+
+from src.config.manager import settings
+from src.models.schemas.jwt import JWTAccount
+
+
+def hash_token(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """
+    Access tokens whose signature and payload were already verified, keyed by their SHA-256 digest so the tokens
+    themselves are never kept in memory. An entry lives until its token's `exp`, and the least recently used entry is
+    evicted beyond `max_entries`.
+
+    Revoked digests are kept until their token would have expired anyway, with a min-heap of their expiries so every
+    revocation only pops what has expired since the last one. The cache and the revocation set belong to
+    one worker process, `src/repository/revocations.py` shares the revocations with the other workers. Callers hash the
+    token once with `hash_token` and pass its digest to every method.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: collections.OrderedDict[bytes, tuple[float, JWTAccount]] = collections.OrderedDict()
+        self._revoked: dict[bytes, float] = dict()
+        self._revoked_expiries: list[tuple[float, bytes]] = list()
+
+    def get(self, digest: bytes) -> JWTAccount | None:
+        item = self._entries.get(digest)
+
+        if not item:
+            return None
+
+        if item[0] <= time.time():
+            del self._entries[digest]
+            return None
+
+        self._entries.move_to_end(digest)
+        return item[1]
+
+    def set(self, digest: bytes, jwt_account: JWTAccount, expires_at: float) -> None:
+        if self.max_entries <= 0:
+            return
+
+        self._entries.pop(digest, None)
+        self._entries[digest] = (expires_at, jwt_account)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def revoke(self, digest: bytes, expires_at: float) -> None:
+        self._entries.pop(digest, None)
+
+        # The revocations are read again by every synchronization that overlaps the last one.
+        if digest not in self._revoked:
+            self._revoked[digest] = expires_at
+            heapq.heappush(self._revoked_expiries, (expires_at, digest))
+
+        self._prune_revoked()
+
+    def is_revoked(self, digest: bytes) -> bool:
+        return digest in self._revoked
+
+    def _prune_revoked(self) -> None:
+        now = time.time()
+
+        while self._revoked_expiries and self._revoked_expiries[0][0] <= now:
+            _, digest = heapq.heappop(self._revoked_expiries)
+            del self._revoked[digest]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._revoked.clear()
+        self._revoked_expiries.clear()
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    return VerifiedTokenCache(max_entries=settings.VERIFIED_TOKEN_CACHE_MAX_ENTRIES)
+
+
+verified_token_cache: VerifiedTokenCache = get_verified_token_cache()
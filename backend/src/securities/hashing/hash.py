@@ -1,41 +1,68 @@
+import asyncio
+import concurrent.futures
+import functools
+
 from passlib.context import CryptContext
 
 from src.config.manager import settings
 
 
 class HashGenerator:
-    def __init__(self):
-        self._hash_ctx_layer_1: CryptContext = CryptContext(
-            schemes=[settings.HASHING_ALGORITHM_LAYER_1], deprecated="auto"
-        )
-        self._hash_ctx_layer_2: CryptContext = CryptContext(
-            schemes=[settings.HASHING_ALGORITHM_LAYER_2], deprecated="auto"
+    @functools.cached_property
+    def _hash_ctx(self) -> CryptContext:
+        """
+        Build the Argon2 `CryptContext` on first use instead of at import time. Hashes made with the legacy
+        `HASHING_ALGORITHM_LAYER_2` scheme or with other cost parameters still verify, but `needs_update` flags them
+        for a rehash.
+        """
+        legacy_schemes = [settings.HASHING_ALGORITHM_LAYER_2] if settings.HASHING_ALGORITHM_LAYER_2 != "argon2" else []
+
+        return CryptContext(
+            schemes=["argon2", *legacy_schemes],
+            deprecated=legacy_schemes,
+            argon2__time_cost=settings.HASHING_ARGON2_TIME_COST,
+            argon2__memory_cost=settings.HASHING_ARGON2_MEMORY_COST,
+            argon2__parallelism=settings.HASHING_ARGON2_PARALLELISM,
         )
-        self._hash_ctx_salt: str = settings.HASHING_SALT
 
-    @property
-    def _get_hashing_salt(self) -> str:
-        return self._hash_ctx_salt
+    @functools.cached_property
+    def _hash_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Argon2 runs in C and releases the GIL, so threads hash on all cores without pickling anything to a process.
+        """
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=settings.HASHING_WORKERS, thread_name_prefix="password-hashing"
+        )
 
-    @property
-    def generate_password_salt_hash(self) -> str:
+    def generate_password_hash(self, password: str) -> str:
         """
-        A function to generate a hash from Bcrypt to append to the user password.
+        A function that hashes the user's password once with Argon2, which salts every hash on its own.
         """
-        return self._hash_ctx_layer_1.hash(secret=self._get_hashing_salt)
+        return self._hash_ctx.hash(secret=password)
 
-    def generate_password_hash(self, hash_salt: str, password: str) -> str:
+    async def generate_password_hashes(self, passwords: list[str]) -> list[str]:
         """
-        A function that adds the user's password with the layer 1 Bcrypt hash, before
-        hash it for the second time using Argon2 algorithm.
+        A function that hashes many passwords in parallel on `HASHING_WORKERS` threads, keeping their order.
         """
-        return self._hash_ctx_layer_2.hash(secret=hash_salt + password)
+        loop = asyncio.get_running_loop()
+
+        hashing_tasks = [
+            loop.run_in_executor(self._hash_executor, self.generate_password_hash, password) for password in passwords
+        ]
+
+        return await asyncio.gather(*hashing_tasks)
 
     def is_password_verified(self, password: str, hashed_password: str) -> bool:
         """
         A function that decodes users' password and verifies whether it is the correct password.
         """
-        return self._hash_ctx_layer_2.verify(secret=password, hash=hashed_password)
+        return self._hash_ctx.verify(secret=password, hash=hashed_password)
+
+    def is_password_hash_outdated(self, hashed_password: str) -> bool:
+        """
+        A function that checks whether a hash was made with other cost parameters than the configured ones.
+        """
+        return self._hash_ctx.needs_update(hash=hashed_password)
 
 
 def get_hash_generator() -> HashGenerator:
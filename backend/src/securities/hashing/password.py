@@ -2,15 +2,22 @@ from src.securities.hashing.hash import hash_generator
 
 
 class PasswordGenerator:
-    @property
-    def generate_salt(self) -> str:
-        return hash_generator.generate_password_salt_hash
-
-    def generate_hashed_password(self, hash_salt: str, new_password: str) -> str:
-        return hash_generator.generate_password_hash(hash_salt=hash_salt, password=new_password)
-
-    def is_password_authenticated(self, hash_salt: str, password: str, hashed_password: str) -> bool:
-        return hash_generator.is_password_verified(password=hash_salt + password, hashed_password=hashed_password)
+    def generate_hashed_password(self, new_password: str) -> str:
+        return hash_generator.generate_password_hash(password=new_password)
+
+    async def generate_hashed_passwords(self, new_passwords: list[str]) -> list[str]:
+        return await hash_generator.generate_password_hashes(passwords=new_passwords)
+
+    def is_password_authenticated(self, hash_salt: str | None, password: str, hashed_password: str) -> bool:
+        """
+        Legacy accounts carry a Bcrypt `hash_salt` that was prepended to the password before hashing it.
+        """
+        return hash_generator.is_password_verified(
+            password=(hash_salt or "") + password, hashed_password=hashed_password
+        )
+
+    def is_rehash_needed(self, hash_salt: str | None, hashed_password: str) -> bool:
+        return bool(hash_salt) or hash_generator.is_password_hash_outdated(hashed_password=hashed_password)
 
 
 def get_pwd_generator() -> PasswordGenerator:
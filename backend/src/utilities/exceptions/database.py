@@ -8,3 +8,9 @@ class EntityAlreadyExists(Exception):
     """
     Throw an exception when the data already exist in the database.
     """
+
+
+class InvalidQueryExpression(Exception):
+    """
+    Throw an exception when a filter or sort expression is malformed or not whitelisted.
+    """
@@ -7,9 +7,13 @@ cannot or will not process the request due to something that is perceivedto be a
 import fastapi
 
 from src.utilities.messages.exceptions.http.exc_details import (
+    http_400_availability_details,
+    http_400_batch_details,
     http_400_email_details,
+    http_400_query_details,
     http_400_sigin_credentials_details,
     http_400_signup_credentials_details,
+    http_400_update_credentials_details,
     http_400_username_details,
 )
 
@@ -28,6 +32,13 @@ async def http_exc_400_credentials_bad_signin_request() -> Exception:
     )
 
 
+async def http_exc_400_credentials_bad_update_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_update_credentials_details(),
+    )
+
+
 async def http_400_exc_bad_username_request(username: str) -> Exception:
     return fastapi.HTTPException(
         status_code=fastapi.status.HTTP_400_BAD_REQUEST,
@@ -40,3 +51,24 @@ async def http_400_exc_bad_email_request(email: str) -> Exception:
         status_code=fastapi.status.HTTP_400_BAD_REQUEST,
         detail=http_400_email_details(email=email),
     )
+
+
+async def http_400_exc_bad_query_request(reason: str) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_query_details(reason=reason),
+    )
+
+
+async def http_400_exc_bad_batch_request(reason: str) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_batch_details(reason=reason),
+    )
+
+
+async def http_400_exc_bad_availability_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_400_BAD_REQUEST,
+        detail=http_400_availability_details(),
+    )
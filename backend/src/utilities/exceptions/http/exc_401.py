@@ -5,7 +5,12 @@ request has not been completed because it lacks valid authentication credentials
 
 import fastapi
 
-from src.utilities.messages.exceptions.http.exc_details import http_401_unauthorized_details
+from src.config.manager import settings
+from src.utilities.messages.exceptions.http.exc_details import (
+    http_401_access_token_details,
+    http_401_refresh_token_details,
+    http_401_unauthorized_details,
+)
 
 
 async def http_exc_401_cunauthorized_request() -> Exception:
@@ -13,3 +18,18 @@ async def http_exc_401_cunauthorized_request() -> Exception:
         status_code=fastapi.status.HTTP_400_BAD_REQUEST,
         detail=http_401_unauthorized_details(),
     )
+
+
+async def http_exc_401_refresh_token_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_401_UNAUTHORIZED,
+        detail=http_401_refresh_token_details(),
+    )
+
+
+async def http_exc_401_access_token_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_401_UNAUTHORIZED,
+        detail=http_401_access_token_details(),
+        headers={"WWW-Authenticate": settings.JWT_TOKEN_PREFIX},
+    )
@@ -0,0 +1,36 @@
+"""
+The HyperText Transfer Protocol (HTTP) 503 Service Unavailable server error response code indicates that the server
+is not ready to handle the request, e.g. because it is overloaded or a dependency is down.
+"""
+
+import fastapi
+
+from src.utilities.messages.exceptions.http.exc_details import (
+    http_503_database_busy_details,
+    http_503_event_stream_details,
+    http_503_overloaded_details,
+)
+
+
+async def http_503_exc_event_stream_unavailable_request(retry_after: int) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=http_503_event_stream_details(),
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+async def http_503_exc_database_busy_request(retry_after: int) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=http_503_database_busy_details(),
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+async def http_503_exc_overloaded_request(retry_after: int) -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=http_503_overloaded_details(),
+        headers={"Retry-After": str(retry_after)},
+    )
@@ -0,0 +1,15 @@
+"""
+The HyperText Transfer Protocol (HTTP) 504 Gateway Timeout server error response code indicates that the server did not
+get a response in time from an upstream it needed to complete the request, e.g. the database.
+"""
+
+import fastapi
+
+from src.utilities.messages.exceptions.http.exc_details import http_504_deadline_details
+
+
+async def http_504_exc_deadline_exceeded_request() -> Exception:
+    return fastapi.HTTPException(
+        status_code=fastapi.status.HTTP_504_GATEWAY_TIMEOUT,
+        detail=http_504_deadline_details(),
+    )
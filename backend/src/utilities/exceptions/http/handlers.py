@@ -0,0 +1,48 @@
+"""
+Exception handlers that turn database timeouts into clean 503/504 responses instead of 500s.
+"""
+
+import fastapi
+import loguru
+import sqlalchemy.exc
+from fastapi.exception_handlers import http_exception_handler
+
+from src.config.manager import settings
+from src.utilities.exceptions.http.exc_503 import http_503_exc_database_busy_request
+from src.utilities.exceptions.http.exc_504 import http_504_exc_deadline_exceeded_request
+
+QUERY_CANCELED_SQLSTATE = "57014"
+
+
+async def database_pool_timeout_handler(request: fastapi.Request, exc: Exception) -> fastapi.Response:
+    """
+    No pooled connection became free within `DB_TIMEOUT`, so the database is saturated: ask the client to back off.
+    """
+    loguru.logger.warning(f"Database Pool --- {request.method} {request.url.path} timed out waiting for a connection")
+    busy_exception = await http_503_exc_database_busy_request(retry_after=settings.DB_POOL_TIMEOUT_RETRY_AFTER)
+    return await http_exception_handler(request, busy_exception)  # type: ignore
+
+
+async def database_statement_timeout_handler(request: fastapi.Request, exc: Exception) -> fastapi.Response:
+    """
+    Postgres cancelled the query at `statement_timeout`. Any other database error is left to the server error handler.
+    """
+    if getattr(getattr(exc, "orig", None), "sqlstate", None) != QUERY_CANCELED_SQLSTATE:
+        raise exc
+
+    loguru.logger.warning(f"Database Statement --- {request.method} {request.url.path} hit the statement timeout")
+    return await http_exception_handler(request, await http_504_exc_deadline_exceeded_request())  # type: ignore
+
+
+async def database_command_timeout_handler(request: fastapi.Request, exc: Exception) -> fastapi.Response:
+    """
+    asyncpg gave up on the query after `DB_COMMAND_TIMEOUT`, e.g. because the server stopped responding.
+    """
+    loguru.logger.warning(f"Database Command --- {request.method} {request.url.path} hit the command timeout")
+    return await http_exception_handler(request, await http_504_exc_deadline_exceeded_request())  # type: ignore
+
+
+def register_database_timeout_handlers(backend_app: fastapi.FastAPI) -> None:
+    backend_app.add_exception_handler(sqlalchemy.exc.TimeoutError, database_pool_timeout_handler)
+    backend_app.add_exception_handler(sqlalchemy.exc.DBAPIError, database_statement_timeout_handler)
+    backend_app.add_exception_handler(TimeoutError, database_command_timeout_handler)
@@ -0,0 +1,4 @@
+class RefreshTokenReused(Exception):
+    """
+    Throw an exception when a refresh token that has already been rotated or revoked is presented again.
+    """
@@ -0,0 +1,140 @@
+"""
+Run the sub-requests of `POST /batch` in-process through the whole ASGI application, so every sub-request gets the same
+middlewares (response cache, deadlines), dependencies and error handling as a request of its own. Admission control is
+the exception: the batch already holds a slot, which its sub-requests share (see `SUB_REQUEST_SCOPE_KEY`).
+"""
+
+import asyncio
+import json
+import typing
+
+from starlette.types import ASGIApp, Message, Scope
+
+from src.models.schemas.batch import SubRequestInBatch, SubResponseInBatch
+
+READ_ONLY_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+# Headers of the batch request that every sub-request inherits unless it sets its own.
+INHERITED_HEADERS: tuple[str, ...] = ("authorization", "host", "user-agent", "x-forwarded-for", "x-forwarded-proto")
+INHERITED_SCOPE_KEYS: tuple[str, ...] = ("type", "asgi", "http_version", "scheme", "server", "client", "root_path")
+OMITTED_RESPONSE_HEADERS: frozenset[str] = frozenset({"content-length", "content-type", "content-encoding"})
+# Set on the scope of every sub-request, so middlewares can tell them apart from requests of their own.
+SUB_REQUEST_SCOPE_KEY: str = "batch_sub_request"
+
+
+def build_sub_request_scope(parent_scope: Scope, api_prefix: str, sub_request: SubRequestInBatch) -> Scope:
+    path, _, query_string = sub_request.path.partition("?")
+    headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in parent_scope["headers"]
+        if name.decode("latin-1") in INHERITED_HEADERS
+    }
+    headers |= {name.lower(): value for name, value in sub_request.headers.items()}
+
+    if sub_request.body is not None:
+        headers["content-type"] = "application/json"
+
+    return {
+        **{key: value for key, value in parent_scope.items() if key in INHERITED_SCOPE_KEYS},
+        "method": sub_request.method,
+        "path": f"{api_prefix}{path}",
+        "raw_path": f"{api_prefix}{path}".encode(),
+        "query_string": query_string.encode(),
+        "headers": [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()],
+        "state": dict(parent_scope.get("state", {})),
+        SUB_REQUEST_SCOPE_KEY: True,
+    }
+
+
+async def dispatch_sub_request(app: ASGIApp, scope: Scope, sub_request: SubRequestInBatch) -> SubResponseInBatch:
+    request_body = b"" if sub_request.body is None else json.dumps(sub_request.body).encode()
+    is_request_sent = False
+    is_response_complete = asyncio.Event()
+    response_start: Message = dict()
+    response_body = bytearray()
+
+    async def receive() -> Message:
+        nonlocal is_request_sent
+
+        if not is_request_sent:
+            is_request_sent = True
+            return {"type": "http.request", "body": request_body, "more_body": False}
+
+        await is_response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response_start.update(message)
+        elif message["type"] == "http.response.body":
+            response_body.extend(message.get("body", b""))
+
+            if not message.get("more_body", False):
+                is_response_complete.set()
+
+    try:
+        await app(scope, receive, send)
+
+    # The server error middleware re-raises after it has sent its 500, anything else is a 500 that was never sent.
+    except Exception:
+        response_start.setdefault("status", 500)
+
+    finally:
+        is_response_complete.set()
+
+    response_headers = {
+        name.decode("latin-1"): value.decode("latin-1") for name, value in response_start.get("headers", [])
+    }
+
+    try:
+        body: typing.Any = json.loads(response_body) if response_body else None
+
+    except ValueError:
+        body = response_body.decode("utf-8", errors="replace")
+
+    return SubResponseInBatch(
+        id=sub_request.id,
+        status=response_start.get("status", 500),
+        headers={name: value for name, value in response_headers.items() if name not in OMITTED_RESPONSE_HEADERS},
+        body=body,
+    )
+
+
+async def run_sub_requests(
+    app: ASGIApp,
+    parent_scope: Scope,
+    api_prefix: str,
+    sub_requests: list[SubRequestInBatch],
+    max_concurrency: int,
+) -> list[SubResponseInBatch]:
+    """
+    Consecutive reads are independent of each other and run concurrently, at most `max_concurrency` at a time so a
+    single batch cannot take over the connection pool. Every write waits for everything listed before it and runs on
+    its own, so the batch keeps the semantics of sending its requests one after another.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    sub_responses: list[SubResponseInBatch | None] = [None] * len(sub_requests)
+
+    async def run_sub_request(index: int) -> None:
+        async with semaphore:
+            sub_responses[index] = await dispatch_sub_request(
+                app=app,
+                scope=build_sub_request_scope(
+                    parent_scope=parent_scope, api_prefix=api_prefix, sub_request=sub_requests[index]
+                ),
+                sub_request=sub_requests[index],
+            )
+
+    concurrent_reads: list[int] = list()
+
+    for index, sub_request in enumerate(sub_requests):
+        if sub_request.method in READ_ONLY_METHODS:
+            concurrent_reads.append(index)
+            continue
+
+        await asyncio.gather(*(run_sub_request(index=read_index) for read_index in concurrent_reads))
+        concurrent_reads.clear()
+        await run_sub_request(index=index)
+
+    await asyncio.gather(*(run_sub_request(index=read_index) for read_index in concurrent_reads))
+
+    return typing.cast(list[SubResponseInBatch], sub_responses)
@@ -0,0 +1,80 @@
+import datetime
+import email.utils
+import hashlib
+
+import fastapi
+
+from src.models.schemas.version import ResourceVersion
+
+
+def generate_weak_etag(resource_version: ResourceVersion) -> str:
+    return f'W/"{hashlib.blake2b(resource_version.identity.encode(), digest_size=16).hexdigest()}"'
+
+
+def format_http_date(date_time: datetime.datetime) -> str:
+    return email.utils.format_datetime(date_time.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    """
+    `If-None-Match` always uses the weak comparison, so the `W/` prefix is ignored on both sides.
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def is_modified_since(if_modified_since: str, last_modified: datetime.datetime) -> bool:
+    try:
+        since = email.utils.parsedate_to_datetime(if_modified_since)
+
+    except (TypeError, ValueError):
+        return True
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.timezone.utc)
+
+    # HTTP dates have a resolution of one second.
+    return last_modified.replace(microsecond=0) > since
+
+
+def is_request_not_modified(request: fastapi.Request, resource_version: ResourceVersion) -> bool:
+    """
+    `If-None-Match` takes precedence over `If-Modified-Since` (RFC 9110 section 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        return is_etag_matched(if_none_match=if_none_match, etag=generate_weak_etag(resource_version=resource_version))
+
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_modified_since is not None and resource_version.last_modified:
+        return not is_modified_since(if_modified_since=if_modified_since, last_modified=resource_version.last_modified)
+
+    return False
+
+
+def evaluate_conditional_request(
+    request: fastapi.Request, response: fastapi.Response, resource_version: ResourceVersion
+) -> fastapi.Response | None:
+    """
+    Set the validators on the outgoing response and return a ready `304 Not Modified` when the client's copy is still
+    current, so the route can skip loading and serializing the body. A version that is not settled yet gets neither,
+    since a transaction that started before it may still commit without changing it.
+    """
+    if not resource_version.is_settled:
+        return None
+
+    validator_headers = {"ETag": generate_weak_etag(resource_version=resource_version)}
+
+    if resource_version.last_modified:
+        validator_headers["Last-Modified"] = format_http_date(date_time=resource_version.last_modified)
+
+    if is_request_not_modified(request=request, resource_version=resource_version):
+        return fastapi.Response(status_code=fastapi.status.HTTP_304_NOT_MODIFIED, headers=validator_headers)
+
+    response.headers.update(validator_headers)
+
+    return None
@@ -0,0 +1,17 @@
+"""
+The deadline of the current request, set by `DeadlineMiddleware` and read by the repository layer to keep each query
+within the time the request has left.
+"""
+
+import contextvars
+import time
+
+request_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("request_deadline", default=None)
+
+
+def get_remaining_time() -> float | None:
+    """
+    Seconds until the deadline on the `time.monotonic()` clock, or `None` outside of a request.
+    """
+    deadline = request_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
@@ -0,0 +1,40 @@
+import typing
+
+import fastapi
+
+from src.repository.count import CountMethod
+
+
+def split_page(rows: typing.Sequence[typing.Any], limit: int | None) -> tuple[typing.Sequence[typing.Any], bool]:
+    """
+    The list query asks for `limit + 1` rows, so the extra row tells whether a next page exists without counting.
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, False
+
+    return rows[:limit], True
+
+
+def set_pagination_headers(
+    request: fastapi.Request,
+    response: fastapi.Response,
+    offset: int,
+    limit: int | None,
+    has_next_page: bool,
+    total_count: int | None,
+    count_method: CountMethod,
+) -> None:
+    links: list[str] = list()
+
+    if limit is not None and has_next_page:
+        links.append(f'<{request.url.include_query_params(offset=offset + limit, limit=limit)}>; rel="next"')
+
+    if limit is not None and offset > 0:
+        links.append(f'<{request.url.include_query_params(offset=max(0, offset - limit), limit=limit)}>; rel="prev"')
+
+    if links:
+        response.headers["Link"] = ", ".join(links)
+
+    if total_count is not None:
+        response.headers["X-Total-Count"] = str(total_count)
+        response.headers["X-Total-Count-Method"] = count_method
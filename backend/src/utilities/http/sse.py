@@ -0,0 +1,58 @@
+import asyncio
+import json
+import typing
+
+import fastapi
+
+from src.repository.notifications import ChangeSubscription
+
+
+def format_server_sent_event(data: typing.Any, event: str | None = None, retry: int | None = None) -> str:
+    lines: list[str] = list()
+
+    if retry is not None:
+        lines.append(f"retry: {retry}")
+
+    if event is not None:
+        lines.append(f"event: {event}")
+
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def generate_change_events(
+    request: fastapi.Request,
+    subscription: ChangeSubscription,
+    unsubscribe: typing.Callable[[ChangeSubscription], None],
+    heartbeat: float,
+    retry: int,
+) -> typing.AsyncIterator[str]:
+    """
+    Stream the events of one subscription as `<resource>.<action>` events, with a comment line as heartbeat so idle
+    proxies keep the connection open. A closed subscription ends the stream with a final `close` event.
+    """
+    try:
+        yield format_server_sent_event(data={"resources": sorted(subscription.resources)}, event="open", retry=retry)
+
+        while True:
+            try:
+                change_event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+
+                yield ": heartbeat\n\n"
+                continue
+
+            if change_event is None:
+                reason = "slow-consumer" if subscription.is_dropped else "server-closed"
+                yield format_server_sent_event(data={"reason": reason}, event="close")
+                return
+
+            yield format_server_sent_event(
+                data=change_event, event=f"{change_event['resource']}.{change_event['action']}"
+            )
+
+    finally:
+        unsubscribe(subscription)
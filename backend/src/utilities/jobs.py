@@ -0,0 +1,156 @@
+"""
+An in-process runner for work that does not have to finish before the response is sent. Routes `submit` a coroutine
+function, and a fixed number of workers run the jobs from a bounded queue, retrying a failed job with exponential
+backoff. The runner is started and drained together with the app, and a job that is still queued when the drain
+times out is lost, so only non-critical work belongs here.
+"""
+
+import asyncio
+import collections
+import typing
+
+import loguru
+
+from src.config.manager import settings
+
+JobFunction = typing.Callable[..., typing.Awaitable[typing.Any]]
+
+
+class Job:
+    def __init__(self, function: JobFunction, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def name(self) -> str:
+        return getattr(self.function, "__qualname__", repr(self.function))
+
+
+class JobRunner:
+    def __init__(self, worker_count: int, max_queue_size: int, max_retries: int, retry_backoff: float):
+        self.worker_count = worker_count
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.counters: collections.Counter[str] = collections.Counter()
+        self.in_flight = 0
+        self._queue: asyncio.Queue[Job] | None = None
+        self._workers: list[asyncio.Task] = list()
+        self._is_draining = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._queue is not None and not self._is_draining
+
+    @property
+    def metrics(self) -> dict[str, int]:
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "in_flight": self.in_flight,
+            "worker_count": len(self._workers),
+            **{
+                counter: self.counters[counter]
+                for counter in ("submitted", "completed", "retried", "failed", "rejected")
+            },
+        }
+
+    def start(self) -> None:
+        """
+        The queue is created here rather than in `__init__`, so it belongs to the event loop that runs the app.
+        """
+        if self._queue is not None:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.worker_count)]
+
+    def submit(self, function: JobFunction, /, *args: typing.Any, **kwargs: typing.Any) -> bool:
+        """
+        Queue `function(*args, **kwargs)` without waiting for it. Returns `False` if the job was dropped because the
+        runner is not running or its queue is full.
+        """
+        job = Job(function=function, args=args, kwargs=kwargs)
+
+        if not self.is_running:
+            self.counters["rejected"] += 1
+            return False
+
+        try:
+            self._queue.put_nowait(job)  # type: ignore
+
+        except asyncio.QueueFull:
+            self.counters["rejected"] += 1
+            loguru.logger.warning(f"Job Runner --- Queue is full, dropped `{job.name}`")
+            return False
+
+        self.counters["submitted"] += 1
+        return True
+
+    async def _work(self) -> None:
+        queue: asyncio.Queue[Job] = self._queue  # type: ignore
+
+        while True:
+            job = await queue.get()
+            self.in_flight += 1
+
+            try:
+                await self._run(job=job)
+
+            finally:
+                self.in_flight -= 1
+                queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                await job.function(*job.args, **job.kwargs)
+
+            except Exception as job_error:
+                if attempt == self.max_retries:
+                    self.counters["failed"] += 1
+                    loguru.logger.warning(
+                        f"Job Runner --- `{job.name}` failed after {attempt + 1} attempts: {job_error}"
+                    )
+                    return
+
+                self.counters["retried"] += 1
+                await asyncio.sleep(self.retry_backoff * 2**attempt)
+
+            else:
+                self.counters["completed"] += 1
+                return
+
+    async def drain(self, timeout: float) -> None:
+        """
+        Stop accepting jobs, give the queued ones `timeout` seconds to finish, then stop the workers.
+        """
+        if self._queue is None:
+            return
+
+        self._is_draining = True
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            loguru.logger.warning(f"Job Runner --- Dropped {self._queue.qsize()} queued jobs after {timeout}s")
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._queue, self._workers, self._is_draining = None, list(), False
+
+
+def get_job_runner() -> JobRunner:
+    return JobRunner(
+        worker_count=settings.JOB_WORKERS,
+        max_queue_size=settings.JOB_QUEUE_SIZE,
+        max_retries=settings.JOB_MAX_RETRIES,
+        retry_backoff=settings.JOB_RETRY_BACKOFF_MS / 1000,
+    )
+
+
+job_runner: JobRunner = get_job_runner()
@@ -14,10 +14,34 @@ def http_400_sigin_credentials_details() -> str:
     return "Signin failed! Recheck all your credentials!"
 
 
+def http_400_update_credentials_details() -> str:
+    return "Update failed! The username or email is already taken!"
+
+
+def http_400_query_details(reason: str) -> str:
+    return f"The list query is invalid! {reason}"
+
+
+def http_400_batch_details(reason: str) -> str:
+    return f"The batch request is invalid! {reason}"
+
+
+def http_400_availability_details() -> str:
+    return "Pass a `username`, an `email`, or both to check their availability!"
+
+
 def http_401_unauthorized_details() -> str:
     return "Refused to complete request due to lack of valid authentication!"
 
 
+def http_401_refresh_token_details() -> str:
+    return "The refresh token is invalid, expired, or has already been used!"
+
+
+def http_401_access_token_details() -> str:
+    return "The access token is missing, invalid, expired, or revoked!"
+
+
 def http_403_forbidden_details() -> str:
     return "Refused access to the requested resource!"
 
@@ -32,3 +56,19 @@ def http_404_username_details(username: str) -> str:
 
 def http_404_email_details(email: str) -> str:
     return f"Either the account with email `{email}` doesn't exist, has been deleted, or you are not authorized!"
+
+
+def http_503_event_stream_details() -> str:
+    return "The change event stream is unavailable right now! Retry later or fall back to polling!"
+
+
+def http_503_database_busy_details() -> str:
+    return "All database connections are busy right now! Retry later!"
+
+
+def http_503_overloaded_details() -> str:
+    return "The server is overloaded right now! Retry later!"
+
+
+def http_504_deadline_details() -> str:
+    return "The request did not complete within its deadline!"
@@ -0,0 +1,46 @@
+import asyncio
+
+import asgi_lifespan
+import asyncpg
+import fastapi
+import httpx
+import pytest
+
+from src.config.manager import settings
+from src.main import initialize_backend_application
+from src.repository.database import async_db
+
+
+async def is_postgres_reachable() -> bool:
+    try:
+        connection = await asyncpg.connect(dsn=str(async_db.postgres_uri), timeout=settings.DB_TIMEOUT)
+
+    except (OSError, asyncio.TimeoutError, asyncpg.PostgresError):
+        return False
+
+    await connection.close()
+    return True
+
+
+@pytest.fixture(name="benchmark_app")
+async def benchmark_app() -> fastapi.FastAPI:  # type: ignore
+    """
+    The real application with its lifespan (and therefore a freshly created schema) against the configured Postgres.
+    """
+    if not await is_postgres_reachable():
+        pytest.skip("Load benchmarks need the Postgres server configured in `.env`.")
+
+    backend_app = initialize_backend_application()
+
+    async with asgi_lifespan.LifespanManager(backend_app):
+        yield backend_app
+
+
+@pytest.fixture(name="benchmark_client")
+async def benchmark_client(benchmark_app: fastapi.FastAPI) -> httpx.AsyncClient:  # type: ignore
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=benchmark_app),
+        base_url="http://testserver",
+        headers={"Content-Type": "application/json"},
+    ) as client:
+        yield client
@@ -0,0 +1,103 @@
+import json
+import math
+import os
+import pathlib
+import statistics
+import time
+import typing
+
+BENCHMARK_DIR: pathlib.Path = pathlib.Path(__file__).parent.resolve()
+BASELINE_DIR: pathlib.Path = pathlib.Path(os.environ.get("BENCHMARK_BASELINE_DIR", BENCHMARK_DIR / "baselines"))
+REPORT_DIR: pathlib.Path = pathlib.Path(os.environ.get("BENCHMARK_REPORT_DIR", BENCHMARK_DIR / "reports"))
+TOLERANCE: float = float(os.environ.get("BENCHMARK_TOLERANCE", 0.2))
+IS_BASELINE_UPDATED: bool = os.environ.get("BENCHMARK_UPDATE_BASELINE", "").lower() in ("1", "true", "yes")
+
+HIGHER_IS_BETTER: frozenset[str] = frozenset({"throughput_rps", "ops_per_second"})
+LOWER_IS_BETTER: frozenset[str] = frozenset({"p50_ms", "p95_ms", "p99_ms", "mean_ms"})
+# A nearest-rank p99 over fewer than 100 samples is just the maximum, which is too noisy to gate on.
+MINIMUM_SAMPLES: dict[str, int] = {"p95_ms": 20, "p99_ms": 100}
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile, which never reports a latency that was not actually observed.
+    """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies_ms: list[float]) -> dict[str, float]:
+    return {
+        "count": len(latencies_ms),
+        "mean_ms": statistics.fmean(latencies_ms),
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+    }
+
+
+def time_calls(function: typing.Callable[[], typing.Any], iterations: int, warmup: int = 1) -> dict[str, float]:
+    """
+    Call `function` repeatedly and summarize the per-call latency, plus the sustained single-core `ops_per_second`.
+    """
+    for _ in range(warmup):
+        function()
+
+    latencies_ms: list[float] = list()
+
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    return {**summarize_latencies(latencies_ms), "ops_per_second": 1000 * len(latencies_ms) / sum(latencies_ms)}
+
+
+def find_regressions(
+    baseline: dict[str, dict[str, float]], report: dict[str, dict[str, float]], tolerance: float = TOLERANCE
+) -> list[str]:
+    """
+    Compare every metric that exists in both the baseline and the report, section by section. Tail percentiles are
+    skipped for sections that did not collect enough samples.
+    """
+    regressions: list[str] = list()
+
+    for section, baseline_metrics in baseline.items():
+        for metric, baseline_value in baseline_metrics.items():
+            current_value = report.get(section, {}).get(metric)
+
+            if current_value is None or not baseline_value:
+                continue
+
+            if report[section].get("count", math.inf) < MINIMUM_SAMPLES.get(metric, 0):
+                continue
+
+            if metric in HIGHER_IS_BETTER and current_value < baseline_value * (1 - tolerance):
+                regressions.append(f"{section}.{metric}: {current_value:.2f} < baseline {baseline_value:.2f}")
+
+            elif metric in LOWER_IS_BETTER and current_value > baseline_value * (1 + tolerance):
+                regressions.append(f"{section}.{metric}: {current_value:.2f} > baseline {baseline_value:.2f}")
+
+    return regressions
+
+
+def record_and_compare(name: str, report: dict[str, dict[str, float]]) -> list[str]:
+    """
+    Write the latest report to `REPORT_DIR` and compare it with the committed baseline. A missing baseline is a
+    regression of its own, only a run with `BENCHMARK_UPDATE_BASELINE=1` stores the report as the new baseline.
+    """
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    (REPORT_DIR / f"{name}.json").write_text(json.dumps(report, indent=2, sort_keys=True))
+
+    baseline_path = BASELINE_DIR / f"{name}.json"
+
+    if IS_BASELINE_UPDATED:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        return list()
+
+    if not baseline_path.exists():
+        return [f"{name}: no baseline at {baseline_path}, record one with BENCHMARK_UPDATE_BASELINE=1"]
+
+    return find_regressions(baseline=json.loads(baseline_path.read_text()), report=report)
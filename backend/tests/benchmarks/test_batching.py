@@ -0,0 +1,57 @@
+import asyncio
+import os
+import time
+
+import fastapi
+import pytest
+
+from src.config.manager import settings
+from src.models.schemas.author import AuthorInCreate
+from src.repository.batching import InsertBatcher
+from src.repository.crud.author import AuthorCRUDRepository
+from tests.benchmarks.reporting import record_and_compare, summarize_latencies
+
+CONCURRENT_INSERTS: int = int(os.environ.get("BENCHMARK_CONCURRENT_INSERTS", 400))
+
+
+@pytest.mark.benchmark
+async def test_group_commit_throughput(benchmark_app: fastapi.FastAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    `CONCURRENT_INSERTS` concurrent `create_author` calls, each with its own session as under concurrent requests:
+    one `INSERT` plus `COMMIT` each, then group-committed by an `InsertBatcher`.
+    """
+    monkeypatch.setattr(
+        "src.repository.crud.author.get_insert_batcher",
+        lambda table: InsertBatcher(table=table, max_batch_size=settings.WRITE_BATCH_MAX_SIZE, max_delay=0.002),
+    )
+    report = dict()
+
+    for profile, is_batched in (("single_row_commits", False), ("group_commit", True)):
+        monkeypatch.setattr(settings, "IS_WRITE_BATCHING_ENABLED", is_batched)
+        latencies_ms: list[float] = list()
+
+        async def create_author(index: int) -> None:
+            started = time.perf_counter()
+
+            async with benchmark_app.state.db.async_session_factory() as session:
+                author_repo = AuthorCRUDRepository(async_session=session)
+                await author_repo.create_author(author_create=AuthorInCreate(name=f"{profile}-{index}"))
+
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(create_author(index=index) for index in range(CONCURRENT_INSERTS)))
+        elapsed = time.perf_counter() - started
+
+        report[f"create_author.{profile}"] = {
+            **summarize_latencies(latencies_ms),
+            "throughput_rps": CONCURRENT_INSERTS / elapsed,
+        }
+
+    regressions = record_and_compare(name="insert_batching", report=report)
+
+    assert (
+        report["create_author.group_commit"]["throughput_rps"]
+        > report["create_author.single_row_commits"]["throughput_rps"]
+    )
+    assert not regressions, regressions
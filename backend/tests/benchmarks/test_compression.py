@@ -0,0 +1,47 @@
+import json
+import os
+
+import pytest
+
+from src.api.middlewares.compression import ContentEncoder, get_available_content_encodings
+from src.models.schemas.book import BookInResponse
+from tests.benchmarks.reporting import record_and_compare, time_calls
+
+COMPRESSION_ITERATIONS: int = int(os.environ.get("BENCHMARK_COMPRESSION_ITERATIONS", 50))
+PAYLOAD_ROWS: int = int(os.environ.get("BENCHMARK_COMPRESSION_ROWS", 1000))
+COMPRESSION_LEVELS: dict[str, list[int]] = {"gzip": [1, 6, 9], "br": [1, 4, 6, 11], "zstd": [1, 3, 10, 19]}
+
+
+def build_book_list_payload() -> bytes:
+    """
+    The body `GET /api/books` renders for `PAYLOAD_ROWS` books.
+    """
+    return json.dumps(
+        [
+            BookInResponse(id=index, name=f"Book number {index}", author_id=index % 97).dict(by_alias=True)
+            for index in range(PAYLOAD_ROWS)
+        ]
+    ).encode()
+
+
+@pytest.mark.benchmark
+def test_compression_levels_bandwidth_and_cpu() -> None:
+    payload = build_book_list_payload()
+    report = dict()
+
+    for encoding in get_available_content_encodings():
+        for level in COMPRESSION_LEVELS[encoding]:
+            compressed_size = len(ContentEncoder(encoding=encoding, level=level).encode(chunk=payload, is_final=True))
+            report[f"{encoding}.level_{level}"] = {
+                **time_calls(
+                    lambda: ContentEncoder(encoding=encoding, level=level).encode(chunk=payload, is_final=True),
+                    COMPRESSION_ITERATIONS,
+                ),
+                "original_bytes": len(payload),
+                "compressed_bytes": compressed_size,
+                "compression_ratio": len(payload) / compressed_size,
+            }
+
+    regressions = record_and_compare(name="compression", report=report)
+
+    assert not regressions, regressions
@@ -0,0 +1,154 @@
+import datetime
+import os
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from passlib.hash import argon2, bcrypt
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.models.db.author import Author
+from src.models.schemas.account import AccountInResponse, AccountWithToken
+from src.models.schemas.author import AuthorInResponse
+from src.securities.authorizations.jwt import jwt_generator
+from src.securities.authorizations.token_cache import hash_token, VerifiedTokenCache
+from src.securities.hashing.hash import hash_generator
+from tests.benchmarks.reporting import record_and_compare, time_calls
+
+HASH_ITERATIONS: int = int(os.environ.get("BENCHMARK_HASH_ITERATIONS", 10))
+FAST_ITERATIONS: int = int(os.environ.get("BENCHMARK_FAST_ITERATIONS", 2000))
+HASHING_SLO_MS: float = float(os.environ.get("BENCHMARK_HASHING_SLO_MS", 250))
+BENCHMARK_PASSWORD: str = "benchmark-password"
+
+# (time_cost, memory_cost in KiB, parallelism): passlib's default first, then the OWASP recommendations.
+ARGON2_COST_PARAMETERS: list[tuple[int, int, int]] = [(3, 65536, 4), (2, 19456, 1), (1, 47104, 1), (4, 102400, 8)]
+JWT_ALGORITHMS: list[str] = ["HS256", "HS384", "HS512"]
+
+
+def build_account() -> Account:
+    return Account(
+        id=1,
+        username="benchmark",
+        email="benchmark@example.com",
+        is_verified=True,
+        is_active=True,
+        is_logged_in=True,
+        created_at=datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+        updated_at=datetime.datetime(2023, 1, 2, tzinfo=datetime.timezone.utc),
+    )
+
+
+def build_account_response(account: Account, token: str) -> AccountInResponse:
+    return AccountInResponse(
+        id=account.id,
+        authorized_account=AccountWithToken(
+            token=token,
+            username=account.username,
+            email=account.email,  # type: ignore
+            is_verified=account.is_verified,
+            is_active=account.is_active,
+            is_logged_in=account.is_logged_in,
+            created_at=account.created_at,
+            updated_at=account.updated_at,
+        ),
+    )
+
+
+@pytest.mark.benchmark
+def test_password_hashing_primitives() -> None:
+    """
+    `hashing.legacy_two_layer_hash` is what a signup used to pay: a Bcrypt salt, then the Argon2 hash. The configured
+    hash and verify must fit `HASHING_SLO_MS` at p95, the Argon2 grid is only recorded to pick the next parameters from.
+    """
+    hashed_password = hash_generator.generate_password_hash(password=BENCHMARK_PASSWORD)
+
+    report = {
+        "hashing.hash": time_calls(
+            lambda: hash_generator.generate_password_hash(password=BENCHMARK_PASSWORD), HASH_ITERATIONS
+        ),
+        "hashing.verify": time_calls(
+            lambda: hash_generator.is_password_verified(password=BENCHMARK_PASSWORD, hashed_password=hashed_password),
+            HASH_ITERATIONS,
+        ),
+        "hashing.legacy_two_layer_hash": time_calls(
+            lambda: hash_generator.generate_password_hash(
+                password=bcrypt.hash(BENCHMARK_PASSWORD) + BENCHMARK_PASSWORD
+            ),
+            HASH_ITERATIONS,
+        ),
+    }
+
+    for time_cost, memory_cost, parallelism in ARGON2_COST_PARAMETERS:
+        argon2_variant = argon2.using(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        variant_hash = argon2_variant.hash(BENCHMARK_PASSWORD)
+        report[f"argon2.t{time_cost}_m{memory_cost}_p{parallelism}"] = time_calls(
+            lambda: argon2_variant.verify(BENCHMARK_PASSWORD, variant_hash), HASH_ITERATIONS
+        )
+
+    regressions = record_and_compare(name="hot_paths_hashing", report=report)
+    slo_misses = {
+        section: report[section]["p95_ms"]
+        for section in ("hashing.hash", "hashing.verify")
+        if report[section]["p95_ms"] > HASHING_SLO_MS
+    }
+
+    assert not regressions, regressions
+    assert not slo_misses, slo_misses
+
+
+@pytest.mark.benchmark
+def test_jwt_primitives(monkeypatch: pytest.MonkeyPatch) -> None:
+    account = build_account()
+    report = dict()
+
+    for algorithm in JWT_ALGORITHMS:
+        monkeypatch.setattr(settings, "JWT_ALGORITHM", algorithm)
+        token = jwt_generator.generate_access_token(account=account)
+
+        report[f"jwt.{algorithm}.encode"] = time_calls(
+            lambda: jwt_generator._generate_jwt_token(jwt_data={"username": account.username, "email": account.email}),
+            FAST_ITERATIONS,
+        )
+        report[f"jwt.{algorithm}.decode"] = time_calls(
+            lambda: jwt_generator.retrieve_details_from_token(token=token, secret_key=settings.JWT_SECRET_KEY),
+            FAST_ITERATIONS,
+        )
+
+    # What `get_current_account` pays for every request after the token's first one.
+    jwt_account, expires_at = jwt_generator.retrieve_account_from_token(
+        token=token, secret_key=settings.JWT_SECRET_KEY
+    )
+    token_cache = VerifiedTokenCache(max_entries=1)
+    token_cache.set(digest=hash_token(token=token), jwt_account=jwt_account, expires_at=expires_at)
+    report["jwt.verified_token_cache.get"] = time_calls(
+        lambda: token_cache.get(digest=hash_token(token=token)), FAST_ITERATIONS
+    )
+
+    regressions = record_and_compare(name="hot_paths_jwt", report=report)
+
+    assert not regressions, regressions
+
+
+@pytest.mark.benchmark
+def test_schema_serialization_primitives() -> None:
+    account = build_account()
+    author = Author(id=1, name="benchmark")
+    token = jwt_generator.generate_access_token(account=account)
+    account_response = build_account_response(account=account, token=token)
+
+    report = {
+        "author.init": time_calls(lambda: AuthorInResponse(id=author.id, name=author.name), FAST_ITERATIONS),
+        "author.from_orm": time_calls(lambda: AuthorInResponse.from_orm(author), FAST_ITERATIONS),
+        "author.construct": time_calls(
+            lambda: AuthorInResponse.construct(id=author.id, name=author.name), FAST_ITERATIONS
+        ),
+        "account.init": time_calls(lambda: build_account_response(account=account, token=token), FAST_ITERATIONS),
+        "account.jsonable_encoder": time_calls(
+            lambda: jsonable_encoder(account_response, by_alias=True), FAST_ITERATIONS
+        ),
+        "account.json": time_calls(lambda: account_response.json(by_alias=True), FAST_ITERATIONS),
+    }
+
+    regressions = record_and_compare(name="hot_paths_serialization", report=report)
+
+    assert not regressions, regressions
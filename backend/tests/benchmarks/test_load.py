@@ -0,0 +1,170 @@
+import asyncio
+import itertools
+import os
+import random
+import time
+import typing
+
+import httpx
+import pytest
+
+from tests.benchmarks.reporting import record_and_compare, summarize_latencies
+
+CONCURRENCY: int = int(os.environ.get("BENCHMARK_CONCURRENCY", 16))
+TOTAL_REQUESTS: int = int(os.environ.get("BENCHMARK_REQUESTS", 600))
+SEED_ROWS: int = int(os.environ.get("BENCHMARK_SEED_ROWS", 50))
+SEED_ACCOUNTS: int = int(os.environ.get("BENCHMARK_SEED_ACCOUNTS", 5))
+BENCHMARK_PASSWORD: str = "benchmark-password"
+
+WORKLOAD_MIX: dict[str, int] = {
+    "authors:list": 10,
+    "authors:read": 20,
+    "authors:create": 5,
+    "authors:update": 5,
+    "books:list": 10,
+    "books:read": 20,
+    "books:create": 5,
+    "books:update": 3,
+    "books:delete": 2,
+    "accounts:list": 2,
+    "accounts:read": 10,
+    "accounts:signup": 1,
+    "accounts:signin": 1,
+}
+
+
+class WorkloadState:
+    def __init__(self) -> None:
+        self.sequence: typing.Iterator[int] = itertools.count()
+        self.author_ids: list[int] = list()
+        self.book_ids: list[int] = list()
+        self.disposable_book_ids: list[int] = list()
+        self.account_ids: list[int] = list()
+        self.account_names: list[str] = list()
+
+
+async def create_author(client: httpx.AsyncClient, state: WorkloadState, rng: random.Random) -> httpx.Response:
+    response = await client.post("/api/authors", json={"name": f"author-{next(state.sequence)}"})
+    state.author_ids.append(response.json()["id"])
+    return response
+
+
+async def create_book(client: httpx.AsyncClient, state: WorkloadState, rng: random.Random) -> httpx.Response:
+    response = await client.post(
+        "/api/books", json={"name": f"book-{next(state.sequence)}", "authorId": rng.choice(state.author_ids)}
+    )
+    state.book_ids.append(response.json()["id"])
+    return response
+
+
+async def signup_account(client: httpx.AsyncClient, state: WorkloadState, rng: random.Random) -> httpx.Response:
+    username = f"account-{next(state.sequence)}"
+    response = await client.post(
+        "/api/auth/signup",
+        json={"username": username, "email": f"{username}@example.com", "password": BENCHMARK_PASSWORD},
+    )
+    state.account_ids.append(response.json()["id"])
+    state.account_names.append(username)
+    return response
+
+
+async def signin_account(client: httpx.AsyncClient, state: WorkloadState, rng: random.Random) -> httpx.Response:
+    username = rng.choice(state.account_names)
+    return await client.post(
+        "/api/auth/signin",
+        json={"username": username, "email": f"{username}@example.com", "password": BENCHMARK_PASSWORD},
+    )
+
+
+async def delete_book(client: httpx.AsyncClient, state: WorkloadState, rng: random.Random) -> httpx.Response:
+    return await client.delete(f"/api/books/{state.disposable_book_ids.pop()}")
+
+
+WORKLOAD_OPERATIONS: dict[
+    str, typing.Callable[[httpx.AsyncClient, WorkloadState, random.Random], typing.Awaitable]
+] = {
+    "authors:list": lambda client, state, rng: client.get("/api/authors"),
+    "authors:read": lambda client, state, rng: client.get(f"/api/authors/{rng.choice(state.author_ids)}"),
+    "authors:create": create_author,
+    "authors:update": lambda client, state, rng: client.patch(
+        f"/api/authors/{rng.choice(state.author_ids)}", json={"name": f"author-{next(state.sequence)}"}
+    ),
+    "books:list": lambda client, state, rng: client.get("/api/books"),
+    "books:read": lambda client, state, rng: client.get(f"/api/books/{rng.choice(state.book_ids)}"),
+    "books:create": create_book,
+    "books:update": lambda client, state, rng: client.patch(
+        f"/api/books/{rng.choice(state.book_ids)}",
+        json={"name": f"book-{next(state.sequence)}", "authorId": rng.choice(state.author_ids)},
+    ),
+    "books:delete": delete_book,
+    "accounts:list": lambda client, state, rng: client.get("/api/accounts"),
+    "accounts:read": lambda client, state, rng: client.get(f"/api/accounts/{rng.choice(state.account_ids)}"),
+    "accounts:signup": signup_account,
+    "accounts:signin": signin_account,
+}
+
+
+async def seed_workload_state(client: httpx.AsyncClient, disposable_books: int) -> WorkloadState:
+    state = WorkloadState()
+    rng = random.Random(0)
+
+    for _ in range(SEED_ROWS):
+        await create_author(client=client, state=state, rng=rng)
+        await create_book(client=client, state=state, rng=rng)
+
+    for _ in range(disposable_books):
+        await create_book(client=client, state=state, rng=rng)
+        state.disposable_book_ids.append(state.book_ids.pop())
+
+    for _ in range(SEED_ACCOUNTS):
+        await signup_account(client=client, state=state, rng=rng)
+
+    return state
+
+
+async def run_workload(
+    client: httpx.AsyncClient, state: WorkloadState, plan: list[str], concurrency: int, rng: random.Random
+) -> tuple[dict[str, list[float]], list[str], float]:
+    """
+    Let `concurrency` clients drain the shared request plan and time every request.
+    """
+    remaining_plan = iter(plan)
+    samples: dict[str, list[float]] = {operation_name: list() for operation_name in WORKLOAD_MIX}
+    failures: list[str] = list()
+
+    async def simulate_client() -> None:
+        for operation_name in remaining_plan:
+            started = time.perf_counter()
+            response = await WORKLOAD_OPERATIONS[operation_name](client, state, rng)
+            samples[operation_name].append((time.perf_counter() - started) * 1000)
+
+            if response.status_code >= 400:
+                failures.append(f"{operation_name}: {response.status_code} {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(simulate_client() for _ in range(concurrency)))
+
+    return samples, failures, time.perf_counter() - started
+
+
+@pytest.mark.benchmark
+async def test_mixed_crud_workload_does_not_regress(benchmark_client: httpx.AsyncClient) -> None:
+    rng = random.Random(2023)
+    plan = rng.choices(list(WORKLOAD_MIX), weights=list(WORKLOAD_MIX.values()), k=TOTAL_REQUESTS)
+    state = await seed_workload_state(client=benchmark_client, disposable_books=plan.count("books:delete"))
+
+    samples, failures, elapsed = await run_workload(
+        client=benchmark_client, state=state, plan=plan, concurrency=CONCURRENCY, rng=rng
+    )
+
+    report = {
+        "overall": {
+            **summarize_latencies([latency for latencies in samples.values() for latency in latencies]),
+            "throughput_rps": len(plan) / elapsed,
+        },
+        **{f"operations.{name}": summarize_latencies(latencies) for name, latencies in samples.items() if latencies},
+    }
+    regressions = record_and_compare(name=f"load_c{CONCURRENCY}_n{TOTAL_REQUESTS}", report=report)
+
+    assert not failures, failures[:10]
+    assert not regressions, regressions
@@ -0,0 +1,70 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR: pathlib.Path = pathlib.Path(__file__).parent.parent.parent.resolve()
+IMPORT_TIME_BUDGET_MS: float = float(os.environ.get("BENCHMARK_IMPORT_TIME_BUDGET_MS", 2000))
+FIRST_REQUEST_BUDGET_MS: float = float(os.environ.get("BENCHMARK_FIRST_REQUEST_BUDGET_MS", 250))
+
+STARTUP_PROBE = """
+import json
+import sys
+import time
+
+import src.main
+from fastapi.testclient import TestClient
+from src.repository.database import async_db
+from src.securities.hashing.hash import hash_generator
+
+lazy_objects = {
+    "uvicorn": "uvicorn" in sys.modules,
+    "async_engine": "async_engine" in vars(async_db),
+    "hash_ctx": "_hash_ctx" in vars(hash_generator),
+}
+client = TestClient(src.main.backend_app)
+started = time.perf_counter()
+response = client.get(src.main.settings.OPENAPI_URL)
+first_request_ms = (time.perf_counter() - started) * 1000
+
+print(json.dumps({"status": response.status_code, "first_request_ms": first_request_ms, "eager": lazy_objects}))
+"""
+
+
+def run_startup_probe(env: dict[str, str]) -> tuple[float, dict]:
+    """
+    Start a cold interpreter with `-X importtime` and return the cumulative import time of `src.main` together with
+    the probe's own measurements.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_time_us = next(
+        int(line.split("|")[1])
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[-1].strip() == "src.main"
+    )
+    return import_time_us / 1000, json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+def test_startup_stays_within_budget(tmp_path: pathlib.Path) -> None:
+    env = {**os.environ, "OPENAPI_SCHEMA_CACHE_PATH": str(tmp_path / "openapi.json")}
+    subprocess.run([sys.executable, "-m", "src.config.openapi"], cwd=BACKEND_DIR, env=env, check=True)
+
+    import_time_ms, probe = run_startup_probe(env=env)
+
+    assert probe["status"] == 200
+    assert not any(probe["eager"].values()), f"Constructed at import time: {probe['eager']}"
+    assert import_time_ms <= IMPORT_TIME_BUDGET_MS, f"`import src.main` took {import_time_ms:.1f}ms"
+    assert (
+        probe["first_request_ms"] <= FIRST_REQUEST_BUDGET_MS
+    ), f"First request took {probe['first_request_ms']:.1f}ms"
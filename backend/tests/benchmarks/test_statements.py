@@ -0,0 +1,98 @@
+import os
+import time
+import typing
+
+import fastapi
+import pytest
+import sqlalchemy
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
+
+from src.models.db.author import Author
+from src.models.schemas.author import AuthorInCreate
+from src.repository.crud.author import AuthorCRUDRepository
+from src.repository.crud.base import lambda_stmt
+from src.repository.database import async_db
+from tests.benchmarks.reporting import record_and_compare, summarize_latencies, time_calls
+
+STATEMENT_ITERATIONS: int = int(os.environ.get("BENCHMARK_STATEMENT_ITERATIONS", 2000))
+ROUND_TRIP_ITERATIONS: int = int(os.environ.get("BENCHMARK_ROUND_TRIP_ITERATIONS", 300))
+
+# (query_cache_size, prepared_statement_cache_size): nothing cached, the compiled SQL only, then both caches.
+STATEMENT_CACHE_PROFILES: dict[str, tuple[int, int]] = {
+    "no_caches": (0, 0),
+    "query_cache": (500, 0),
+    "query_and_prepared_cache": (500, 100),
+}
+
+
+def build_select(id: int) -> sqlalchemy.Select:
+    return sqlalchemy.select(Author).where(Author.id == id)
+
+
+def build_lambda_select(id: int) -> sqlalchemy.StatementLambdaElement:
+    return typing.cast(
+        sqlalchemy.StatementLambdaElement, lambda_stmt(lambda: sqlalchemy.select(Author).where(Author.id == id))
+    )
+
+
+@pytest.mark.benchmark
+def test_statement_construction_and_compilation() -> None:
+    """
+    Building the construct plus its cache key is paid on every call, compiling only on a `query_cache_size` miss.
+    """
+    dialect = PGDialect_asyncpg()
+
+    report = {
+        "select.build_and_cache_key": time_calls(
+            lambda: build_select(id=1)._generate_cache_key(), STATEMENT_ITERATIONS
+        ),
+        "lambda.build_and_cache_key": time_calls(
+            lambda: build_lambda_select(id=1)._generate_cache_key(), STATEMENT_ITERATIONS
+        ),
+        "select.compile": time_calls(lambda: build_select(id=1).compile(dialect=dialect), STATEMENT_ITERATIONS),
+    }
+
+    regressions = record_and_compare(name="statements_compile", report=report)
+
+    assert report["lambda.build_and_cache_key"]["mean_ms"] < report["select.build_and_cache_key"]["mean_ms"]
+    assert not regressions, regressions
+
+
+@pytest.mark.benchmark
+async def test_statement_cache_round_trips(benchmark_app: fastapi.FastAPI) -> None:
+    """
+    `read_author_by_id` end to end under each cache profile: the gap to `no_caches` is the compile and the
+    parse/plan time saved per query.
+    """
+    async with benchmark_app.state.db.async_session_factory() as session:
+        author_repo = AuthorCRUDRepository(async_session=session)
+        author = await author_repo.create_author(author_create=AuthorInCreate(name="statement-benchmark"))
+
+    report = dict()
+
+    for profile, (query_cache_size, prepared_statement_cache_size) in STATEMENT_CACHE_PROFILES.items():
+        engine = create_async_engine(
+            url=async_db.set_async_db_uri,
+            query_cache_size=query_cache_size,
+            connect_args={"prepared_statement_cache_size": prepared_statement_cache_size},
+            pool_size=1,
+        )
+        session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(bind=engine, expire_on_commit=False)
+        latencies_ms: list[float] = list()
+
+        async with session_factory() as session:
+            author_repo = AuthorCRUDRepository(async_session=session)
+            await author_repo.read_author_by_id(id=author.id)
+
+            for _ in range(ROUND_TRIP_ITERATIONS):
+                started = time.perf_counter()
+                await author_repo.read_author_by_id(id=author.id)
+                latencies_ms.append((time.perf_counter() - started) * 1000)
+
+        await engine.dispose()
+        report[f"author_by_id.{profile}"] = summarize_latencies(latencies_ms)
+
+    regressions = record_and_compare(name="statements_round_trip", report=report)
+
+    assert not regressions, regressions
@@ -3,7 +3,23 @@ import fastapi
 import httpx
 import pytest
 
+from src.api.middlewares.response_cache import response_cache
 from src.main import initialize_backend_application
+from src.repository.count import count_cache
+from src.repository.revocations import token_revocations
+from src.securities.authorizations.token_cache import verified_token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> None:
+    """
+    The response, count, and verified token caches are process-wide, so an entry cached by one test must not leak into
+    the next one. The revocations are read again after the tables have been recreated.
+    """
+    response_cache.clear()
+    count_cache.clear()
+    verified_token_cache.clear()
+    token_revocations.reset()
 
 
 @pytest.fixture(name="backend_test_app")
@@ -24,7 +40,7 @@ async def initialize_backend_test_application(backend_test_app: fastapi.FastAPI)
 @pytest.fixture(name="async_client")
 async def async_client(initialize_backend_test_application: fastapi.FastAPI) -> httpx.AsyncClient:  # type: ignore
     async with httpx.AsyncClient(
-        app=initialize_backend_test_application,
+        transport=httpx.ASGITransport(app=initialize_backend_test_application),
         base_url="http://testserver",
         headers={"Content-Type": "application/json"},
     ) as client:
@@ -0,0 +1,124 @@
+import asyncio
+
+import fastapi
+import httpx
+
+from src.api.middlewares.admission import AdaptiveConcurrencyLimit, AdmissionControlMiddleware
+from src.models.schemas.batch import SubRequestInBatch
+from src.utilities.http.batch import run_sub_requests
+
+
+def build_busy_limit(limit: int) -> AdaptiveConcurrencyLimit:
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=limit, min_limit=2, max_limit=100)
+    concurrency_limit.in_flight = limit
+    return concurrency_limit
+
+
+def test_limit_grows_while_latency_is_stable() -> None:
+    concurrency_limit = build_busy_limit(limit=10)
+
+    for _ in range(20):
+        concurrency_limit.in_flight += 1
+        concurrency_limit.release(latency=0.01)
+
+    assert concurrency_limit.limit > 10
+
+
+def test_limit_shrinks_when_latency_climbs_and_on_overload() -> None:
+    concurrency_limit = build_busy_limit(limit=50)
+    concurrency_limit.in_flight += 1
+    concurrency_limit.release(latency=0.01)
+
+    for _ in range(20):
+        concurrency_limit.in_flight += 1
+        concurrency_limit.release(latency=0.2)
+
+    assert concurrency_limit.limit < 50
+
+    shrunk_limit = concurrency_limit.limit
+    concurrency_limit.in_flight += 1
+    concurrency_limit.release(latency=0.01, is_overloaded=True)
+
+    assert concurrency_limit.limit == max(2, shrunk_limit * 0.9)
+
+
+def test_idle_limit_does_not_grow() -> None:
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=10, min_limit=2, max_limit=100)
+
+    for _ in range(20):
+        assert concurrency_limit.try_acquire()
+        concurrency_limit.release(latency=0.01)
+
+    assert concurrency_limit.limit == 10
+
+
+async def test_excess_requests_are_shed_by_priority() -> None:
+    release_requests = asyncio.Event()
+    app = fastapi.FastAPI()
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limit=AdaptiveConcurrencyLimit(initial_limit=4, min_limit=4, max_limit=4),
+        priority_shares={"read": 1.0, "write": 0.8, "expensive": 0.5},
+        route_priorities={"/auth/signin": "expensive"},
+        exempt_routes=["/events"],
+        retry_after=1,
+    )
+
+    @app.get("/books")
+    async def read_books() -> None:
+        await release_requests.wait()
+
+    @app.post("/auth/signin")
+    async def signin() -> None:
+        return None
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        pending_reads = [asyncio.create_task(client.get("/books")) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        shed_signin = await client.post("/auth/signin")
+        pending_reads += [asyncio.create_task(client.get("/books")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release_requests.set()
+        read_responses = await asyncio.gather(*pending_reads)
+
+        assert (await client.post("/auth/signin")).status_code == 200
+
+    assert shed_signin.status_code == 503
+    assert shed_signin.headers["retry-after"] == "1"
+    assert sorted(response.status_code for response in read_responses) == [200, 200, 200, 200, 503]
+
+
+async def test_batch_sub_requests_run_in_the_batch_slot() -> None:
+    concurrency_limit = AdaptiveConcurrencyLimit(initial_limit=1, min_limit=1, max_limit=1)
+    app = fastapi.FastAPI()
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        limit=concurrency_limit,
+        priority_shares={"read": 1.0, "write": 0.8},
+        route_priorities=dict(),
+        exempt_routes=list(),
+        retry_after=1,
+    )
+
+    @app.get("/api/books/{id}")
+    async def read_book(id: int) -> dict[str, int]:
+        return {"id": id}
+
+    @app.post("/api/batch")
+    async def run_batch(request: fastapi.Request) -> list[int]:
+        sub_responses = await run_sub_requests(
+            app=request.app,
+            parent_scope=request.scope,
+            api_prefix="/api",
+            sub_requests=[SubRequestInBatch(path=f"/books/{id}") for id in range(4)],
+            max_concurrency=4,
+        )
+        return [sub_response.status for sub_response in sub_responses]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver") as client:
+        response = await client.post("/api/batch")
+
+    assert response.json() == [200, 200, 200, 200]
+    assert concurrency_limit.in_flight == 0
+    assert concurrency_limit.limit == 1
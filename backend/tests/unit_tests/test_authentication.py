@@ -0,0 +1,62 @@
+import uuid
+
+import httpx
+import pytest
+
+from src.config.manager import settings
+from src.securities.authorizations.jwt import jwt_generator
+
+
+async def signup(async_client: httpx.AsyncClient) -> dict:
+    username = uuid.uuid4().hex[:12]
+    response = await async_client.post(
+        "/api/auth/signup", json={"username": username, "email": f"{username}@example.com", "password": "password"}
+    )
+
+    assert response.status_code == 201
+    return response.json()["authorizedAccount"]
+
+
+async def refresh(async_client: httpx.AsyncClient, refresh_token: str) -> httpx.Response:
+    return await async_client.post("/api/auth/refresh", json={"refreshToken": refresh_token})
+
+
+async def test_refresh_rotates_the_refresh_token(async_client: httpx.AsyncClient) -> None:
+    account = await signup(async_client=async_client)
+
+    response = await refresh(async_client=async_client, refresh_token=account["refreshToken"])
+    tokens = response.json()
+
+    assert response.status_code == 200
+    assert tokens["refreshToken"] != account["refreshToken"]
+    assert jwt_generator.retrieve_details_from_token(token=tokens["token"], secret_key=settings.JWT_SECRET_KEY) == [
+        account["username"],
+        account["email"],
+    ]
+    assert (await refresh(async_client=async_client, refresh_token=tokens["refreshToken"])).status_code == 200
+
+
+async def test_reused_refresh_token_revokes_its_family(async_client: httpx.AsyncClient) -> None:
+    account = await signup(async_client=async_client)
+    rotated_refresh_token = (await refresh(async_client=async_client, refresh_token=account["refreshToken"])).json()[
+        "refreshToken"
+    ]
+
+    assert (await refresh(async_client=async_client, refresh_token=account["refreshToken"])).status_code == 401
+    assert (await refresh(async_client=async_client, refresh_token=rotated_refresh_token)).status_code == 401
+
+
+async def test_access_token_is_not_a_refresh_token(async_client: httpx.AsyncClient) -> None:
+    account = await signup(async_client=async_client)
+
+    assert (await refresh(async_client=async_client, refresh_token=account["token"])).status_code == 401
+    assert (await refresh(async_client=async_client, refresh_token="not-a-token")).status_code == 401
+
+
+async def test_signout_revokes_the_refresh_tokens_of_its_signin(async_client: httpx.AsyncClient) -> None:
+    account = await signup(async_client=async_client)
+    tokens = (await refresh(async_client=async_client, refresh_token=account["refreshToken"])).json()
+    headers = {"Authorization": f"{settings.JWT_TOKEN_PREFIX} {tokens['token']}"}
+
+    assert (await async_client.post("/api/auth/signout", headers=headers)).status_code == 204
+    assert (await refresh(async_client=async_client, refresh_token=tokens["refreshToken"])).status_code == 401
@@ -1,8 +1,11 @@
 import unittest
-from fastapi.testclient import TestClient
 from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
 from src.main import backend_app
 from src.models.db.author import Author
+from src.models.schemas.version import ResourceVersion
 
 
 class AuthorTestCase(unittest.TestCase):
@@ -10,8 +13,11 @@ class AuthorTestCase(unittest.TestCase):
         # Create a test client for the FastAPI application
         self.test_client = TestClient(backend_app)
 
+    @patch("src.repository.crud.author.AuthorCRUDRepository.read_authors_version")
     @patch("src.repository.crud.author.AuthorCRUDRepository.read_authors")
-    def test_get_authors(self, mock_read_authors):
+    def test_get_authors(self, mock_read_authors, mock_read_authors_version):
+        mock_read_authors_version.return_value = ResourceVersion(identity="author:2:2:None", last_modified=None)
+
         # Define the mocked data
         mocked_authors = [Author(id=1, name="Author 1"), Author(id=2, name="Author 2")]
 
@@ -44,8 +50,11 @@ class AuthorTestCase(unittest.TestCase):
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.json(), {"id": 1, "name": "John Doe"})
 
+    @patch("src.repository.crud.author.AuthorCRUDRepository.read_author_version_by_id")
     @patch("src.repository.crud.author.AuthorCRUDRepository.read_author_by_id")
-    def test_get_author_by_id(self, mock_read_author_by_id):
+    def test_get_author_by_id(self, mock_read_author_by_id, mock_read_author_version_by_id):
+        mock_read_author_version_by_id.return_value = ResourceVersion(identity="author:1:None", last_modified=None)
+
         # Define the mocked author ID
         author_id = 1
 
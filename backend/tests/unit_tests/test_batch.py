@@ -0,0 +1,63 @@
+import asyncio
+
+import fastapi
+import httpx
+import pytest
+
+from src.models.schemas.batch import SubRequestInBatch
+from src.utilities.http.batch import run_sub_requests
+
+
+async def test_batch_runs_sub_requests_in_order_and_returns_every_response(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.post(
+        "/api/batch",
+        json={
+            "requests": [
+                {"id": "create", "method": "POST", "path": "/authors", "body": {"name": "Batched Author"}},
+                {"id": "list", "path": "/authors?filter=name:eq:Batched Author&count=exact"},
+                {"id": "missing", "path": "/authors/999999"},
+            ]
+        },
+    )
+    responses = {sub_response["id"]: sub_response for sub_response in response.json()["responses"]}
+
+    assert response.status_code == 200
+    assert responses["create"]["status"] == 201
+    assert responses["list"]["status"] == 200
+    assert responses["list"]["body"] == [responses["create"]["body"]]
+    assert responses["list"]["headers"]["x-total-count"] == "1"
+    assert responses["missing"]["status"] == 404
+
+
+@pytest.mark.parametrize("path", ["/batch", "/events?resource=authors", "authors"])
+async def test_batch_rejects_paths_that_cannot_be_batched(async_client: httpx.AsyncClient, path: str) -> None:
+    response = await async_client.post("/api/batch", json={"requests": [{"path": path}]})
+
+    assert response.status_code == 400
+
+
+async def test_reads_run_concurrently_up_to_the_budget_and_writes_alone() -> None:
+    in_flight, peak_in_flight, order = 0, 0, list()
+    app = fastapi.FastAPI()
+
+    @app.api_route("/api/items/{id}", methods=["GET", "POST"])
+    async def item(id: int, request: fastapi.Request) -> dict[str, int]:
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        order.append(f"{request.method} {id}")
+        in_flight -= 1
+        return {"id": id}
+
+    sub_requests = [SubRequestInBatch(path=f"/items/{id}") for id in range(5)]
+    sub_requests += [SubRequestInBatch(method="POST", path="/items/5"), SubRequestInBatch(path="/items/6")]
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "scheme": "http", "headers": []}
+
+    sub_responses = await run_sub_requests(
+        app=app, parent_scope=scope, api_prefix="/api", sub_requests=sub_requests, max_concurrency=3
+    )
+
+    assert [sub_response.body for sub_response in sub_responses] == [{"id": id} for id in range(7)]
+    assert peak_in_flight == 3
+    assert order[5:] == ["POST 5", "GET 6"]
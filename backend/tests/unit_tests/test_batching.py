@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import fastapi
+import pytest
+import sqlalchemy.exc
+
+from src.models.db.author import Author
+from src.repository.batching import InsertBatcher
+
+
+async def test_concurrent_inserts_share_one_transaction(initialize_backend_test_application: fastapi.FastAPI) -> None:
+    insert_batcher = InsertBatcher(table=Author, max_batch_size=100, max_delay=0.02)
+
+    authors = await asyncio.gather(
+        *(insert_batcher.insert(values={"name": f"batched-{index}"}) for index in range(20))
+    )
+
+    assert [author.name for author in authors] == [f"batched-{index}" for index in range(20)]
+    assert len({author.id for author in authors}) == 20
+    assert len({author.created_at for author in authors}) == 1
+
+
+async def test_a_full_batch_is_flushed_without_waiting(initialize_backend_test_application: fastapi.FastAPI) -> None:
+    insert_batcher = InsertBatcher(table=Author, max_batch_size=3, max_delay=10)
+    started = time.monotonic()
+
+    await asyncio.gather(*(insert_batcher.insert(values={"name": f"full-batch-{index}"}) for index in range(3)))
+
+    assert time.monotonic() - started < 5
+
+
+async def test_every_caller_gets_its_own_error(initialize_backend_test_application: fastapi.FastAPI) -> None:
+    insert_batcher = InsertBatcher(table=Author, max_batch_size=100, max_delay=0.02)
+
+    results = await asyncio.gather(
+        insert_batcher.insert(values={"name": "unique-1"}),
+        insert_batcher.insert(values={"name": "duplicate"}),
+        insert_batcher.insert(values={"name": "duplicate"}),
+        insert_batcher.insert(values={"name": "unique-2"}),
+        return_exceptions=True,
+    )
+
+    assert [result.name for result in results if isinstance(result, Author)] == ["unique-1", "duplicate", "unique-2"]
+    assert isinstance(results[2], sqlalchemy.exc.IntegrityError)
+
+    await insert_batcher.drain()
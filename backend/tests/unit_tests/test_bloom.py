@@ -0,0 +1,108 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.repository.bloom import AccountFilter, BloomFilter
+from src.repository.crud.account import AccountCRUDRepository
+from src.repository.database import async_db
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    values = [f"user-{index}" for index in range(1000)]
+
+    for value in values:
+        bloom_filter.add(value)
+
+    false_positives = sum(f"other-{index}" in bloom_filter for index in range(10000))
+
+    assert all(value in bloom_filter for value in values)
+    assert false_positives < 300
+
+
+async def test_definitely_available_username_skips_the_database(monkeypatch: pytest.MonkeyPatch) -> None:
+    account_filter = AccountFilter(capacity=100, error_rate=0.01, sync_interval=60, sync_lag=20)
+    account_filter.is_loaded = True
+    account_filter.synchronize = AsyncMock()  # type: ignore
+    account_filter.add(username="taken", email="taken@example.com")
+    monkeypatch.setattr("src.repository.crud.account.account_filter", account_filter)
+    session = MagicMock(info=dict())
+    session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=None)))
+    account_repo = AccountCRUDRepository(async_session=session)
+
+    assert await account_repo.is_username_taken(username="free")
+    assert await account_repo.is_email_taken(email="free@example.com")
+    session.execute.assert_not_awaited()
+
+    assert await account_repo.is_username_taken(username="taken")
+    assert session.execute.await_count == 1
+
+
+async def test_availability_follows_signups(async_client: httpx.AsyncClient) -> None:
+    username = uuid.uuid4().hex[:12]
+    params = {"username": username, "email": f"{username}@example.com"}
+
+    before_signup = await async_client.get("/api/auth/availability", params=params)
+    await async_client.post("/api/auth/signup", json={**params, "password": "password"})
+    after_signup = await async_client.get("/api/auth/availability", params=params)
+
+    assert before_signup.json() == {"username": True, "email": True}
+    assert after_signup.json() == {"username": False, "email": False}
+    assert (await async_client.get("/api/auth/availability", params={"username": "x"})).json() == {
+        "username": True,
+        "email": None,
+    }
+    assert (await async_client.get("/api/auth/availability")).status_code == 400
+
+
+async def test_signup_missed_by_a_stale_filter_is_still_rejected(
+    async_client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    username = uuid.uuid4().hex[:12]
+    account = {"username": username, "email": f"{username}@example.com", "password": "password"}
+    await async_client.post("/api/auth/signup", json=account)
+
+    stale_account_filter = AccountFilter(capacity=100, error_rate=0.01, sync_interval=60, sync_lag=20)
+    stale_account_filter.is_loaded = True
+    stale_account_filter.synchronize = AsyncMock()  # type: ignore
+    monkeypatch.setattr("src.repository.crud.account.account_filter", stale_account_filter)
+
+    assert (await async_client.post("/api/auth/signup", json=account)).status_code == 400
+
+
+async def test_availability_sees_the_signups_of_other_workers(
+    async_client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    other_worker_filter = AccountFilter(capacity=100, error_rate=0.01, sync_interval=0, sync_lag=20)
+
+    async with async_db.async_engine.connect() as connection:
+        await other_worker_filter.load(connection=connection)
+
+    username = uuid.uuid4().hex[:12]
+    params = {"username": username, "email": f"{username}@example.com"}
+    await async_client.post("/api/auth/signup", json={**params, "password": "password"})
+    monkeypatch.setattr("src.repository.crud.account.account_filter", other_worker_filter)
+
+    assert (await async_client.get("/api/auth/availability", params=params)).json() == {
+        "username": False,
+        "email": False,
+    }
+    assert other_worker_filter.is_username_possibly_taken(username=username)
+
+
+async def test_update_to_a_taken_username_is_rejected(async_client: httpx.AsyncClient) -> None:
+    usernames = [uuid.uuid4().hex[:12] for _ in range(2)]
+
+    for username in usernames:
+        account = {"username": username, "email": f"{username}@example.com", "password": "password"}
+        await async_client.post("/api/auth/signup", json=account)
+
+    account_id = (await async_client.get("/api/accounts", params={"sort": "-id", "limit": 1})).json()[0]["id"]
+    response = await async_client.patch(
+        f"/api/accounts/{account_id}", params={"query_id": account_id, "update_username": usernames[0]}
+    )
+
+    assert response.status_code == 400, response.json()
+    assert "already taken" in response.json()["detail"]
@@ -0,0 +1,58 @@
+import uuid
+
+import httpx
+import pytest
+
+from src.config.manager import settings
+from src.securities.hashing.hash import HashGenerator
+
+
+@pytest.fixture(autouse=True)
+def cheap_provisioning(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "HASHING_ARGON2_TIME_COST", 1)
+    monkeypatch.setattr(settings, "HASHING_ARGON2_MEMORY_COST", 1024)
+    monkeypatch.setattr(settings, "HASHING_ARGON2_PARALLELISM", 1)
+    monkeypatch.setattr(settings, "BULK_PROVISIONING_BATCH_SIZE", 2)
+    monkeypatch.setattr("src.securities.hashing.password.hash_generator", HashGenerator())
+
+
+def build_account(username: str) -> dict[str, str]:
+    return {"username": username, "email": f"{username}@example.com", "password": f"{username}-password"}
+
+
+async def test_bulk_provisioning_reports_every_row(async_client: httpx.AsyncClient) -> None:
+    prefix = uuid.uuid4().hex[:8]
+    existing_account = build_account(username=f"{prefix}-existing")
+    await async_client.post("/api/auth/signup", json=existing_account)
+    accounts = [
+        build_account(username=f"{prefix}-1"),
+        build_account(username=f"{prefix}-2"),
+        build_account(username=f"{prefix}-1"),
+        existing_account,
+        build_account(username=f"{prefix}-3"),
+    ]
+
+    response = await async_client.post(
+        "/api/accounts/bulk", json={"accounts": accounts}, headers={"X-API-Token": settings.API_TOKEN}
+    )
+    results = response.json()["results"]
+
+    assert response.status_code == 200
+    assert (response.json()["createdCount"], response.json()["failedCount"]) == (3, 2)
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert [result["id"] is not None for result in results] == [True, True, False, False, True]
+    assert "more than once" in results[2]["error"]
+    assert "already taken" in results[3]["error"]
+
+    signin_response = await async_client.post("/api/auth/signin", json=accounts[4])
+    assert signin_response.status_code == 202
+    assert signin_response.json()["id"] == results[4]["id"]
+
+
+async def test_bulk_provisioning_requires_the_api_token(async_client: httpx.AsyncClient) -> None:
+    accounts = {"accounts": [build_account(username=uuid.uuid4().hex[:8])]}
+
+    assert (await async_client.post("/api/accounts/bulk", json=accounts)).status_code == 403
+    assert (
+        await async_client.post("/api/accounts/bulk", json=accounts, headers={"X-API-Token": "wrong"})
+    ).status_code == 403
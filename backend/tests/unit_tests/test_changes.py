@@ -0,0 +1,49 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import backend_app
+from src.models.db.book import Book
+from src.repository.changes import ChangeSet, ChangeWatermark, decode_watermark, encode_watermark
+from src.utilities.exceptions.database import InvalidQueryExpression
+
+WATERMARK = ChangeWatermark(
+    modified_at=datetime.datetime(2023, 6, 1, 8, 0, 0, 250000, tzinfo=datetime.timezone.utc),
+    modified_id=42,
+    deleted_at=datetime.datetime(2023, 5, 30, 23, 59, 59, tzinfo=datetime.timezone.utc),
+    deleted_id=7,
+)
+
+
+def test_watermark_round_trips_as_an_opaque_token() -> None:
+    token = encode_watermark(watermark=WATERMARK)
+
+    assert token.isascii() and "=" not in token and "2023" not in token
+    assert decode_watermark(token=token) == WATERMARK
+    assert decode_watermark(token=None) == ChangeWatermark()
+
+
+@pytest.mark.parametrize("token", ["garbage", encode_watermark(WATERMARK)[:-4], "WzIsMSwyLDMsNF0"])
+def test_tampered_watermark_is_rejected(token: str) -> None:
+    with pytest.raises(InvalidQueryExpression):
+        decode_watermark(token=token)
+
+
+@patch("src.repository.crud.book.BookCRUDRepository.read_books_changes")
+def test_book_changes_return_upserts_deletes_and_next_watermark(mock_read_books_changes) -> None:
+    mock_read_books_changes.return_value = ChangeSet(
+        upserted=[Book(id=42, name="Book 42", author_id=1)], deleted=[7], watermark=WATERMARK, has_more=False
+    )
+
+    response = TestClient(backend_app).get("/api/books/changes", params={"limit": 100})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "upserted": [{"id": 42, "name": "Book 42", "authorId": 1}],
+        "deleted": [7],
+        "watermark": encode_watermark(watermark=WATERMARK),
+        "hasMore": False,
+    }
+    mock_read_books_changes.assert_called_once_with(watermark=ChangeWatermark(), limit=100)
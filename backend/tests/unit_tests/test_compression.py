@@ -0,0 +1,105 @@
+import gzip
+import zlib
+
+import brotli
+import fastapi
+import pytest
+import zstandard
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api.middlewares.compression import CompressionMiddleware, ContentEncoder, negotiate_content_encoding
+
+DECODERS = {
+    "gzip": gzip.decompress,
+    "br": brotli.decompress,
+    "zstd": lambda body: zstandard.ZstdDecompressor().decompressobj().decompress(body),
+}
+
+
+def build_compressed_app() -> fastapi.FastAPI:
+    app = fastapi.FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=100,
+        levels={"zstd": 3, "br": 4, "gzip": 6},
+        route_levels={},
+    )
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("tiny")
+
+    @app.get("/large")
+    async def large() -> PlainTextResponse:
+        return PlainTextResponse("compressible " * 100, headers={"ETag": '"v1"'})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse((f"data: {index}\n\n" for index in range(3)), media_type="text/plain")
+
+    @app.get("/events")
+    async def events() -> StreamingResponse:
+        return StreamingResponse((f"data: {index}\n\n" for index in range(3)), media_type="text/event-stream")
+
+    return app
+
+
+def test_negotiation_respects_quality_values_and_server_preference() -> None:
+    available_encodings = ["zstd", "br", "gzip"]
+
+    assert negotiate_content_encoding("gzip, br, zstd", available_encodings) == "zstd"
+    assert negotiate_content_encoding("gzip;q=1.0, br;q=0.5", available_encodings) == "gzip"
+    assert negotiate_content_encoding("*;q=0.1, zstd;q=0", available_encodings) == "br"
+    assert negotiate_content_encoding("identity", available_encodings) is None
+    assert negotiate_content_encoding("", available_encodings) is None
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_streamed_chunks_are_decodable_as_they_arrive(encoding: str) -> None:
+    content_encoder = ContentEncoder(encoding=encoding, level=3)
+    chunks = [b"data: 1\n\n", b"data: 2\n\n", b""]
+
+    encoded_chunks = [content_encoder.encode(chunk=chunk, is_final=index == 2) for index, chunk in enumerate(chunks)]
+
+    if encoding == "gzip":
+        assert zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(encoded_chunks[0]) == b"data: 1\n\n"
+    assert DECODERS[encoding](b"".join(encoded_chunks)) == b"".join(chunks)
+
+
+def test_middleware_compresses_large_and_streamed_bodies_only() -> None:
+    test_client = TestClient(build_compressed_app())
+
+    small_response = test_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    large_response = test_client.get("/large", headers={"Accept-Encoding": "br"})
+    stream_response = test_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    event_stream_response = test_client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in small_response.headers
+    assert small_response.headers["vary"] == "Accept-Encoding"
+    assert large_response.headers["content-encoding"] == "br"
+    assert large_response.headers["etag"] == 'W/"v1"'
+    assert large_response.headers["vary"] == "Accept-Encoding"
+    assert large_response.text == "compressible " * 100
+    assert stream_response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in stream_response.headers
+    assert stream_response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert "content-encoding" not in event_stream_response.headers
+
+
+def test_uncompressed_responses_vary_on_accept_encoding_too() -> None:
+    test_client = TestClient(build_compressed_app())
+
+    identity_response = test_client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in identity_response.headers
+    assert identity_response.headers["vary"] == "Accept-Encoding"
+
+
+def test_route_levels_override_the_default_level() -> None:
+    middleware = CompressionMiddleware(
+        app=fastapi.FastAPI(), minimum_size=0, levels={"gzip": 6}, route_levels={"/api/books": {"gzip": 1}}
+    )
+
+    assert middleware.get_level(path="/api/books/1", encoding="gzip") == 1
+    assert middleware.get_level(path="/api/authors", encoding="gzip") == 6
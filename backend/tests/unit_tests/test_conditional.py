@@ -0,0 +1,103 @@
+import datetime
+from unittest.mock import patch
+
+import fastapi
+import sqlalchemy
+from fastapi.testclient import TestClient
+
+from src.config.manager import settings
+from src.main import backend_app
+from src.models.db.author import Author
+from src.models.schemas.author import AuthorInCreate
+from src.models.schemas.version import ResourceVersion
+from src.repository.crud.author import AuthorCRUDRepository
+from src.repository.database import async_db
+from src.utilities.http.conditional import format_http_date, generate_weak_etag, is_etag_matched, is_modified_since
+
+LAST_MODIFIED = datetime.datetime(2023, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+AUTHOR_VERSION = ResourceVersion(identity=f"author:1:{LAST_MODIFIED.isoformat()}", last_modified=LAST_MODIFIED)
+
+
+def test_weak_etag_is_stable_and_version_specific() -> None:
+    other_version = ResourceVersion(identity="author:1:2023-05-02T00:00:00+00:00", last_modified=LAST_MODIFIED)
+
+    assert generate_weak_etag(AUTHOR_VERSION) == generate_weak_etag(AUTHOR_VERSION)
+    assert generate_weak_etag(AUTHOR_VERSION).startswith('W/"')
+    assert generate_weak_etag(AUTHOR_VERSION) != generate_weak_etag(other_version)
+
+
+def test_etag_matching_uses_weak_comparison() -> None:
+    etag = generate_weak_etag(AUTHOR_VERSION)
+
+    assert is_etag_matched(if_none_match=etag.removeprefix("W/"), etag=etag)
+    assert is_etag_matched(if_none_match=f'"other", {etag}', etag=etag)
+    assert is_etag_matched(if_none_match="*", etag=etag)
+    assert not is_etag_matched(if_none_match='W/"other"', etag=etag)
+
+
+def test_modified_since_ignores_sub_second_precision() -> None:
+    assert not is_modified_since(if_modified_since=format_http_date(LAST_MODIFIED), last_modified=LAST_MODIFIED)
+    assert is_modified_since(if_modified_since="Mon, 01 May 2023 12:30:14 GMT", last_modified=LAST_MODIFIED)
+    assert is_modified_since(if_modified_since="not a date", last_modified=LAST_MODIFIED)
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_author_by_id")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_author_version_by_id")
+def test_get_author_answers_304_without_loading_the_body(
+    mock_read_author_version_by_id, mock_read_author_by_id
+) -> None:
+    mock_read_author_version_by_id.return_value = AUTHOR_VERSION
+    mock_read_author_by_id.return_value = Author(id=1, name="John Doe")
+    test_client = TestClient(backend_app)
+
+    response = test_client.get("/api/authors/1")
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert response.headers["last-modified"] == "Mon, 01 May 2023 12:30:15 GMT"
+
+    not_modified_response = test_client.get("/api/authors/1", headers={"If-None-Match": etag})
+
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.headers["etag"] == etag
+    assert mock_read_author_by_id.call_count == 1
+
+    since_response = test_client.get(
+        "/api/authors/1", headers={"If-Modified-Since": response.headers["last-modified"]}
+    )
+
+    assert since_response.status_code == 304
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_author_by_id")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_author_version_by_id")
+def test_unsettled_version_gets_no_validators_and_no_304(
+    mock_read_author_version_by_id, mock_read_author_by_id
+) -> None:
+    mock_read_author_version_by_id.return_value = AUTHOR_VERSION.copy(update={"is_settled": False})
+    mock_read_author_by_id.return_value = Author(id=1, name="John Doe")
+    test_client = TestClient(backend_app)
+
+    response = test_client.get("/api/authors/1", headers={"If-None-Match": generate_weak_etag(AUTHOR_VERSION)})
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "last-modified" not in response.headers
+
+
+async def test_versions_settle_after_the_watermark_lag(initialize_backend_test_application: fastapi.FastAPI) -> None:
+    async with async_db.async_session_factory() as session:
+        author_repo = AuthorCRUDRepository(async_session=session)
+        author = await author_repo.create_author(author_create=AuthorInCreate(name="Unsettled Author"))
+
+        assert not (await author_repo.read_author_version_by_id(id=author.id)).is_settled
+        assert not (await author_repo.read_authors_version()).is_settled
+
+        await session.execute(
+            sqlalchemy.update(Author)
+            .where(Author.created_at > sqlalchemy.func.now() - datetime.timedelta(seconds=settings.SYNC_WATERMARK_LAG))
+            .values(created_at=Author.created_at - datetime.timedelta(seconds=settings.SYNC_WATERMARK_LAG + 1))
+        )
+
+        assert (await author_repo.read_author_version_by_id(id=author.id)).is_settled
+        assert (await author_repo.read_authors_version()).is_settled
@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+import fastapi
+import pytest
+import sqlalchemy
+import sqlalchemy.exc
+from fastapi.testclient import TestClient
+
+from src.api.middlewares.deadline import DeadlineMiddleware
+from src.repository.database import async_db
+from src.repository.events import register_db_connection_events
+from src.utilities.exceptions.http.handlers import register_database_timeout_handlers
+from src.utilities.http.deadline import get_remaining_time, request_deadline
+
+
+class QueryCanceledError(Exception):
+    sqlstate = "57014"
+
+
+def build_deadline_app() -> fastapi.FastAPI:
+    app = fastapi.FastAPI()
+    app.add_middleware(DeadlineMiddleware, timeout=0.2, exempt_routes=["/stream"])
+    register_database_timeout_handlers(backend_app=app)
+
+    @app.get("/fast")
+    async def fast() -> dict[str, float | None]:
+        return {"remaining": get_remaining_time()}
+
+    @app.get("/slow")
+    async def slow() -> None:
+        await asyncio.sleep(5)
+
+    @app.get("/stream")
+    async def stream() -> None:
+        await asyncio.sleep(0.3)
+
+    @app.get("/pool-timeout")
+    async def pool_timeout() -> None:
+        raise sqlalchemy.exc.TimeoutError("QueuePool limit reached")
+
+    @app.get("/statement-timeout")
+    async def statement_timeout() -> None:
+        raise sqlalchemy.exc.DBAPIError("SELECT pg_sleep(10)", None, QueryCanceledError())  # type: ignore
+
+    @app.get("/command-timeout")
+    async def command_timeout() -> None:
+        raise TimeoutError()
+
+    return app
+
+
+def test_requests_within_their_deadline_see_the_remaining_time() -> None:
+    response = TestClient(build_deadline_app()).get("/fast")
+
+    assert response.status_code == 200
+    assert 0 < response.json()["remaining"] <= 0.2
+    assert get_remaining_time() is None
+
+
+def test_requests_past_their_deadline_are_cancelled_with_504() -> None:
+    started = time.monotonic()
+    response = TestClient(build_deadline_app()).get("/slow")
+
+    assert response.status_code == 504
+    assert time.monotonic() - started < 2
+
+
+def test_exempt_routes_have_no_deadline() -> None:
+    assert TestClient(build_deadline_app()).get("/stream").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "path, status_code",
+    [("/pool-timeout", 503), ("/statement-timeout", 504), ("/command-timeout", 504)],
+)
+def test_database_timeouts_map_to_clean_responses(path: str, status_code: int) -> None:
+    response = TestClient(build_deadline_app()).get(path)
+
+    assert response.status_code == status_code
+    assert ("retry-after" in response.headers) == (status_code == 503)
+
+
+async def test_statement_timeout_follows_the_request_deadline() -> None:
+    register_db_connection_events()
+    deadline_token = request_deadline.set(time.monotonic() + 0.3)
+
+    try:
+        async with async_db.async_session_factory() as session:
+            with pytest.raises(sqlalchemy.exc.DBAPIError) as timeout_error:
+                await session.execute(sqlalchemy.text("SELECT pg_sleep(5)"))
+
+    finally:
+        request_deadline.reset(deadline_token)
+        await async_db.async_engine.dispose()
+
+    assert timeout_error.value.orig.sqlstate == "57014"  # type: ignore
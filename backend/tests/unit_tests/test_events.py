@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock
+
+from src.repository.notifications import ChangeEventBroker
+from src.utilities.http.sse import format_server_sent_event, generate_change_events
+
+BOOK_CREATED = {"resource": "books", "action": "create", "id": 1}
+AUTHOR_CREATED = {"resource": "authors", "action": "create", "id": 1}
+
+
+async def test_events_fan_out_to_matching_subscribers() -> None:
+    broker = ChangeEventBroker(channel="test_changes", max_queue_size=10)
+    book_subscription = broker.subscribe(resources={"books"})
+    all_subscription = broker.subscribe(resources=set())
+
+    broker.publish(change_event=BOOK_CREATED)
+    broker.publish(change_event=AUTHOR_CREATED)
+
+    assert book_subscription.queue.qsize() == 1
+    assert all_subscription.queue.qsize() == 2
+    assert await book_subscription.queue.get() == BOOK_CREATED
+
+
+async def test_slow_subscriber_is_dropped_without_blocking_the_others() -> None:
+    broker = ChangeEventBroker(channel="test_changes", max_queue_size=2)
+    slow_subscription = broker.subscribe(resources=set())
+
+    for _ in range(2):
+        broker.publish(change_event=BOOK_CREATED)
+
+    fast_subscription = broker.subscribe(resources=set())
+    broker.publish(change_event=BOOK_CREATED)
+
+    assert slow_subscription.is_dropped
+    assert broker.subscriber_count == 1
+    assert await slow_subscription.queue.get() is None
+    assert await fast_subscription.queue.get() == BOOK_CREATED
+
+
+async def test_stream_ends_with_a_close_event_once_dropped() -> None:
+    broker = ChangeEventBroker(channel="test_changes", max_queue_size=1)
+    subscription = broker.subscribe(resources={"books"})
+    broker.publish(change_event=BOOK_CREATED)
+    broker.publish(change_event=BOOK_CREATED)
+
+    request = AsyncMock(is_disconnected=AsyncMock(return_value=False))
+    stream = generate_change_events(
+        request=request, subscription=subscription, unsubscribe=broker.unsubscribe, heartbeat=1, retry=3000
+    )
+    messages = [message async for message in stream]
+
+    assert messages[0].startswith("retry: 3000\nevent: open\n")
+    assert messages[-1] == format_server_sent_event(data={"reason": "slow-consumer"}, event="close")
+    assert format_server_sent_event(data=BOOK_CREATED, event="books.create") == (
+        'event: books.create\ndata: {"resource":"books","action":"create","id":1}\n\n'
+    )
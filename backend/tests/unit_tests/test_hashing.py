@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pydantic
+import pytest
+from passlib.hash import argon2, bcrypt
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.models.schemas.account import AccountInLogin
+from src.repository.crud.account import AccountCRUDRepository
+from src.securities.hashing.hash import HashGenerator
+from src.utilities.exceptions.password import PasswordDoesNotMatch
+
+PASSWORD: str = "password"
+
+
+@pytest.fixture
+def cheap_hash_generator(monkeypatch: pytest.MonkeyPatch) -> HashGenerator:
+    monkeypatch.setattr(settings, "HASHING_ARGON2_TIME_COST", 1)
+    monkeypatch.setattr(settings, "HASHING_ARGON2_MEMORY_COST", 1024)
+    monkeypatch.setattr(settings, "HASHING_ARGON2_PARALLELISM", 1)
+    hash_generator = HashGenerator()
+    monkeypatch.setattr("src.securities.hashing.password.hash_generator", hash_generator)
+
+    return hash_generator
+
+
+def build_account_repo(account: Account) -> tuple[AccountCRUDRepository, MagicMock]:
+    session = MagicMock(info=dict())
+    session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=account)))
+    session.commit = AsyncMock()
+
+    return AccountCRUDRepository(async_session=session), session
+
+
+def build_login() -> AccountInLogin:
+    return AccountInLogin(username="john", email=pydantic.EmailStr("john@example.com"), password=PASSWORD)
+
+
+def test_password_is_hashed_once_with_the_configured_cost(cheap_hash_generator: HashGenerator) -> None:
+    hashed_password = cheap_hash_generator.generate_password_hash(password=PASSWORD)
+
+    assert hashed_password.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+    assert cheap_hash_generator.is_password_verified(password=PASSWORD, hashed_password=hashed_password)
+    assert not cheap_hash_generator.is_password_hash_outdated(hashed_password=hashed_password)
+    assert cheap_hash_generator.is_password_hash_outdated(hashed_password=argon2.using(time_cost=2).hash(PASSWORD))
+
+
+async def test_legacy_two_layer_hash_is_upgraded_after_login(
+    cheap_hash_generator: HashGenerator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hash_salt = bcrypt.hash("salt")
+    hashed_password = argon2.hash(hash_salt + PASSWORD)
+    account = Account(id=1, username="john", email=pydantic.EmailStr("john@example.com"))
+    account.set_hash_salt(hash_salt=hash_salt)
+    account.set_hashed_password(hashed_password=hashed_password)
+    account_repo, session = build_account_repo(account=account)
+    job_runner = MagicMock()
+    monkeypatch.setattr("src.repository.crud.account.job_runner", job_runner)
+
+    assert (await account_repo.read_user_by_password_authentication(account_login=build_login())) is account
+
+    job_kwargs = job_runner.submit.call_args.kwargs
+    assert job_runner.submit.call_args.args == (AccountCRUDRepository.rehash_account_password,)
+    assert (job_kwargs["id"], job_kwargs["outdated_hashed_password"]) == (1, hashed_password)
+    assert PASSWORD not in job_kwargs.values()
+    assert cheap_hash_generator.is_password_verified(password=PASSWORD, hashed_password=job_kwargs["hashed_password"])
+    session.commit.assert_not_awaited()
+
+
+async def test_legacy_scheme_hash_is_upgraded_after_login(
+    cheap_hash_generator: HashGenerator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "HASHING_ALGORITHM_LAYER_2", "bcrypt")
+    hash_generator = HashGenerator()
+    monkeypatch.setattr("src.securities.hashing.password.hash_generator", hash_generator)
+    hash_salt = bcrypt.hash("salt")
+    hashed_password = bcrypt.hash(hash_salt + PASSWORD)
+    account = Account(id=1, username="john", email=pydantic.EmailStr("john@example.com"))
+    account.set_hash_salt(hash_salt=hash_salt)
+    account.set_hashed_password(hashed_password=hashed_password)
+    account_repo, _ = build_account_repo(account=account)
+    job_runner = MagicMock()
+    monkeypatch.setattr("src.repository.crud.account.job_runner", job_runner)
+
+    assert hash_generator.is_password_hash_outdated(hashed_password=hashed_password)
+    assert (await account_repo.read_user_by_password_authentication(account_login=build_login())) is account
+
+    rehashed_password = job_runner.submit.call_args.kwargs["hashed_password"]
+    assert rehashed_password.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+    assert not hash_generator.is_password_hash_outdated(hashed_password=rehashed_password)
+
+
+async def test_wrong_password_is_not_rehashed(
+    cheap_hash_generator: HashGenerator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hashed_password = argon2.using(time_cost=2).hash(PASSWORD)
+    account = Account(username="john", email=pydantic.EmailStr("john@example.com"))
+    account.set_hashed_password(hashed_password=hashed_password)
+    account_repo, session = build_account_repo(account=account)
+    job_runner = MagicMock()
+    monkeypatch.setattr("src.repository.crud.account.job_runner", job_runner)
+
+    with pytest.raises(PasswordDoesNotMatch):
+        await account_repo.read_user_by_password_authentication(
+            account_login=AccountInLogin(
+                username="john", email=pydantic.EmailStr("john@example.com"), password="wrong"
+            )
+        )
+
+    assert account.hashed_password == hashed_password
+    job_runner.submit.assert_not_called()
@@ -0,0 +1,109 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import sqlalchemy
+from passlib.hash import argon2, bcrypt
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.repository.database import async_db
+from src.securities.hashing.password import pwd_generator
+from src.utilities.jobs import job_runner, JobRunner
+
+
+async def test_failed_job_is_retried_with_backoff() -> None:
+    runner = JobRunner(worker_count=2, max_queue_size=10, max_retries=2, retry_backoff=0.001)
+    flaky_job = AsyncMock(side_effect=[RuntimeError("down"), None])
+    broken_job = AsyncMock(side_effect=RuntimeError("down"))
+    runner.start()
+
+    assert runner.submit(flaky_job, 1, key="value")
+    assert runner.submit(broken_job)
+    await runner.drain(timeout=1)
+
+    flaky_job.assert_awaited_with(1, key="value")
+    assert broken_job.await_count == 3
+    assert runner.metrics["completed"] == 1
+    assert runner.metrics["failed"] == 1
+    assert runner.metrics["retried"] == 3
+
+
+async def test_job_is_rejected_when_the_queue_is_full_or_the_runner_is_stopped() -> None:
+    runner = JobRunner(worker_count=1, max_queue_size=1, max_retries=0, retry_backoff=0)
+    release = asyncio.Event()
+
+    assert not runner.submit(release.wait)
+
+    runner.start()
+    assert runner.submit(release.wait)
+    await asyncio.sleep(0)
+    assert runner.submit(release.wait)
+    assert not runner.submit(release.wait)
+    assert runner.metrics["queue_depth"] == 1 and runner.metrics["in_flight"] == 1
+
+    release.set()
+    await runner.drain(timeout=1)
+
+    assert runner.metrics["completed"] == 2
+    assert runner.metrics["rejected"] == 2
+    assert runner.metrics["worker_count"] == 0
+
+
+async def test_starting_twice_keeps_the_running_workers() -> None:
+    runner = JobRunner(worker_count=2, max_queue_size=10, max_retries=0, retry_backoff=0)
+    runner.start()
+    runner.start()
+
+    assert runner.metrics["worker_count"] == 2
+
+    await runner.drain(timeout=1)
+
+
+async def test_drain_gives_up_on_jobs_after_the_timeout() -> None:
+    runner = JobRunner(worker_count=1, max_queue_size=10, max_retries=0, retry_backoff=0)
+    runner.start()
+    runner.submit(asyncio.sleep, 60)
+
+    await asyncio.wait_for(runner.drain(timeout=0.01), timeout=1)
+
+    assert not runner.is_running
+
+
+async def test_legacy_hash_is_upgraded_after_signin(async_client: httpx.AsyncClient) -> None:
+    username = uuid.uuid4().hex[:12]
+    account = {"username": username, "email": f"{username}@example.com", "password": "password"}
+    await async_client.post("/api/auth/signup", json=account)
+    hash_salt = bcrypt.hash("salt")
+
+    async with async_db.async_engine.begin() as connection:
+        await connection.execute(
+            sqlalchemy.update(table=Account)
+            .where(Account.username == username)
+            .values({Account._hash_salt: hash_salt, Account._hashed_password: argon2.hash(hash_salt + "password")})
+        )
+
+    assert (await async_client.post("/api/auth/signin", json=account)).status_code == 202
+    await job_runner.drain(timeout=10)
+
+    async with async_db.async_engine.connect() as connection:
+        row = (
+            await connection.execute(
+                sqlalchemy.select(Account._hash_salt, Account._hashed_password).where(Account.username == username)
+            )
+        ).one()
+
+    assert row[0] is None
+    assert pwd_generator.is_password_authenticated(hash_salt=None, password="password", hashed_password=row[1])
+    assert not pwd_generator.is_rehash_needed(hash_salt=None, hashed_password=row[1])
+
+
+async def test_job_metrics_are_reserved_to_admins(async_client: httpx.AsyncClient) -> None:
+    assert (await async_client.get("/api/jobs/metrics")).status_code == 403
+
+    response = await async_client.get("/api/jobs/metrics", headers={"X-API-Token": settings.API_TOKEN})
+
+    assert response.status_code == 200
+    assert response.json()["workerCount"] == settings.JOB_WORKERS
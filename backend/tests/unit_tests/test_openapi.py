@@ -0,0 +1,39 @@
+import fastapi
+import pydantic
+
+from src.config.openapi import compute_openapi_route_fingerprint
+
+
+def build_app(response_model: type[pydantic.BaseModel], max_limit: int) -> fastapi.FastAPI:
+    app = fastapi.FastAPI()
+
+    @app.get("/items", response_model=response_model)
+    async def read_items(limit: int = fastapi.Query(default=10, le=max_limit)) -> None:
+        return None
+
+    return app
+
+
+class ItemInResponse(pydantic.BaseModel):
+    name: str
+
+
+class DescribedItemInResponse(pydantic.BaseModel):
+    name: str
+    description: str | None = None
+
+
+def test_fingerprint_follows_the_models_and_the_parameters() -> None:
+    fingerprint = compute_openapi_route_fingerprint(
+        backend_app=build_app(response_model=ItemInResponse, max_limit=100)
+    )
+
+    assert fingerprint == compute_openapi_route_fingerprint(
+        backend_app=build_app(response_model=ItemInResponse, max_limit=100)
+    )
+    assert fingerprint != compute_openapi_route_fingerprint(
+        backend_app=build_app(response_model=DescribedItemInResponse, max_limit=100)
+    )
+    assert fingerprint != compute_openapi_route_fingerprint(
+        backend_app=build_app(response_model=ItemInResponse, max_limit=1000)
+    )
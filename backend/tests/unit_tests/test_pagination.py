@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.main import backend_app
+from src.models.db.author import Author
+from src.models.schemas.version import ResourceVersion
+from src.repository.count import CountCache
+from src.utilities.http.pagination import split_page
+
+AUTHORS_VERSION = ResourceVersion(identity="author:3:3:None", last_modified=None)
+
+
+def test_split_page_detects_the_next_page_from_the_extra_row() -> None:
+    assert split_page(rows=[1, 2, 3], limit=2) == ([1, 2], True)
+    assert split_page(rows=[1, 2], limit=2) == ([1, 2], False)
+    assert split_page(rows=[1, 2, 3], limit=None) == ([1, 2, 3], False)
+
+
+def test_count_cache_expires_and_stays_bounded() -> None:
+    count_cache = CountCache(ttl=60, max_entries=2)
+
+    count_cache.set(key=("book",), count=10)
+    count_cache.set(key=("book", "author_id:eq:1"), count=2)
+    count_cache.set(key=("author",), count=5)
+
+    assert count_cache.get(key=("book",)) is None
+    assert count_cache.get(key=("book", "author_id:eq:1")) == 2
+
+    with patch("src.repository.count.time.monotonic", return_value=float("inf")):
+        assert count_cache.get(key=("author",)) is None
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.count_authors", return_value=1200345)
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors_version", return_value=AUTHORS_VERSION)
+def test_list_page_carries_count_and_link_headers(_, mock_read_authors, mock_count_authors) -> None:
+    mock_read_authors.return_value = [Author(id=3, name="Author 3"), Author(id=4, name="Author 4"), Author(id=5)]
+
+    response = TestClient(backend_app).get("/api/authors", params={"limit": 2, "offset": 2, "count": "estimated"})
+
+    assert response.status_code == 200
+    assert [author["id"] for author in response.json()] == [3, 4]
+    assert response.headers["X-Total-Count"] == "1200345"
+    assert response.headers["X-Total-Count-Method"] == "estimated"
+    assert 'offset=4&limit=2>; rel="next"' in response.headers["Link"]
+    assert 'offset=0&limit=2>; rel="prev"' in response.headers["Link"]
+    mock_read_authors.assert_called_once_with(filters=[], sort=None, limit=3, offset=2)
+    mock_count_authors.assert_called_once_with(filters=[], method="estimated")
+
+
+def test_unknown_count_method_is_rejected() -> None:
+    assert TestClient(backend_app).get("/api/authors", params={"count": "approximate"}).status_code == 422
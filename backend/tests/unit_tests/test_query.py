@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from src.main import backend_app
+from src.models.db.account import Account
+from src.models.db.book import Book
+from src.models.schemas.version import ResourceVersion
+from src.repository.crud.account import AccountCRUDRepository
+from src.repository.crud.book import BookCRUDRepository
+from src.repository.query import apply_list_query
+from src.utilities.exceptions.database import InvalidQueryExpression
+
+
+def compile_list_query(table, filterable_fields, raw_filters=None, raw_sort=None) -> str:
+    stmt = apply_list_query(
+        stmt=sqlalchemy.select(table.id),
+        table=table,
+        filterable_fields=filterable_fields,
+        raw_filters=raw_filters,
+        raw_sort=raw_sort,
+    )
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_filters_are_compiled_into_typed_where_clauses() -> None:
+    sql = compile_list_query(
+        table=Book,
+        filterable_fields=BookCRUDRepository.filterable_fields,
+        raw_filters=["authorId:in:1|2", "created_at:gte:2023-01-01T00:00:00Z"],
+    )
+
+    assert "book.author_id IN (1, 2)" in sql
+    assert "book.created_at >= '2023-01-01 00:00:00+00:00'" in sql
+    assert sql.endswith("ORDER BY book.id ASC")
+
+
+def test_sort_on_partial_index_requires_its_predicate() -> None:
+    sql = compile_list_query(
+        table=Account,
+        filterable_fields=AccountCRUDRepository.filterable_fields,
+        raw_filters=["is_active:eq:true"],
+        raw_sort="-createdAt",
+    )
+
+    assert "WHERE account.is_active = true" in sql
+    assert sql.endswith("ORDER BY account.created_at DESC, account.id ASC")
+
+    with pytest.raises(InvalidQueryExpression):
+        compile_list_query(
+            table=Account, filterable_fields=AccountCRUDRepository.filterable_fields, raw_sort="created_at"
+        )
+
+
+@pytest.mark.parametrize(
+    "raw_filters, raw_sort",
+    [
+        (["_hashed_password:eq:secret"], None),
+        (["is_active:gt:true"], None),
+        (["is_active:eq:maybe"], None),
+        (["is_active"], None),
+        ([], "is_logged_in"),
+    ],
+)
+def test_invalid_or_unwhitelisted_expressions_are_rejected(raw_filters: list[str], raw_sort: str | None) -> None:
+    with pytest.raises(InvalidQueryExpression):
+        compile_list_query(
+            table=Account,
+            filterable_fields=AccountCRUDRepository.filterable_fields,
+            raw_filters=raw_filters,
+            raw_sort=raw_sort,
+        )
+
+
+@patch("src.repository.crud.book.BookCRUDRepository.read_books")
+@patch("src.repository.crud.book.BookCRUDRepository.read_books_version")
+def test_invalid_list_query_answers_bad_request(mock_read_books_version, mock_read_books) -> None:
+    mock_read_books_version.return_value = ResourceVersion(identity="book:0:None:None", last_modified=None)
+    mock_read_books.side_effect = InvalidQueryExpression("Sorting on `created_at` is not supported by an index!")
+
+    response = TestClient(backend_app).get("/api/books", params={"filter": "author_id:eq:1", "sort": "created_at"})
+
+    assert response.status_code == 400
+    assert "created_at" in response.json()["detail"]
+    mock_read_books.assert_called_once_with(filters=["author_id:eq:1"], sort="created_at", limit=None, offset=0)
@@ -0,0 +1,144 @@
+import gzip
+import pathlib
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.api.middlewares.response_cache import CachedResponse, ResponseCache
+from src.main import backend_app
+from src.models.db.author import Author
+from src.models.schemas.version import ResourceVersion
+from src.repository.changes import ChangeSet, ChangeWatermark
+from src.repository.shared_cache import SharedMemoryCache
+
+AUTHORS_VERSION = ResourceVersion(identity="author:1:1:None", last_modified=None)
+
+
+def build_cached_response(body: bytes) -> CachedResponse:
+    return CachedResponse(headers=[], body=body, gzip_body=None, expires_at=float("inf"))
+
+
+def test_response_cache_evicts_least_recently_used_entries_beyond_byte_budget() -> None:
+    cache = ResponseCache(max_bytes=20)
+
+    cache.set(key=("a",), tag="authors", generation=0, cached_response=build_cached_response(b"x" * 10))
+    cache.set(key=("b",), tag="books", generation=0, cached_response=build_cached_response(b"x" * 10))
+    cache.get(key=("a",))
+    cache.set(key=("c",), tag="books", generation=0, cached_response=build_cached_response(b"x" * 10))
+
+    assert cache.get(key=("a",)) is not None
+    assert cache.get(key=("b",)) is None
+    assert cache.size == 20
+
+
+def test_response_cache_rejects_responses_rendered_before_an_invalidation() -> None:
+    cache = ResponseCache(max_bytes=1024)
+    generation = cache.generation(tag="authors")
+
+    cache.invalidate(tag="authors")
+
+    assert not cache.set(key=("a",), tag="authors", generation=generation, cached_response=build_cached_response(b"x"))
+    assert cache.get(key=("a",)) is None
+
+
+def test_a_write_in_one_worker_invalidates_the_responses_of_the_others(tmp_path: pathlib.Path) -> None:
+    first_worker_cache, second_worker_cache = (
+        ResponseCache(
+            max_bytes=1024,
+            shared_generations=SharedMemoryCache(path=str(tmp_path / "cache"), slot_count=8, slot_size=256, ways=4),
+        )
+        for _ in range(2)
+    )
+    generation = second_worker_cache.generation(tag="authors")
+    second_worker_cache.set(
+        key=("a",), tag="authors", generation=generation, cached_response=build_cached_response(b"x")
+    )
+
+    first_worker_cache.invalidate(tag="authors")
+
+    assert second_worker_cache.get(key=("a",)) is None
+    assert not second_worker_cache.set(
+        key=("a",), tag="authors", generation=generation, cached_response=build_cached_response(b"x")
+    )
+    assert second_worker_cache.set(
+        key=("a",),
+        tag="authors",
+        generation=second_worker_cache.generation(tag="authors"),
+        cached_response=build_cached_response(b"x"),
+    )
+    assert second_worker_cache.get(key=("a",)) is not None
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.create_author")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors_version")
+def test_author_list_is_cached_until_an_author_is_written(
+    mock_read_authors_version, mock_read_authors, mock_create_author
+) -> None:
+    mock_read_authors_version.return_value = AUTHORS_VERSION
+    mock_read_authors.return_value = [Author(id=index, name=f"Author {index}") for index in range(100)]
+    mock_create_author.return_value = Author(id=100, name="John Doe")
+    test_client = TestClient(backend_app)
+
+    miss_response = test_client.get("/api/authors")
+    hit_response = test_client.get("/api/authors", headers={"Accept-Encoding": "gzip"})
+
+    assert miss_response.headers["x-response-cache"] == "miss"
+    assert miss_response.headers["cache-control"] == "public, no-cache"
+    assert hit_response.headers["x-response-cache"] == "hit"
+    assert hit_response.headers["cache-control"] == "public, no-cache"
+    assert hit_response.headers["vary"] == "Accept, Accept-Encoding"
+    assert hit_response.headers["content-encoding"] == "gzip"
+    assert hit_response.json() == miss_response.json()
+    assert mock_read_authors.call_count == 1
+
+    not_modified_response = test_client.get("/api/authors", headers={"If-None-Match": miss_response.headers["etag"]})
+
+    assert not_modified_response.status_code == 304
+    assert mock_read_authors_version.call_count == 1
+
+    test_client.post("/api/authors", json={"name": "John Doe"})
+
+    assert test_client.get("/api/authors").headers["x-response-cache"] == "miss"
+    assert mock_read_authors.call_count == 2
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors_version")
+def test_authorized_requests_bypass_the_response_cache(mock_read_authors_version, mock_read_authors) -> None:
+    mock_read_authors_version.return_value = AUTHORS_VERSION
+    mock_read_authors.return_value = [Author(id=1, name="Author 1")]
+    test_client = TestClient(backend_app)
+
+    for _ in range(2):
+        test_client.get("/api/authors", headers={"Authorization": "Bearer token"})
+
+    assert mock_read_authors.call_count == 2
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors")
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors_version")
+def test_response_cache_entries_are_kept_per_host(mock_read_authors_version, mock_read_authors) -> None:
+    mock_read_authors_version.return_value = AUTHORS_VERSION
+    mock_read_authors.return_value = [Author(id=1, name="Author 1")]
+    test_client = TestClient(backend_app)
+
+    test_client.get("/api/authors", headers={"Host": "a.example.com"})
+    other_host_response = test_client.get("/api/authors", headers={"Host": "b.example.com"})
+
+    assert other_host_response.headers["x-response-cache"] == "miss"
+    assert test_client.get("/api/authors", headers={"Host": "a.example.com"}).headers["x-response-cache"] == "hit"
+    assert mock_read_authors.call_count == 2
+
+
+@patch("src.repository.crud.author.AuthorCRUDRepository.read_authors_changes")
+def test_delta_feeds_bypass_the_response_cache(mock_read_authors_changes) -> None:
+    mock_read_authors_changes.return_value = ChangeSet(
+        upserted=[], deleted=[], watermark=ChangeWatermark(), has_more=False
+    )
+    test_client = TestClient(backend_app)
+
+    for _ in range(2):
+        assert "x-response-cache" not in test_client.get("/api/authors/changes").headers
+
+    assert mock_read_authors_changes.call_count == 2
@@ -0,0 +1,64 @@
+import pydantic
+import pytest
+
+from src.config.settings.base import BackendBaseSettings
+
+
+def test_db_pool_attributes_without_budget_keep_configured_pool() -> None:
+    backend_settings = BackendBaseSettings(DB_CONNECTION_BUDGET=0, DB_POOL_SIZE=100, DB_POOL_OVERFLOW=20)
+
+    assert backend_settings.set_db_pool_attributes == {"pool_size": 100, "max_overflow": 20}
+
+
+def test_db_pool_attributes_split_budget_across_workers() -> None:
+    backend_settings = BackendBaseSettings(
+        SERVER_WORKERS=4, DB_CONNECTION_BUDGET=80, DB_POOL_SIZE=100, DB_POOL_OVERFLOW=20
+    )
+    pool_attributes = backend_settings.set_db_pool_attributes
+
+    assert pool_attributes == {"pool_size": 16, "max_overflow": 4}
+    assert (pool_attributes["pool_size"] + pool_attributes["max_overflow"]) * 4 <= 80
+
+
+def test_db_pool_attributes_never_drop_below_one_connection() -> None:
+    backend_settings = BackendBaseSettings(
+        SERVER_WORKERS=8, DB_CONNECTION_BUDGET=8, DB_POOL_SIZE=10, DB_POOL_OVERFLOW=10
+    )
+
+    assert backend_settings.set_db_pool_attributes == {"pool_size": 1, "max_overflow": 0}
+
+
+def test_db_connection_budget_must_cover_every_worker() -> None:
+    with pytest.raises(pydantic.ValidationError, match="DB_CONNECTION_BUDGET"):
+        BackendBaseSettings(SERVER_WORKERS=8, DB_CONNECTION_BUDGET=4)
+
+
+def test_db_connect_args_set_timeouts_and_server_settings() -> None:
+    backend_settings = BackendBaseSettings(
+        DB_TIMEOUT=5, DB_COMMAND_TIMEOUT=12, DB_STATEMENT_TIMEOUT=10000, DB_PREPARED_STATEMENT_CACHE_SIZE=256
+    )
+
+    assert backend_settings.set_db_connect_args == {
+        "timeout": 5,
+        "command_timeout": 12,
+        "prepared_statement_cache_size": 256,
+        "server_settings": {"application_name": "backend", "jit": "off", "statement_timeout": "10000"},
+    }
+
+
+def test_db_statement_caches_and_startup_parameters_are_switched_off_for_pgbouncer() -> None:
+    backend_settings = BackendBaseSettings(IS_DB_PGBOUNCER_COMPATIBLE=True)
+    connect_args = backend_settings.set_db_connect_args
+
+    assert connect_args["prepared_statement_cache_size"] == connect_args["statement_cache_size"] == 0
+    assert connect_args["server_settings"] == {"application_name": "backend"}
+
+
+def test_sync_watermark_lag_must_cover_the_longest_transaction() -> None:
+    assert BackendBaseSettings(REQUEST_TIMEOUT=15, DB_STATEMENT_TIMEOUT=10000, SYNC_WATERMARK_LAG=15)
+
+    with pytest.raises(pydantic.ValidationError, match="SYNC_WATERMARK_LAG"):
+        BackendBaseSettings(REQUEST_TIMEOUT=15, DB_STATEMENT_TIMEOUT=10000, SYNC_WATERMARK_LAG=2)
+
+    with pytest.raises(pydantic.ValidationError, match="SYNC_WATERMARK_LAG"):
+        BackendBaseSettings(REQUEST_TIMEOUT=5, DB_STATEMENT_TIMEOUT=30000, SYNC_WATERMARK_LAG=20)
@@ -0,0 +1,129 @@
+import datetime
+import multiprocessing
+import pathlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.config.manager import settings
+from src.models.db.author import Author
+from src.repository.crud.author import AuthorCRUDRepository
+from src.repository.shared_cache import deserialize_row, hash_key, serialize_row, SharedMemoryCache, SLOT_HEADER
+from src.utilities.exceptions.database import EntityDoesNotExist
+
+
+def build_cache(path: pathlib.Path, slot_count: int = 64, ways: int = 4) -> SharedMemoryCache:
+    return SharedMemoryCache(path=str(path), slot_count=slot_count, slot_size=256, ways=ways)
+
+
+def write_from_another_process(path: str) -> None:
+    cache = build_cache(path=pathlib.Path(path))
+    cache.set(key="author:1", tag="authors", generation=cache.generation(tag="authors"), payload=b"from-child")
+
+
+def test_set_and_get_round_trip(tmp_path: pathlib.Path) -> None:
+    cache = build_cache(path=tmp_path / "cache")
+
+    assert cache.set(key="author:1", tag="authors", generation=0, payload=b"payload")
+    assert cache.get(key="author:1", tag="authors") == b"payload"
+    assert cache.get(key="author:2", tag="authors") is None
+    assert not cache.set(key="author:3", tag="authors", generation=0, payload=bytes(cache.capacity + 1))
+
+
+def test_invalidate_drops_entries_and_refuses_stale_writes(tmp_path: pathlib.Path) -> None:
+    cache = build_cache(path=tmp_path / "cache")
+    cache.set(key="author:1", tag="authors", generation=0, payload=b"payload")
+
+    cache.invalidate(tag="authors")
+
+    assert cache.get(key="author:1", tag="authors") is None
+    assert not cache.set(key="author:1", tag="authors", generation=0, payload=b"stale")
+    assert cache.set(key="author:1", tag="authors", generation=1, payload=b"fresh")
+    assert cache.get(key="author:1", tag="authors") == b"fresh"
+
+
+def test_full_set_evicts_the_least_recently_written_slot(tmp_path: pathlib.Path) -> None:
+    cache = build_cache(path=tmp_path / "cache", slot_count=2, ways=2)
+
+    for id in range(3):
+        cache.set(key=f"author:{id}", tag="authors", generation=0, payload=f"{id}".encode())
+
+    assert cache.get(key="author:0", tag="authors") is None
+    assert cache.get(key="author:1", tag="authors") == b"1"
+    assert cache.get(key="author:2", tag="authors") == b"2"
+    assert (tmp_path / "cache").stat().st_size == cache.size
+
+
+def test_half_written_slot_reads_as_miss(tmp_path: pathlib.Path) -> None:
+    cache = build_cache(path=tmp_path / "cache")
+    cache.set(key="author:1", tag="authors", generation=0, payload=b"payload")
+    offset = next(
+        offset
+        for offset in cache._slot_offsets(hash_key("author:1"))
+        if SLOT_HEADER.unpack_from(cache.buffer, offset)[1] == hash_key("author:1")
+    )
+
+    cache.buffer[offset + SLOT_HEADER.size] ^= 0xFF
+
+    assert cache.get(key="author:1", tag="authors") is None
+
+
+def test_corrupt_file_is_rebuilt(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "cache").write_bytes(b"garbage" * 100)
+    cache = build_cache(path=tmp_path / "cache")
+
+    assert cache.get(key="author:1", tag="authors") is None
+    assert cache.set(key="author:1", tag="authors", generation=0, payload=b"payload")
+    assert build_cache(path=tmp_path / "cache").get(key="author:1", tag="authors") == b"payload"
+
+
+def test_entries_are_shared_across_processes(tmp_path: pathlib.Path) -> None:
+    cache = build_cache(path=tmp_path / "cache")
+    cache.generation(tag="authors")
+
+    process = multiprocessing.get_context("fork").Process(
+        target=write_from_another_process, args=(str(tmp_path / "cache"),)
+    )
+    process.start()
+    process.join(timeout=10)
+
+    assert process.exitcode == 0
+    assert cache.get(key="author:1", tag="authors") == b"from-child"
+
+
+def test_row_serialization_round_trip() -> None:
+    author = Author(id=1, name="John Doe", created_at=datetime.datetime.now(datetime.timezone.utc), updated_at=None)
+
+    restored = deserialize_row(table=Author, payload=serialize_row(row=author))
+
+    assert (restored.id, restored.name, restored.updated_at) == (1, "John Doe", None)
+    assert restored.created_at == author.created_at
+
+
+async def test_repository_reads_through_the_shared_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "IS_SHARED_CACHE_ENABLED", True)
+    monkeypatch.setattr("src.repository.crud.base.shared_cache", build_cache(path=tmp_path / "cache"))
+    author = Author(id=1, name="John Doe", created_at=datetime.datetime.now(datetime.timezone.utc), updated_at=None)
+    session = MagicMock(info=dict())
+    session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=author)))
+    author_repo = AuthorCRUDRepository(async_session=session)
+
+    assert (await author_repo.read_author_by_id(id=1)) is author
+    assert (await author_repo.read_author_by_id(id=1)).name == "John Doe"
+    assert session.execute.await_count == 1
+
+    author_repo._invalidate_shared_cache(table=Author)
+
+    await author_repo.read_author_by_id(id=1)
+    assert session.execute.await_count == 2
+
+
+async def test_repository_raises_when_the_row_does_not_exist(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "IS_SHARED_CACHE_ENABLED", False)
+    session = MagicMock(info=dict())
+    session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=None)))
+
+    with pytest.raises(EntityDoesNotExist):
+        await AuthorCRUDRepository(async_session=session).read_author_by_id(id=1)
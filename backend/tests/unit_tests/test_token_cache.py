@@ -0,0 +1,121 @@
+import time
+from unittest.mock import AsyncMock, patch
+
+import fastapi
+import pydantic
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.dependencies.authentication import get_current_account
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.models.schemas.jwt import JWTAccount
+from src.repository.revocations import token_revocations, TokenRevocations
+from src.securities.authorizations.jwt import jwt_generator
+from src.securities.authorizations.token_cache import hash_token, verified_token_cache, VerifiedTokenCache
+
+JWT_ACCOUNT: JWTAccount = JWTAccount(username="john", email=pydantic.EmailStr("john@example.com"))
+
+
+@pytest.fixture(name="authenticated_client")
+def authenticated_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setattr("src.api.dependencies.authentication.token_revocations.synchronize", AsyncMock())
+    app = fastapi.FastAPI()
+
+    @app.get("/me")
+    async def me(jwt_account: JWTAccount = fastapi.Depends(get_current_account)) -> dict[str, str]:
+        return jwt_account.dict()
+
+    return TestClient(app)
+
+
+def build_authorization(token: str) -> dict[str, str]:
+    return {"Authorization": f"{settings.JWT_TOKEN_PREFIX} {token}"}
+
+
+def test_entries_expire_with_their_token() -> None:
+    cache = VerifiedTokenCache(max_entries=8)
+    cache.set(digest=hash_token(token="fresh"), jwt_account=JWT_ACCOUNT, expires_at=time.time() + 60)
+    cache.set(digest=hash_token(token="expired"), jwt_account=JWT_ACCOUNT, expires_at=time.time() - 1)
+
+    assert cache.get(digest=hash_token(token="fresh")) == JWT_ACCOUNT
+    assert cache.get(digest=hash_token(token="expired")) is None
+    assert cache.get(digest=hash_token(token="unknown")) is None
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = VerifiedTokenCache(max_entries=2)
+    expires_at = time.time() + 60
+    cache.set(digest=hash_token(token="first"), jwt_account=JWT_ACCOUNT, expires_at=expires_at)
+    cache.set(digest=hash_token(token="second"), jwt_account=JWT_ACCOUNT, expires_at=expires_at)
+    cache.get(digest=hash_token(token="first"))
+
+    cache.set(digest=hash_token(token="third"), jwt_account=JWT_ACCOUNT, expires_at=expires_at)
+
+    assert cache.get(digest=hash_token(token="first")) == JWT_ACCOUNT
+    assert cache.get(digest=hash_token(token="second")) is None
+    assert cache.get(digest=hash_token(token="third")) == JWT_ACCOUNT
+
+
+def test_revoked_tokens_are_dropped_and_forgotten_after_expiry() -> None:
+    cache = VerifiedTokenCache(max_entries=8)
+    cache.set(digest=hash_token(token="token"), jwt_account=JWT_ACCOUNT, expires_at=time.time() + 60)
+
+    cache.revoke(digest=hash_token(token="token"), expires_at=time.time() + 60)
+    cache.revoke(digest=hash_token(token="expired"), expires_at=time.time() - 1)
+
+    assert cache.get(digest=hash_token(token="token")) is None
+    assert cache.is_revoked(digest=hash_token(token="token"))
+    assert not cache.is_revoked(digest=hash_token(token="expired"))
+
+
+def test_revocations_read_twice_are_kept_once() -> None:
+    cache = VerifiedTokenCache(max_entries=8)
+
+    for _ in range(3):
+        cache.revoke(digest=hash_token(token="token"), expires_at=time.time() + 60)
+    cache.revoke(digest=hash_token(token="expiring"), expires_at=time.time() + 0.01)
+    time.sleep(0.02)
+    cache.revoke(digest=hash_token(token="other"), expires_at=time.time() + 60)
+
+    assert cache.is_revoked(digest=hash_token(token="token"))
+    assert not cache.is_revoked(digest=hash_token(token="expiring"))
+    assert len(cache._revoked_expiries) == len(cache._revoked) == 2
+
+
+def test_current_account_is_verified_once_per_token(authenticated_client: TestClient) -> None:
+    token = jwt_generator.generate_access_token(account=Account(username="john", email="john@example.com"))
+
+    with patch.object(
+        jwt_generator, "retrieve_account_from_token", wraps=jwt_generator.retrieve_account_from_token
+    ) as retrieve_account_from_token:
+        responses = [authenticated_client.get("/me", headers=build_authorization(token=token)) for _ in range(3)]
+
+    assert [response.json() for response in responses] == [JWT_ACCOUNT.dict()] * 3
+    assert retrieve_account_from_token.call_count == 1
+
+
+def test_missing_invalid_and_revoked_tokens_are_rejected(authenticated_client: TestClient) -> None:
+    token = jwt_generator.generate_access_token(account=Account(username="john", email="john@example.com"))
+    assert authenticated_client.get("/me", headers=build_authorization(token=token)).status_code == 200
+
+    verified_token_cache.revoke(digest=hash_token(token=token), expires_at=time.time() + 60)
+
+    assert authenticated_client.get("/me").status_code == 401
+    assert authenticated_client.get("/me", headers={"Authorization": token}).status_code == 401
+    assert authenticated_client.get("/me", headers=build_authorization(token="not-a-token")).status_code == 401
+    assert authenticated_client.get("/me", headers=build_authorization(token=token)).status_code == 401
+
+
+async def test_revocations_reach_the_other_workers(initialize_backend_test_application: fastapi.FastAPI) -> None:
+    token = jwt_generator.generate_access_token(account=Account(username="john", email="john@example.com"))
+    digest = hash_token(token=token)
+    other_worker = TokenRevocations(sync_interval=0, sync_lag=settings.SYNC_WATERMARK_LAG)
+    await other_worker.synchronize()
+
+    await token_revocations.revoke(digest=digest, expires_at=time.time() + 60)
+    # The other worker's cache has never heard of the revocation until it reads the table again.
+    verified_token_cache.clear()
+    await other_worker.synchronize()
+
+    assert verified_token_cache.is_revoked(digest=digest)
@@ -0,0 +1,65 @@
+import fastapi
+import pytest
+import sqlalchemy
+from fastapi.testclient import TestClient
+
+from src.api.dependencies.repository import get_repository
+from src.config.events import execute_backend_server_event_handler, terminate_backend_server_event_handler
+from src.models.db.author import Author
+from src.models.schemas.author import AuthorInCreate
+from src.repository.crud.author import AuthorCRUDRepository
+from src.repository.database import async_db
+
+
+@pytest.fixture(name="unit_of_work_client")
+def unit_of_work_client() -> TestClient:  # type: ignore
+    app = fastapi.FastAPI()
+    app.add_event_handler("startup", execute_backend_server_event_handler(backend_app=app))
+    app.add_event_handler("shutdown", terminate_backend_server_event_handler(backend_app=app))
+
+    @app.get("/read-only")
+    async def read_only(
+        author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
+    ) -> dict[str, str]:
+        query = await author_repo.async_session.execute(sqlalchemy.text("SHOW transaction_read_only"))
+        return {"transaction_read_only": query.scalar_one()}
+
+    @app.post("/authors/{name}")
+    async def create_authors(
+        name: str,
+        fail: bool = False,
+        author_repo: AuthorCRUDRepository = fastapi.Depends(get_repository(repo_type=AuthorCRUDRepository)),
+    ) -> dict[str, int]:
+        first_author = await author_repo.create_author(author_create=AuthorInCreate(name=f"{name}-1"))
+        second_author = await author_repo.create_author(author_create=AuthorInCreate(name=f"{name}-2"))
+
+        if fail:
+            raise fastapi.HTTPException(status_code=409)
+
+        return {"first_id": first_author.id, "second_id": second_author.id}
+
+    with TestClient(app) as client:
+        yield client
+
+
+async def count_authors_named(prefix: str) -> int:
+    async with async_db.async_session_factory() as session:
+        query = await session.execute(
+            sqlalchemy.select(sqlalchemy.func.count()).where(Author.name.like(f"{prefix}-%"))
+        )
+        return query.scalar_one()
+
+
+def test_get_routes_run_in_a_read_only_transaction(unit_of_work_client: TestClient) -> None:
+    assert unit_of_work_client.get("/read-only").json() == {"transaction_read_only": "on"}
+    assert unit_of_work_client.post("/authors/writable").status_code == 200
+
+
+def test_writes_of_a_request_commit_or_roll_back_together(unit_of_work_client: TestClient) -> None:
+    committed_response = unit_of_work_client.post("/authors/committed")
+    rolled_back_response = unit_of_work_client.post("/authors/rolled-back", params={"fail": True})
+
+    assert committed_response.json()["second_id"] == committed_response.json()["first_id"] + 1
+    assert rolled_back_response.status_code == 409
+    assert unit_of_work_client.portal.call(count_authors_named, "committed") == 2  # type: ignore
+    assert unit_of_work_client.portal.call(count_authors_named, "rolled-back") == 0  # type: ignore
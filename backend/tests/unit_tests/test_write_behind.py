@@ -0,0 +1,107 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+import sqlalchemy
+
+from src.config.manager import settings
+from src.models.db.account import Account
+from src.repository.database import async_db
+from src.repository.write_behind import login_state_queue, LoginStateQueue
+
+
+async def read_login_state(username: str) -> tuple:
+    async with async_db.async_session_factory() as session:
+        query = await session.execute(
+            sqlalchemy.select(Account.is_logged_in, Account.last_login_at).where(Account.username == username)
+        )
+        return tuple(query.one())
+
+
+async def read_account_id(username: str) -> int:
+    async with async_db.async_session_factory() as session:
+        query = await session.execute(sqlalchemy.select(Account.id).where(Account.username == username))
+        return query.scalar_one()
+
+
+async def test_changes_are_coalesced_into_one_timed_flush() -> None:
+    queue = LoginStateQueue(flush_interval=0.01, max_pending=100)
+    queue._flush = AsyncMock()  # type: ignore
+
+    queue.record_signin(account_id=1)
+    queue.record_signout(account_id=1)
+    queue.record_signin(account_id=2)
+    await asyncio.sleep(0.05)
+
+    batch = queue._flush.await_args.kwargs["batch"]  # type: ignore
+    assert queue._flush.await_count == 1  # type: ignore
+    assert batch[1][0] is False and batch[1][1] is not None and batch[1][2] > batch[1][1]
+    assert batch[2][0] is True
+    assert queue.pending_count == 0
+
+
+async def test_full_queue_flushes_right_away() -> None:
+    queue = LoginStateQueue(flush_interval=60, max_pending=2)
+    queue._flush = AsyncMock()  # type: ignore
+
+    queue.record_signin(account_id=1)
+    queue.record_signin(account_id=2)
+    await queue.drain()
+
+    assert queue._flush.await_count == 1  # type: ignore
+
+
+async def test_drain_retries_a_failed_batch_inline_and_then_drops_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = MagicMock()
+    engine.begin = MagicMock(side_effect=OSError("database is gone"))
+    monkeypatch.setattr("src.repository.write_behind.async_db", MagicMock(async_engine=engine))
+    queue = LoginStateQueue(flush_interval=60, max_pending=100, drain_attempts=2)
+
+    queue.record_signin(account_id=1)
+    await queue.drain()
+
+    assert engine.begin.call_count == 2
+    assert queue.pending_count == 0
+    assert queue._timer is None
+
+
+async def test_signin_and_signout_are_written_behind(async_client: httpx.AsyncClient) -> None:
+    username = uuid.uuid4().hex[:12]
+    account = {"username": username, "email": f"{username}@example.com", "password": "password"}
+    await async_client.post("/api/auth/signup", json=account)
+
+    access_token = (await async_client.post("/api/auth/signin", json=account)).json()["authorizedAccount"]["token"]
+    await login_state_queue.drain()
+    is_logged_in, last_login_at = await read_login_state(username=username)
+
+    assert is_logged_in and last_login_at is not None
+
+    headers = {"Authorization": f"{settings.JWT_TOKEN_PREFIX} {access_token}"}
+    assert (await async_client.post("/api/auth/signout", headers=headers)).status_code == 204
+    await login_state_queue.drain()
+
+    assert await read_login_state(username=username) == (False, last_login_at)
+    assert (await async_client.post("/api/auth/signout", headers=headers)).status_code == 401
+
+
+async def test_an_older_change_never_overwrites_a_newer_one(async_client: httpx.AsyncClient) -> None:
+    username = uuid.uuid4().hex[:12]
+    account = {"username": username, "email": f"{username}@example.com", "password": "password"}
+    await async_client.post("/api/auth/signup", json=account)
+    account_id = await read_account_id(username=username)
+    _, signup_at = await read_login_state(username=username)
+    # Two workers: the first records a signin, the second a later signout and flushes it first.
+    first_worker = LoginStateQueue(flush_interval=60, max_pending=100)
+    second_worker = LoginStateQueue(flush_interval=60, max_pending=100)
+
+    first_worker.record_signin(account_id=account_id)
+    second_worker.record_signout(account_id=account_id)
+    await second_worker.drain()
+    await first_worker.drain()
+    is_logged_in, last_login_at = await read_login_state(username=username)
+
+    # The signin's `last_login_at` is still kept, only its `is_logged_in` is older than the signout's.
+    assert not is_logged_in
+    assert last_login_at > signup_at